@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dashboard MVP Ao Vivo
+
+Sobe um servidor local que entrega o dashboard MVP e envia as novas amostras
+por Server-Sent Events, sem recarregar a página. Por padrão os dados vêm do
+simulador de métricas (nenhum equipamento real é necessário).
+
+Uso:
+    python src/ao_vivo.py [--porta 8050] [--intervalo 1] [--semente 42]
+    Abrir: http://127.0.0.1:8050/
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from comum.ao_vivo import ServidorAoVivo  # noqa: E402
+from comum.build import carregar_modulo  # noqa: E402
+from comum.simulador import SimuladorMetricas  # noqa: E402
+
+SCRIPT_MVP = Path(__file__).resolve().parent / 'basico' / '04_dashboard_mvp.py'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Servidor ao vivo do dashboard MVP.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8050)
+    parser.add_argument('--intervalo', type=float, default=1.0,
+                        help='segundos entre amostras (padrão: 1)')
+    parser.add_argument('--semente', type=int, default=None,
+                        help='semente do simulador (sequência reprodutível)')
+    args = parser.parse_args(argv)
+
+    mvp = carregar_modulo(SCRIPT_MVP)
+    fonte = SimuladorMetricas.a_partir_do_modulo(mvp, historico=mvp.LARGURA_TRAFEGO_PX,
+                                                 semente=args.semente)
+    servidor = ServidorAoVivo(mvp.construir_figura, fonte, intervalo=args.intervalo,
+                              host=args.host, porta=args.porta,
+                              max_pontos=mvp.LARGURA_TRAFEGO_PX)
+
+    print(f"🌐 Dashboard ao vivo em http://{args.host}:{args.porta}/ (Ctrl+C para sair)")
+    try:
+        asyncio.run(servidor.servir_para_sempre())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
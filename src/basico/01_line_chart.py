@@ -10,41 +10,56 @@ Autor: Alexandre Cancilieri
 Data: 2025-10-11
 """
 
+import sys
+from pathlib import Path
+
 import plotly.graph_objects as go  
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from comum.saida import salvar_html  # noqa: E402
+from comum.traces import trace_linha  # noqa: E402
+
+SAIDA = '01_line_chart.html'
+
 # Dados
 semanas = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
 labs_completos = [2, 5, 8, 12, 15, 20, 24, 28, 32, 38, 45, 52]
 
-# Criar gráfico
-fig = go.Figure()
-
-fig.add_trace(go.Scatter(
-    x=semanas,                           
-    y=labs_completos,                    
-    mode='lines+markers',                
-    name='Labs Completos',               
-    line=dict(
-        color='#667eea',               
-        width=3                          
-    ),
-    marker=dict(
-        size=10,                         
-        color='#667eea'                
+
+def construir_figura(semanas=semanas, labs_completos=labs_completos):
+    """Monta a figura do progresso semanal (por padrão, com os dados acima)."""
+    fig = go.Figure()
+
+    # trace_linha() usa go.Scattergl (WebGL) quando a série é grande
+    fig.add_trace(trace_linha(
+        semanas,                           
+        labs_completos,                    
+        mode='lines+markers',                
+        name='Labs Completos',               
+        line=dict(
+            color='#667eea',               
+            width=3                          
+        ),
+        marker=dict(
+            size=10,                         
+            color='#667eea'                
+        )
+    ))
+
+    # Configurar layout
+    fig.update_layout(
+        title='Progresso de Labs CCNP - 12 Semanas',   
+        xaxis_title='Semana',                          
+        yaxis_title='Total de Labs Completos',         
+        hovermode='x unified',                         
+        template='plotly_white',                       
+        height=500                                     
     )
-))
-
-# Configurar layout
-fig.update_layout(
-    title='Progresso de Labs CCNP - 12 Semanas',   
-    xaxis_title='Semana',                          
-    yaxis_title='Total de Labs Completos',         
-    hovermode='x unified',                         
-    template='plotly_white',                       
-    height=500                                     
-)
-
-# Exportar
-fig.write_html('../../docs/01_line_chart.html')
-
-print("✅ Gráfico salvo em: docs/01_line_chart.html")
\ No newline at end of file
+    return fig
+
+
+if __name__ == '__main__':
+    # Exportar
+    salvar_html(construir_figura(), SAIDA)
+
+    print("✅ Gráfico salvo em: docs/01_line_chart.html")
@@ -16,6 +16,12 @@ Data: 2025-10-11
 
 import plotly.graph_objects as go  # Biblioteca para gráficos interativos
 
+# Permite importar o pacote src/comum/ (um nível acima desta pasta)
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from comum.saida import salvar_html  # noqa: E402  Exportação padronizada para docs/
+
 # ============================================================================
 # DADOS DO GRÁFICO
 # ============================================================================
@@ -77,8 +83,10 @@ fig.update_layout(
 # ============================================================================
 
 # write_html() salva o gráfico como página web interativa
-# Pode abrir no navegador e interagir (zoom, hover, etc)
-fig.write_html('../../docs/01_line_chart.html')
+# salvar_html() chama write_html() apontando para docs/ e, por padrão,
+# referencia um único plotly.js compartilhado (baixado uma vez pelo navegador)
+# em vez de embutir ~3.5 MB da biblioteca em cada página
+salvar_html(fig, '01_line_chart.html')
 
 # Mensagem de confirmação no terminal
 print("✅ Gráfico salvo em: docs/01_line_chart.html")
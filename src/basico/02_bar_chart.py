@@ -8,8 +8,16 @@ Autor: Alexandre Lavorenti Cancilieri
 Data: 2025-10-12
 """
 
+import sys
+from pathlib import Path
+
 import plotly.graph_objects as go
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from comum.saida import salvar_html  # noqa: E402
+
+SAIDA = '02_bar_chart.html'
+
 # Dados dos domínios CCNP ENCOR
 dominios = [
     'Architecture',
@@ -26,33 +34,39 @@ peso_prova = [30, 10, 30, 10, 20, 15]  # Peso % na prova ENCOR
 # Cores por domínio
 cores = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#43e97b', '#fa709a']
 
-# Criar gráfico
-fig = go.Figure()
-
-# Adicionar barras
-fig.add_trace(go.Bar(
-    x=dominios,
-    y=labs_completos,
-    marker=dict(
-        color=cores,
-        line=dict(color='white', width=2)
-    ),
-    text=labs_completos,
-    textposition='outside',
-    hovertemplate='<b>%{x}</b><br>Labs: %{y}<extra></extra>'
-))
-
-# Configurar layout
-fig.update_layout(
-    title='Labs por Domínio CCNP ENCOR',
-    xaxis_title='Domínio',
-    yaxis_title='Número de Labs',
-    template='plotly_white',
-    height=500,
-    showlegend=False,
-    yaxis=dict(range=[0, max(labs_completos) + 5])
-)
-
-# Exportar
-fig.write_html('../../docs/02_bar_chart.html')
-print("✅ Gráfico salvo em: docs/02_bar_chart.html")
\ No newline at end of file
+
+def construir_figura(dominios=dominios, labs_completos=labs_completos, cores=cores):
+    """Monta a figura de labs por domínio (por padrão, com os dados acima)."""
+    # Criar gráfico
+    fig = go.Figure()
+
+    # Adicionar barras
+    fig.add_trace(go.Bar(
+        x=dominios,
+        y=labs_completos,
+        marker=dict(
+            color=cores,
+            line=dict(color='white', width=2)
+        ),
+        text=labs_completos,
+        textposition='outside',
+        hovertemplate='<b>%{x}</b><br>Labs: %{y}<extra></extra>'
+    ))
+
+    # Configurar layout
+    fig.update_layout(
+        title='Labs por Domínio CCNP ENCOR',
+        xaxis_title='Domínio',
+        yaxis_title='Número de Labs',
+        template='plotly_white',
+        height=500,
+        showlegend=False,
+        yaxis=dict(range=[0, max(labs_completos) + 5])
+    )
+    return fig
+
+
+if __name__ == '__main__':
+    # Exportar
+    salvar_html(construir_figura(), SAIDA)
+    print("✅ Gráfico salvo em: docs/02_bar_chart.html")
@@ -8,8 +8,16 @@ Autor: Alexandre Lavorenti Cancilieri
 Data: 2025-10-12
 """
 
+import sys
+from pathlib import Path
+
 import plotly.graph_objects as go
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from comum.saida import salvar_html  # noqa: E402
+
+SAIDA = '03_pie_chart.html'
+
 # Dados das categorias
 categorias = [
     'QoS',
@@ -25,47 +33,52 @@ quantidade = [24, 4, 21, 4, 18, 8]
 # Cores por categoria
 cores = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#43e97b', '#fa709a']
 
-# Criar gráfico
-fig = go.Figure()
 
-# Adicionar pizza (donut)
-fig.add_trace(go.Pie(
-    labels=categorias,
-    values=quantidade,
-    marker=dict(
-        colors=cores,
-        line=dict(color='white', width=2)
-    ),
-    hole=0.4,  # Tamanho do buraco (0 = pizza cheia, 0.4 = donut)
-    textposition='auto',
-    textinfo='label+percent',
-    hovertemplate='<b>%{label}</b><br>Labs: %{value}<br>Percentual: %{percent}<extra></extra>'
-))
+def construir_figura(categorias=categorias, quantidade=quantidade, cores=cores):
+    """Monta a figura de distribuição por categoria (por padrão, com os dados acima)."""
+    fig = go.Figure()
+
+    # Adicionar pizza (donut)
+    fig.add_trace(go.Pie(
+        labels=categorias,
+        values=quantidade,
+        marker=dict(
+            colors=cores,
+            line=dict(color='white', width=2)
+        ),
+        hole=0.4,  # Tamanho do buraco (0 = pizza cheia, 0.4 = donut)
+        textposition='auto',
+        textinfo='label+percent',
+        hovertemplate='<b>%{label}</b><br>Labs: %{value}<br>Percentual: %{percent}<extra></extra>'
+    ))
+
+    # Configurar layout
+    fig.update_layout(
+        title='Distribuição de Labs por Categoria',
+        template='plotly_white',
+        height=500,
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.05
+        )
+    )
 
-# Configurar layout
-fig.update_layout(
-    title='Distribuição de Labs por Categoria',
-    template='plotly_white',
-    height=500,
-    showlegend=True,
-    legend=dict(
-        orientation="v",
-        yanchor="middle",
+    # Adicionar anotação no centro do donut
+    fig.add_annotation(
+        text=f'<b>{sum(quantidade)}</b><br>Labs<br>Total',
+        x=0.5,
         y=0.5,
-        xanchor="left",
-        x=1.05
+        font=dict(size=20, color='#667eea'),
+        showarrow=False
     )
-)
+    return fig
 
-# Adicionar anotação no centro do donut
-fig.add_annotation(
-    text=f'<b>{sum(quantidade)}</b><br>Labs<br>Total',
-    x=0.5,
-    y=0.5,
-    font=dict(size=20, color='#667eea'),
-    showarrow=False
-)
 
-# Exportar
-fig.write_html('../../docs/03_pie_chart.html')
-print("✅ Gráfico salvo em: docs/03_pie_chart.html")
\ No newline at end of file
+if __name__ == '__main__':
+    # Exportar
+    salvar_html(construir_figura(), SAIDA)
+    print("✅ Gráfico salvo em: docs/03_pie_chart.html")
@@ -6,14 +6,33 @@ Autor: Alexandre Lavorenti Cancilieri
 Data: 2025-10-19
 """
 
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import sys
+from pathlib import Path
+
 from datetime import datetime, timedelta
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from comum.esqueleto import Esqueleto  # noqa: E402
+from comum.figura import FiguraDict  # noqa: E402
+from comum.instrumentacao import etapa  # noqa: E402
+from comum.limiares import FAIXAS_CPU, classificar, escala_marcador  # noqa: E402
+from comum.ranking import painel_interfaces  # noqa: E402
+from comum.reducao import reduzir_serie  # noqa: E402
+from comum.saida import salvar_html  # noqa: E402
+from comum.traces import dict_linha  # noqa: E402
+
+SAIDA = '04_dashboard_mvp.html'
+
+# Largura útil (px) do painel de tráfego: séries maiores são reduzidas com LTTB
+LARGURA_TRAFEGO_PX = 800
+
 # --- Dados simulados ---
 
-# Tráfego de rede (24 horas)
-horas = [(datetime.now() - timedelta(hours=i)).strftime('%H:%M') for i in range(23, -1, -1)]
+# Tráfego de rede (24 horas), em horas cheias: a série só muda a cada hora e
+# rebuilds sem mudança nos dados não regravam a página (segundos só nas
+# amostras do servidor ao vivo)
+hora_cheia = datetime.now().replace(minute=0, second=0, microsecond=0)
+horas = [(hora_cheia - timedelta(hours=i)).strftime('%H:%M') for i in range(23, -1, -1)]
 trafego_mbps = [120, 135, 145, 150, 160, 155, 170, 180, 190, 185,
                 200, 210, 220, 230, 240, 235, 225, 215, 205, 195,
                 180, 170, 150, 140]
@@ -32,129 +51,217 @@ num_dispositivos = [150, 80, 120, 35, 15]
 dispositivos = ['RTR-CORE-01', 'RTR-EDGE-01', 'SW-CORE-01', 'FW-01', 'SW-DIST-01']
 cpu_percent = [45, 68, 32, 75, 28]
 
-# --- Criação dos subplots ---
-fig = make_subplots(
-    rows=2, cols=2,
-    subplot_titles=(
-        '📊 Tráfego de Rede - Últimas 24h',
-        '🔌 Status de Interfaces por Switch',
-        '🌐 Distribuição de Dispositivos por VLAN',
-        '💻 Utilização de CPU - Dispositivos Críticos'
-    ),
-    specs=[[{'type': 'xy'}, {'type': 'xy'}],
-           [{'type': 'xy'}, {'type': 'xy'}]],  # <-- todos "xy" (nada de domain)
-    vertical_spacing=0.15,
-    horizontal_spacing=0.25
-)
-
-# --- Gráfico 1: Linha de tráfego ---
-fig.add_trace(
-    go.Scatter(
-        x=horas,
-        y=trafego_mbps,
-        mode='lines+markers',
-        name='Tráfego (Mbps)',
-        line=dict(color='#00CC96', width=3),
-        marker=dict(size=6),
-        fill='tozeroy',
-        fillcolor='rgba(0,204,150,0.2)'
-    ),
-    row=1, col=1
-)
-
-# --- Gráfico 2: Barras de interfaces ---
-fig.add_trace(
-    go.Bar(
-        x=switches,
-        y=interfaces_up,
-        name='UP',
-        marker_color='#00CC96',
-        text=interfaces_up,
-        textposition='inside'
-    ),
-    row=1, col=2
-)
-
-fig.add_trace(
-    go.Bar(
-        x=switches,
-        y=interfaces_down,
-        name='DOWN',
-        marker_color='#EF553B',
-        text=interfaces_down,
-        textposition='inside'
-    ),
-    row=1, col=2
-)
-
-# --- Gráfico 3: Pizza manual (posicionada via domain) ---
-fig.add_trace(
-    go.Pie(
-        labels=vlans,
-        values=num_dispositivos,
-        hole=0.4,
-        name="Distribuição VLANs",
-        marker=dict(colors=['#636EFA', '#00CC96', '#AB63FA', '#FFA15A', '#19D3F3']),
-        textinfo='label+percent'
-    )
-)
-
-# Define a posição da pizza no quadrante inferior esquerdo
-fig.update_traces(domain=dict(x=[0, 0.45], y=[0, 0.4]), selector=dict(type='pie'))
-
-# --- Gráfico 4: Barras horizontais de CPU ---
-cores_cpu = ['#00CC96' if cpu < 50 else '#FFA15A' if cpu < 70 else '#EF553B'
-             for cpu in cpu_percent]
-
-fig.add_trace(
-    go.Bar(
-        x=cpu_percent,
-        y=dispositivos,
-        orientation='h',
-        marker=dict(color=cores_cpu),
-        text=[f'{cpu}%' for cpu in cpu_percent],
-        textposition='outside',
-        showlegend=False
-    ),
-    row=2, col=2
-)
-
-# --- Ajuste de eixos ---
-fig.update_xaxes(title_text="Hora", row=1, col=1)
-fig.update_yaxes(title_text="Mbps", range=[0, 260], row=1, col=1)
-
-fig.update_xaxes(title_text="Switches", row=1, col=2)
-fig.update_yaxes(title_text="Interfaces", range=[0, 60], row=1, col=2)
-
-fig.update_xaxes(title_text="CPU (%)", range=[0, 100], row=2, col=2)
-fig.update_yaxes(title_text="", row=2, col=2)
-
-# --- Layout ---
-fig.update_layout(
-    title_text='🌐 Dashboard de Monitoramento de Rede - MVP',
-    title_x=0.5,
-    title_font=dict(size=26, color='#2C3E50'),
-    showlegend=True,
-    height=950,
-    plot_bgcolor='#F8F9FA',
-    paper_bgcolor='white',
-    font=dict(family="Arial", size=12),
-    barmode='group',
-    annotations=[
-        dict(
-            text=f'Atualizado em: {datetime.now().strftime("%d/%m/%Y às %H:%M:%S")}',
+
+def preparar_dados(horas, trafego_mbps, cpu_percent):
+    """Séries derivadas dos dados: tráfego reduzido, classes de cor e rótulos da CPU."""
+    # Amostras por segundo (86.400/dia) viram no máximo um ponto por pixel
+    x_trafego, y_trafego = reduzir_serie(horas, trafego_mbps, LARGURA_TRAFEGO_PX)
+    # Classe 0/1/2 (verde < 50 <= laranja < 70 <= vermelho) de todos os dispositivos de uma vez
+    classes_cpu = classificar(cpu_percent, FAIXAS_CPU)
+    textos_cpu = [f'{cpu}%' for cpu in cpu_percent]
+    return x_trafego, y_trafego, classes_cpu, textos_cpu
+
+
+def texto_atualizacao():
+    """Texto do rodapé com o horário atual."""
+    return f'Atualizado em: {datetime.now().strftime("%d/%m/%Y às %H:%M:%S")}'
+
+
+def construir_figura(horas=horas, trafego_mbps=trafego_mbps,
+                     switches=switches, interfaces_up=interfaces_up, interfaces_down=interfaces_down,
+                     vlans=vlans, num_dispositivos=num_dispositivos,
+                     dispositivos=dispositivos, cpu_percent=cpu_percent,
+                     periodo_trafego='Últimas 24h',
+                     titulo='🌐 Dashboard de Monitoramento de Rede - MVP'):
+    """
+    Monta o dashboard com os quatro painéis.
+
+    Sem argumentos usa os dados simulados deste módulo; o servidor ao vivo e
+    os coletores passam os dados atuais com os mesmos nomes. Para as visões de
+    7 ou 90 dias, passe a série de Rollups.consultar() e o período no título
+    (ex.: periodo_trafego='Últimos 7 dias').
+    """
+    # --- Preparação dos dados ---
+    # Cada bloco é uma etapa medida com DASHBOARDS_INSTRUMENTAR=1
+    with etapa('dados'):
+        x_trafego, y_trafego, classes_cpu, textos_cpu = preparar_dados(horas, trafego_mbps, cpu_percent)
+        switches, interfaces_up, interfaces_down, titulo_interfaces = painel_interfaces(
+            switches, interfaces_up, interfaces_down)
+
+    with etapa('subplots'):
+        # --- Criação dos subplots ---
+        # FiguraDict monta a especificação em dicionários, sem passar cada
+        # propriedade pelos validadores do plotly (DASHBOARDS_VALIDAR=1 valida)
+        fig = FiguraDict.subplots(
+            rows=2, cols=2,
+            subplot_titles=(
+                f'📊 Tráfego de Rede - {periodo_trafego}',
+                titulo_interfaces,
+                '🌐 Distribuição de Dispositivos por VLAN',
+                '💻 Utilização de CPU - Dispositivos Críticos'
+            ),
+            specs=[[{'type': 'xy'}, {'type': 'xy'}],
+                   [{'type': 'xy'}, {'type': 'xy'}]],  # <-- todos "xy" (nada de domain)
+            vertical_spacing=0.15,
+            horizontal_spacing=0.25
+        )
+
+    with etapa('traces'):
+        # --- Gráfico 1: Linha de tráfego ---
+        # dict_linha() passa para WebGL (scattergl) em séries muito grandes
+        fig.add_trace(
+            dict_linha(
+                x_trafego,
+                y_trafego,
+                mode='lines+markers',
+                name='Tráfego (Mbps)',
+                line=dict(color='#00CC96', width=3),
+                marker=dict(size=6),
+                fill='tozeroy',
+                fillcolor='rgba(0,204,150,0.2)'
+            ),
+            row=1, col=1
+        )
+
+        # --- Gráfico 2: Barras de interfaces ---
+        fig.add_trace(
+            'bar',
+            x=switches,
+            y=interfaces_up,
+            name='UP',
+            marker_color='#00CC96',
+            text=interfaces_up,
+            textposition='inside',
+            row=1, col=2
+        )
+
+        fig.add_trace(
+            'bar',
+            x=switches,
+            y=interfaces_down,
+            name='DOWN',
+            marker_color='#EF553B',
+            text=interfaces_down,
+            textposition='inside',
+            row=1, col=2
+        )
+
+        # --- Gráfico 3: Pizza manual (posicionada via domain) ---
+        fig.add_trace(
+            'pie',
+            labels=vlans,
+            values=num_dispositivos,
+            hole=0.4,
+            name="Distribuição VLANs",
+            marker=dict(colors=['#636EFA', '#00CC96', '#AB63FA', '#FFA15A', '#19D3F3']),
+            textinfo='label+percent'
+        )
+
+        # Define a posição da pizza no quadrante inferior esquerdo
+        fig.update_traces(domain=dict(x=[0, 0.45], y=[0, 0.4]), selector=dict(type='pie'))
+
+        # --- Gráfico 4: Barras horizontais de CPU ---
+        fig.add_trace(
+            'bar',
+            x=cpu_percent,
+            y=dispositivos,
+            orientation='h',
+            marker=dict(color=classes_cpu, **escala_marcador(FAIXAS_CPU)),
+            text=textos_cpu,
+            textposition='outside',
+            showlegend=False,
+            row=2, col=2
+        )
+
+    with etapa('layout'):
+        # --- Ajuste de eixos ---
+        fig.update_xaxes(title_text="Hora", row=1, col=1)
+        fig.update_yaxes(title_text="Mbps", range=[0, 260], row=1, col=1)
+
+        fig.update_xaxes(title_text="Switches", row=1, col=2)
+        fig.update_yaxes(title_text="Interfaces", range=[0, 60], row=1, col=2)
+
+        fig.update_xaxes(title_text="CPU (%)", range=[0, 100], row=2, col=2)
+        fig.update_yaxes(title_text="", row=2, col=2)
+
+        # --- Layout ---
+        fig.update_layout(
+            title_text=titulo,
+            title_x=0.5,
+            title_font=dict(size=26, color='#2C3E50'),
+            showlegend=True,
+            height=950,
+            plot_bgcolor='#F8F9FA',
+            paper_bgcolor='white',
+            font=dict(family="Arial", size=12),
+            barmode='group'
+        )
+
+        # --- Rodapé ---
+        # add_annotation() preserva os títulos dos subplots (que também são
+        # anotações); name='atualizado_em' marca o campo como volátil para o cache
+        fig.add_annotation(
+            name='atualizado_em',
+            text=texto_atualizacao(),
             xref='paper', yref='paper',
             x=0.5, y=-0.05,
             xanchor='center', yanchor='top',
             showarrow=False,
             font=dict(size=11, color='#7F8C8D')
         )
-    ]
-)
-
-# --- Exportar HTML ---
-fig.write_html('../../docs/04_dashboard_mvp.html')
-print("✅ Dashboard salvo em: 04_dashboard_mvp.html")
-print(f"📊 Total de dispositivos: {sum(num_dispositivos)}")
-print(f"🔌 Total de interfaces: {sum(interfaces_up) + sum(interfaces_down)}")
-print(f"⚠️ Dispositivos críticos: {sum(1 for cpu in cpu_percent if cpu > 70)}")
+    return fig
+
+
+# --- Dashboards por site (comum.esqueleto) ---
+# Campos que mudam de um site para outro e onde ficam na figura. Traces na
+# ordem de construir_figura(); as anotações 0-3 são os títulos dos subplots
+CAMPOS_SITE = {
+    'titulo': [('layout', 'title', 'text')],
+    'atualizado_em': [('layout', 'annotations', 4, 'text')],
+    'titulo_interfaces': [('layout', 'annotations', 1, 'text')],
+    'x_trafego': [('data', 0, 'x')],
+    'y_trafego': [('data', 0, 'y')],
+    'switches': [('data', 1, 'x'), ('data', 2, 'x')],
+    'interfaces_up': [('data', 1, 'y'), ('data', 1, 'text')],
+    'interfaces_down': [('data', 2, 'y'), ('data', 2, 'text')],
+    'vlans': [('data', 3, 'labels')],
+    'num_dispositivos': [('data', 3, 'values')],
+    'cpu_percent': [('data', 4, 'x')],
+    'dispositivos': [('data', 4, 'y')],
+    'classes_cpu': [('data', 4, 'marker', 'color')],
+    'textos_cpu': [('data', 4, 'text')],
+}
+
+
+def esqueleto_site(include_plotlyjs=True):
+    """Esqueleto do dashboard (layout montado e serializado uma única vez)."""
+    return Esqueleto(construir_figura(), CAMPOS_SITE, include_plotlyjs)
+
+
+def valores_site(site, horas, trafego_mbps, switches, interfaces_up, interfaces_down,
+                 vlans, num_dispositivos, dispositivos, cpu_percent):
+    """Valores de CAMPOS_SITE para um site (mesmos dados de construir_figura())."""
+    x_trafego, y_trafego, classes_cpu, textos_cpu = preparar_dados(horas, trafego_mbps, cpu_percent)
+    switches, interfaces_up, interfaces_down, titulo_interfaces = painel_interfaces(
+        switches, interfaces_up, interfaces_down)
+    return {
+        'titulo': f'🌐 Dashboard de Monitoramento de Rede - {site}',
+        'atualizado_em': texto_atualizacao(),
+        'titulo_interfaces': titulo_interfaces,
+        'x_trafego': x_trafego, 'y_trafego': y_trafego,
+        'switches': switches, 'interfaces_up': interfaces_up, 'interfaces_down': interfaces_down,
+        'vlans': vlans, 'num_dispositivos': num_dispositivos,
+        'cpu_percent': cpu_percent, 'dispositivos': dispositivos,
+        'classes_cpu': classes_cpu, 'textos_cpu': textos_cpu,
+    }
+
+
+if __name__ == '__main__':
+    # --- Exportar HTML ---
+    with etapa('construir_figura'):
+        fig = construir_figura()
+    salvar_html(fig, SAIDA)
+    print("✅ Dashboard salvo em: 04_dashboard_mvp.html")
+    print(f"📊 Total de dispositivos: {sum(num_dispositivos)}")
+    print(f"🔌 Total de interfaces: {sum(interfaces_up) + sum(interfaces_down)}")
+    print(f"⚠️ Dispositivos críticos: {sum(1 for cpu in cpu_percent if cpu > 70)}")
@@ -18,6 +18,12 @@ import plotly.graph_objects as go              # Biblioteca para criar gráficos
 from plotly.subplots import make_subplots      # Função para criar múltiplos gráficos
 from datetime import datetime, timedelta       # Manipulação de datas/horas
 
+# Permite importar o pacote src/comum/ (um nível acima desta pasta)
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from comum.saida import salvar_html  # noqa: E402  Exportação padronizada para docs/
+
 # ============================================================================
 # DADOS DO GRÁFICO 1 - TRÁFEGO DE REDE (24 HORAS)
 # ============================================================================
@@ -285,28 +291,32 @@ fig.update_layout(
         family="Arial",                         # Fonte padrão para todo o dashboard
         size=12                                 # Tamanho padrão do texto
     ),
-    barmode='group',                            # IMPORTANTE: barras lado a lado
+    barmode='group'                             # IMPORTANTE: barras lado a lado
                                                 # 'group' = agrupadas (UP e DOWN separadas)
                                                 # 'stack' = empilhadas (uma sobre a outra)
-    annotations=[                               # Lista de anotações (textos extras)
-        dict(
-            text=f'Atualizado em: {datetime.now().strftime("%d/%m/%Y às %H:%M:%S")}',
+)
+
+# Rodapé com a data/hora da geração
+# add_annotation() ACRESCENTA uma anotação; passar annotations=[...] no
+# update_layout() sobrescreveria os títulos dos subplots (que também são anotações)
+fig.add_annotation(
+    name='atualizado_em',                       # Marca o texto como volátil: o cache de
+                                                # renderização (comum.cache) ignora este campo
+    text=f'Atualizado em: {datetime.now().strftime("%d/%m/%Y às %H:%M:%S")}',
                                                 # Texto com data/hora atual
                                                 # strftime() formata: 19/10/2025 às 17:48:37
-            xref='paper',                       # Referência X = página (coordenadas relativas)
-            yref='paper',                       # Referência Y = página
-            x=0.5,                              # Posição X = 50% (centro horizontal)
-            y=-0.05,                            # Posição Y = -5% (abaixo dos gráficos)
+    xref='paper',                               # Referência X = página (coordenadas relativas)
+    yref='paper',                               # Referência Y = página
+    x=0.5,                                      # Posição X = 50% (centro horizontal)
+    y=-0.05,                                    # Posição Y = -5% (abaixo dos gráficos)
                                                 # Valor negativo coloca texto no rodapé
-            xanchor='center',                   # Âncora horizontal no centro
-            yanchor='top',                      # Âncora vertical no topo do texto
-            showarrow=False,                    # Não mostrar seta apontando
-            font=dict(
-                size=11,                        # Tamanho menor que o texto principal
-                color='#7F8C8D'                 # Cor cinza (menos destaque)
-            )
-        )
-    ]
+    xanchor='center',                           # Âncora horizontal no centro
+    yanchor='top',                              # Âncora vertical no topo do texto
+    showarrow=False,                            # Não mostrar seta apontando
+    font=dict(
+        size=11,                                # Tamanho menor que o texto principal
+        color='#7F8C8D'                         # Cor cinza (menos destaque)
+    )
 )
 
 # ============================================================================
@@ -314,8 +324,10 @@ fig.update_layout(
 # ============================================================================
 
 # write_html() salva o dashboard como página web interativa
-# ../../ = sobe 2 níveis de diretório (de src/basico/ para raiz do projeto)
-fig.write_html('../../docs/04_dashboard_mvp.html')
+# salvar_html() chama write_html() apontando para docs/ e, por padrão,
+# referencia um único plotly.js compartilhado (baixado uma vez pelo navegador)
+# em vez de embutir ~3.5 MB da biblioteca em cada página
+salvar_html(fig, '04_dashboard_mvp.html')
 
 # Mensagens de confirmação no terminal
 print("✅ Dashboard salvo em: 04_dashboard_mvp.html")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Latência vs Perda de Pacotes - Sondas de Rede
+
+Cada sonda (ping/IP SLA) é um ponto (latência, perda). Com poucas sondas o
+gráfico mostra os pontos; com milhões, mostra a densidade em um histograma
+2D calculado no servidor e mantém como pontos apenas os isolados (picos de
+latência e perda), para o HTML ficar em algumas centenas de KB.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from comum.densidade import resumir_dispersao  # noqa: E402
+from comum.figura import FiguraDict  # noqa: E402
+from comum.heatmap import z_compacto  # noqa: E402
+from comum.saida import salvar_html  # noqa: E402
+from comum.traces import tipo_scatter  # noqa: E402
+
+SAIDA = '06_latency_loss_scatter.html'
+
+
+def sondas_simuladas(n=1_000_000, semente=0):
+    """Latência (ms) log-normal e perda (%) que cresce com a latência, com alguns picos."""
+    rng = np.random.default_rng(semente)
+    latencia = rng.lognormal(np.log(20), 0.5, n)
+    perda = np.clip(rng.exponential(0.02 * latencia / 20, n), 0, 100)
+    picos = rng.random(n) < 0.0005
+    latencia[picos] *= rng.uniform(5, 20, picos.sum())
+    perda[picos] = np.clip(perda[picos] + rng.uniform(5, 40, picos.sum()), 0, 100)
+    return latencia.round(2), perda.round(3)
+
+
+latencia_ms, perda_pct = sondas_simuladas()
+
+
+def construir_figura(latencia_ms=latencia_ms, perda_pct=perda_pct):
+    """Monta a dispersão (pontos ou densidade + isolados) conforme o número de sondas."""
+    resumo = resumir_dispersao(latencia_ms, perda_pct)
+
+    fig = FiguraDict()
+    if resumo['modo'] == 'densidade':
+        # Escala logarítmica (float: arredondar apagaria o gradiente entre décadas);
+        # poucas células concentram a maioria das sondas
+        fig.add_trace(
+            'heatmap',
+            z=z_compacto(np.log10(resumo['z']), inteiro=False),
+            x=resumo['x_centros'].round(3),
+            y=resumo['y_centros'].round(4),
+            colorscale='Blues',
+            colorbar=dict(title='Sondas', tickvals=[0, 1, 2, 3, 4, 5, 6],
+                          ticktext=['1', '10', '100', '1k', '10k', '100k', '1M']),
+            hovertemplate='Latência: %{x:.1f} ms<br>Perda: %{y:.2f}%<br>Sondas: 10^%{z:.1f}<extra></extra>',
+            name='Densidade',
+        )
+    fig.add_trace(
+        tipo_scatter(len(resumo['x'])),
+        x=resumo['x'],
+        y=resumo['y'],
+        mode='markers',
+        name='Isoladas' if resumo['modo'] == 'densidade' else 'Sondas',
+        marker=dict(size=4, color='#EF553B' if resumo['modo'] == 'densidade' else '#636EFA', opacity=0.7),
+        hovertemplate='Latência: %{x:.1f} ms<br>Perda: %{y:.2f}%<extra></extra>',
+    )
+
+    detalhe = f"{resumo['total']:,} sondas".replace(',', '.')
+    if resumo['modo'] == 'densidade':
+        detalhe += f" - densidade + {len(resumo['x']):,} isoladas".replace(',', '.')
+    fig.update_layout(
+        title_text=f'📡 Latência vs Perda de Pacotes ({detalhe})',
+        title_x=0.5,
+        xaxis_title='Latência (ms)',
+        yaxis_title='Perda de pacotes (%)',
+        height=700,
+        plot_bgcolor='#F8F9FA',
+        paper_bgcolor='white',
+        font=dict(family='Arial', size=12),
+        legend=dict(orientation='h', y=1.02, x=1, xanchor='right', yanchor='bottom'),
+    )
+    return fig
+
+
+if __name__ == '__main__':
+    salvar_html(construir_figura(), SAIDA)
+    print(f"✅ Gráfico salvo em: docs/{SAIDA}")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Status de Interfaces da Rede Inteira - Totais, Piores Switches e Drill-down
+
+Visão para milhares de switches: interfaces UP/DOWN somadas por site e por
+papel (CORE, DIST, ACCESS) e os TOP_N switches com mais interfaces DOWN
+(comum.status_interfaces); com mais de MAX_GRUPOS sites, só os piores
+aparecem. A página tem o mesmo tamanho com 500 ou 50.000 switches: clicar em
+um site ou papel baixa só o detalhe daquele grupo, publicado em
+docs/07_interface_status.detalhes/.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from comum.figura import FiguraDict  # noqa: E402
+from comum.ranking import TOP_N, piores  # noqa: E402
+from comum.saida import DIR_DOCS, salvar_html  # noqa: E402
+from comum.status_interfaces import (  # noqa: E402
+    MAX_GRUPOS, arquivos_grupos, publicar_detalhes, script_drilldown, totais_por_grupo)
+
+SAIDA = '07_interface_status.html'
+
+VERDE, VERMELHO = '#00CC96', '#EF553B'
+
+
+def dados_simulados(n_sites=100, semente=0):
+    """Switches de `n_sites` sites: 2 CORE, 4 DIST e 20-80 ACCESS por site."""
+    rng = np.random.default_rng(semente)
+    sites, papeis, switches = [], [], []
+    for s in range(1, n_sites + 1):
+        for papel, quantidade in (('CORE', 2), ('DIST', 4), ('ACCESS', int(rng.integers(20, 81)))):
+            sites += [f'FILIAL-{s:03d}'] * quantidade
+            papeis += [papel] * quantidade
+            switches += [f'SW-{papel}-{s:03d}-{i:02d}' for i in range(1, quantidade + 1)]
+    portas = np.where(np.asarray(papeis) == 'ACCESS', 48, 24)
+    # Alguns switches problemáticos concentram as interfaces DOWN
+    taxa = np.where(rng.random(len(switches)) < 0.02, 0.4, 0.03)
+    down = rng.binomial(portas, taxa)
+    return {'switches': np.asarray(switches), 'sites': np.asarray(sites), 'papeis': np.asarray(papeis),
+            'interfaces_up': portas - down, 'interfaces_down': down}
+
+
+dados = dados_simulados()
+
+
+def construir_figura(switches=dados['switches'], sites=dados['sites'], papeis=dados['papeis'],
+                     interfaces_up=dados['interfaces_up'], interfaces_down=dados['interfaces_down'],
+                     top_n=TOP_N, max_grupos=MAX_GRUPOS):
+    """
+    Totais por site e por papel (clicáveis) e os `top_n` piores switches.
+    A figura guarda os dados em `dados_detalhes`, de onde salvar() publica o
+    drill-down: os detalhes sempre correspondem à página.
+    """
+    switches = np.asarray(switches)
+    titulo_sites = '🏢 Interfaces por Site (clique para detalhar)'
+    n_sites = len(np.unique(sites))
+    if n_sites > max_grupos:
+        titulo_sites = f'🏢 Interfaces nos {max_grupos} Piores de {n_sites} Sites (clique para detalhar)'
+    fig = FiguraDict.subplots(
+        rows=2, cols=2,
+        specs=[[{'colspan': 2}, None], [{}, {}]],
+        subplot_titles=(titulo_sites,
+                        '🧩 Interfaces por Papel (clique para detalhar)',
+                        f'🚨 Top {top_n} Switches com Mais Interfaces DOWN'),
+        vertical_spacing=0.18,
+        horizontal_spacing=0.22,
+    )
+
+    # --- Totais por grupo: customdata aponta o arquivo do detalhe ---
+    for linha, rotulo, grupos in ((1, 'Site', sites), (2, 'Papel', papeis)):
+        nomes, up, down, quantidade = totais_por_grupo(grupos, interfaces_up, interfaces_down)
+        # Sobre todos os grupos, como em publicar_detalhes(): mesmos sufixos de colisão
+        mapa_arquivos = arquivos_grupos(rotulo, nomes)
+        if len(nomes) > max_grupos:
+            # Mantém a ordem alfabética entre os piores
+            selecionados = np.sort(piores(up, down, max_grupos))
+            nomes, up, down, quantidade = (nomes[selecionados], up[selecionados],
+                                           down[selecionados], quantidade[selecionados])
+        arquivos = [mapa_arquivos[nome] for nome in nomes.tolist()]
+        for nome_trace, valores, cor in (('UP', up, VERDE), ('DOWN', down, VERMELHO)):
+            fig.add_trace(
+                'bar', x=nomes.tolist(), y=valores.tolist(), name=nome_trace, marker_color=cor,
+                customdata=arquivos, legendgroup=nome_trace, showlegend=linha == 1,
+                text=quantidade.tolist(),
+                hovertemplate=f'%{{x}}<br>{nome_trace}: %{{y}}<br>Switches: %{{text}}<extra></extra>',
+                textposition='none',
+                row=linha, col=1,
+            )
+
+    # --- Piores switches (heap de tamanho top_n) ---
+    indices = piores(interfaces_up, interfaces_down, top_n)
+    down_piores = np.asarray(interfaces_down)[indices].tolist()
+    fig.add_trace(
+        'bar', y=switches[indices].tolist(), x=down_piores,
+        orientation='h', marker_color=VERMELHO, name='DOWN', showlegend=False,
+        text=down_piores, textposition='outside',
+        row=2, col=2,
+    )
+
+    fig.update_yaxes(title_text='Interfaces', row=1, col=1)
+    fig.update_yaxes(title_text='Interfaces', row=2, col=1)
+    fig.update_xaxes(title_text='Interfaces DOWN', row=2, col=2)
+    fig.update_yaxes(autorange='reversed', row=2, col=2)
+    fig.update_layout(
+        title_text=f'🔌 Status de Interfaces - {len(switches):,} switches'.replace(',', '.'),
+        title_x=0.5,
+        barmode='stack',
+        height=900,
+        plot_bgcolor='#F8F9FA',
+        paper_bgcolor='white',
+        font=dict(family='Arial', size=12),
+    )
+    fig.dados_detalhes = {'agrupamentos': {'Site': sites, 'Papel': papeis}, 'switches': switches,
+                          'up': interfaces_up, 'down': interfaces_down}
+    return fig
+
+
+def salvar(fig, destino=DIR_DOCS):
+    """Grava o HTML com o drill-down e um detalhe por site e por papel (dados da própria `fig`)."""
+    caminho = Path(destino) / SAIDA
+    detalhes = fig.dados_detalhes
+    publicar_detalhes(caminho, detalhes['agrupamentos'], detalhes['switches'],
+                      detalhes['up'], detalhes['down'])
+    return salvar_html(fig, SAIDA, destino=destino, post_script=script_drilldown(caminho))
+
+
+if __name__ == '__main__':
+    salvar(construir_figura())
+    print(f"✅ Status de interfaces salvo em: docs/{SAIDA}")
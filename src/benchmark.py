@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da Geração dos Gráficos
+
+Mede construção, serialização, pico de memória e tamanho do HTML dos
+gráficos com dados sintéticos e compara com um resultado anterior.
+
+Uso:
+    python src/benchmark.py [--completo] [--saida base.json]
+    python src/benchmark.py --base base.json --falhar-regressao
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from comum.benchmark import main  # noqa: E402
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark dos Motores JSON
+
+Compara a serialização de todos os gráficos do build e de uma versão
+ampliada do dashboard MVP em três motores:
+
+- plotly json: pio.to_json(engine='json'), a biblioteca padrão
+- plotly orjson: pio.to_json(engine='orjson'), a referência a ser batida
+- json_rapido: comum.json_rapido.dumps() com orjson (JSON de cache, delta,
+  fragmentos e drill-down)
+
+e confere que os três geram os mesmos valores.
+
+Uso:
+    python src/benchmark_json.py [--repeticoes 5] [--pontos 86400] [--switches 2000]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from comum.build import carregar_modulo, descobrir_graficos  # noqa: E402
+from comum.json_rapido import dumps, orjson  # noqa: E402
+
+SCRIPT_MVP = Path(__file__).resolve().parent / 'basico' / '04_dashboard_mvp.py'
+
+
+def mvp_ampliado(pontos, switches, semente=0):
+    """Figura do MVP com `pontos` amostras de tráfego (sem redução) e `switches` barras."""
+    mvp = carregar_modulo(SCRIPT_MVP)
+    mvp.LARGURA_TRAFEGO_PX = pontos  # desliga a redução LTTB: mede a serialização cheia
+    rng = np.random.default_rng(semente)
+    inicio = datetime(2025, 1, 1)
+    nomes = [f'SW-ACCESS-{i:04d}' for i in range(switches)]
+    return mvp.construir_figura(
+        horas=np.array([inicio + timedelta(seconds=i) for i in range(pontos)], dtype='datetime64[s]'),
+        trafego_mbps=rng.gamma(4, 50, pontos).round(1),
+        switches=nomes,
+        interfaces_up=rng.integers(0, 48, switches),
+        interfaces_down=rng.integers(0, 8, switches),
+        dispositivos=nomes,
+        cpu_percent=rng.uniform(0, 100, switches).round(1),
+    )
+
+
+def medir(funcao, repeticoes):
+    """Menor tempo (s) entre as repetições."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos), resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compara os motores JSON na serialização das figuras.')
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--pontos', type=int, default=86_400,
+                        help='amostras de tráfego do MVP ampliado (padrão: 86400)')
+    parser.add_argument('--switches', type=int, default=2_000,
+                        help='switches/dispositivos do MVP ampliado (padrão: 2000)')
+    args = parser.parse_args(argv)
+
+    if orjson is None:
+        print('orjson não instalado: só o motor da biblioteca padrão está disponível.')
+        return 1
+
+    figuras = [(caminho.stem, carregar_modulo(caminho).construir_figura())
+               for caminho in descobrir_graficos()]
+    figuras.append((f'04_mvp_ampliado ({args.pontos} pts)', mvp_ampliado(args.pontos, args.switches)))
+
+    import plotly.io as pio
+
+    print(f"{'Gráfico':<34} {'Tamanho':>10} {'plotly json':>12} {'plotly orjson':>14} "
+          f"{'json_rapido':>12} {'x orjson':>9}  Mesmos valores")
+    divergentes = 0
+    for nome, fig in figuras:
+        dados = fig.to_plotly_json()
+        tempo_json, texto_json = medir(lambda: pio.to_json(dados, validate=False, engine='json'),
+                                       args.repeticoes)
+        tempo_plotly, texto_plotly = medir(lambda: pio.to_json(dados, validate=False, engine='orjson'),
+                                           args.repeticoes)
+        tempo_rapido, texto_rapido = medir(lambda: dumps(dados, motor='orjson'), args.repeticoes)
+        referencia = json.loads(texto_json)
+        iguais = json.loads(texto_plotly) == referencia == json.loads(texto_rapido)
+        divergentes += not iguais
+        # x orjson > 1: json_rapido mais rápido que o orjson do próprio plotly
+        print(f'{nome:<34} {len(texto_json) / 1024:>8.0f}KB {tempo_json * 1e3:>10.1f}ms '
+              f'{tempo_plotly * 1e3:>12.1f}ms {tempo_rapido * 1e3:>10.1f}ms '
+              f'{tempo_plotly / tempo_rapido:>8.1f}x  {"sim" if iguais else "NÃO"}')
+    return 1 if divergentes else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
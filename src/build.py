@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build de Todos os Dashboards
+
+Ponto de entrada único para regenerar docs/: renderiza em paralelo todos os
+gráficos de src/ e pula os que não mudaram desde o último build.
+
+Uso:
+    python src/build.py [--forcar] [-j N] [scripts...]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from comum.build import main  # noqa: E402
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Utilitários compartilhados pelos scripts de dashboards.
+
+Os scripts de src/basico/ (e dos próximos níveis) importam este pacote
+para tarefas comuns como a exportação dos gráficos para docs/.
+"""
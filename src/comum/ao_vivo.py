@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor Ao Vivo do Dashboard MVP
+
+Servidor HTTP local (asyncio, só biblioteca padrão) que entrega a página do
+dashboard uma única vez e depois envia apenas as amostras novas por
+Server-Sent Events (SSE). No navegador, cada mensagem é aplicada com
+Plotly.extendTraces (linha de tráfego) e Plotly.restyle (barras de
+interfaces e de CPU), sem recarregar a página: poucas centenas de bytes por
+atualização em vez de um HTML de vários megabytes por minuto. O painel de
+interfaces segue a mesma seleção da página (comum.ranking.painel_interfaces):
+com muitos switches, cada mensagem traz os piores do momento e o título.
+
+Rotas:
+    GET /                página do dashboard (montada com os dados atuais)
+    GET /plotly.min.js   biblioteca plotly.js (cacheável pelo navegador)
+    GET /eventos         fluxo SSE com uma mensagem JSON por amostra
+
+A fonte de dados é qualquer objeto com amostrar() e estado(), como o
+comum.simulador.SimuladorMetricas.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+from comum.limiares import FAIXAS_CPU, classificar
+from comum.ranking import painel_interfaces
+
+CABECALHO_SSE = (
+    'HTTP/1.1 200 OK\r\n'
+    'Content-Type: text/event-stream; charset=utf-8\r\n'
+    'Cache-Control: no-cache\r\n'
+    'Connection: keep-alive\r\n'
+    '\r\n'
+    'retry: 3000\n\n'
+)
+
+# Executado pelo Plotly logo após desenhar a figura ({plot_id} = id da div)
+JS_CLIENTE = """
+var grafico = document.getElementById('{plot_id}');
+var indices = %(indices)s;
+var fonte = new EventSource('eventos');
+fonte.onmessage = function (evento) {
+    var d = JSON.parse(evento.data);
+    Plotly.extendTraces(grafico, {x: [[d.hora]], y: [[d.trafego]]}, [indices.trafego], %(max_pontos)d);
+    Plotly.restyle(grafico, {x: [d.switches, d.switches], y: [d.up, d.down], text: [d.up, d.down]},
+                   [indices.up, indices.down]);
+    Plotly.restyle(grafico, {x: [d.cpu], text: [d.cpu_texto], 'marker.color': [d.classes_cpu]}, [indices.cpu]);
+    var anotacoes = {};
+    if (indices.titulo_interfaces !== null) {
+        anotacoes['annotations[' + indices.titulo_interfaces + '].text'] = d.titulo_interfaces;
+    }
+    if (indices.rodape !== null) {
+        anotacoes['annotations[' + indices.rodape + '].text'] = d.atualizado;
+    }
+    Plotly.relayout(grafico, anotacoes);
+};
+"""
+
+
+def indices_paineis(fig):
+    """Localiza na figura os traces e a anotação que recebem atualizações."""
+    dados = fig if isinstance(fig, dict) else fig.to_plotly_json()
+    indices = {'trafego': None, 'up': None, 'down': None, 'cpu': None,
+               'titulo_interfaces': None, 'rodape': None}
+    for i, trace in enumerate(dados['data']):
+        tipo = trace.get('type', 'scatter')
+        if tipo in ('scatter', 'scattergl') and indices['trafego'] is None:
+            indices['trafego'] = i
+        elif tipo == 'bar' and trace.get('orientation') == 'h':
+            indices['cpu'] = i
+        elif tipo == 'bar' and trace.get('name') in ('UP', 'DOWN'):
+            indices[trace['name'].lower()] = i
+    anotacoes = dados['layout'].get('annotations', [])
+    for i, anotacao in enumerate(anotacoes):
+        if anotacao.get('name') == 'atualizado_em':
+            indices['rodape'] = i
+    if indices['up'] is not None:
+        indices['titulo_interfaces'] = _titulo_subplot(dados, dados['data'][indices['up']])
+    faltando = [nome for nome, valor in indices.items()
+                if valor is None and nome not in ('titulo_interfaces', 'rodape')]
+    if faltando:
+        raise ValueError(f"Figura sem os painéis esperados: {', '.join(faltando)}")
+    return indices
+
+
+def _titulo_subplot(dados, trace):
+    """Índice da anotação de título (make_subplots) do subplot de `trace`, ou None."""
+    layout = dados['layout']
+    eixo_x = layout.get('xaxis' + trace.get('xaxis', 'x')[1:], {})
+    eixo_y = layout.get('yaxis' + trace.get('yaxis', 'y')[1:], {})
+    dominio_x = eixo_x.get('domain', [0, 1])
+    centro, topo = (dominio_x[0] + dominio_x[1]) / 2, eixo_y.get('domain', [0, 1])[1]
+    candidatos = [(abs(a.get('x', 0) - centro) + abs(a.get('y', 0) - topo), i)
+                  for i, a in enumerate(layout.get('annotations', []))
+                  if a.get('xanchor') == 'center' and a.get('yanchor') == 'bottom' and not a.get('name')]
+    return min(candidatos)[1] if candidatos else None
+
+
+def mensagem_amostra(amostra):
+    """Converte uma amostra da fonte no JSON compacto enviado ao navegador."""
+    momento = amostra.get('momento') or datetime.now()
+    cpu = amostra['cpu_percent']
+    # Mesma seleção da página: com muitos switches, só os piores do momento
+    switches, up, down, titulo_interfaces = painel_interfaces(
+        amostra['switches'], amostra['interfaces_up'], amostra['interfaces_down'])
+    return json.dumps({
+        'hora': amostra['hora'],
+        'trafego': amostra['trafego'],
+        'switches': switches,
+        'up': up,
+        'down': down,
+        'titulo_interfaces': titulo_interfaces,
+        'cpu': cpu,
+        'cpu_texto': [f'{valor}%' for valor in cpu],
+        # Classes da mesma regra do MVP; a colorscale já está no trace
+        'classes_cpu': classificar(cpu, FAIXAS_CPU).tolist(),
+        'atualizado': f'Atualizado em: {momento.strftime("%d/%m/%Y às %H:%M:%S")}',
+    }, ensure_ascii=False, separators=(',', ':'))
+
+
+class ServidorAoVivo:
+    """Serve o dashboard e transmite as atualizações para todos os clientes."""
+
+    def __init__(self, construir_figura, fonte, intervalo=1.0,
+                 host='127.0.0.1', porta=8050, max_pontos=800, fila_por_cliente=32):
+        self.construir_figura = construir_figura
+        self.fonte = fonte
+        self.intervalo = intervalo
+        self.host = host
+        self.porta = porta
+        self.max_pontos = max_pontos
+        self.fila_por_cliente = fila_por_cliente
+        self.clientes = set()
+        self._conexoes = set()  # tarefas de atendimento em andamento
+        self._servidor = None
+        self._produtor = None
+        self._plotlyjs = None
+
+    async def iniciar(self):
+        """Abre a porta e começa a produzir amostras."""
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        # Com porta=0 o sistema escolhe uma porta livre
+        self.porta = self._servidor.sockets[0].getsockname()[1]
+        self._produtor = asyncio.create_task(self._produzir())
+        return self
+
+    async def parar(self, espera=5.0):
+        """Para o produtor, encerra os fluxos SSE abertos e fecha a porta."""
+        if self._produtor:
+            self._produtor.cancel()
+            try:
+                await self._produtor
+            except asyncio.CancelledError:
+                pass
+        if self._servidor:
+            self._servidor.close()
+        # None termina cada fluxo SSE: os atendimentos acabam sem cancelamento
+        self.publicar(None)
+        if self._conexoes:
+            _, pendentes = await asyncio.wait(self._conexoes, timeout=espera)
+            for tarefa in pendentes:
+                tarefa.cancel()
+        if self._servidor:
+            await self._servidor.wait_closed()
+
+    async def servir_para_sempre(self):
+        await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    # --- Produção e distribuição das amostras ---
+
+    async def _produzir(self):
+        while True:
+            await asyncio.sleep(self.intervalo)
+            self.publicar(mensagem_amostra(self.fonte.amostrar()))
+
+    def publicar(self, mensagem):
+        """
+        Entrega a mensagem a todos os clientes (descarta a mais antiga se a
+        fila encher). None encerra o fluxo dos clientes.
+        """
+        for fila in self.clientes:
+            if fila.full():
+                fila.get_nowait()
+            fila.put_nowait(mensagem)
+
+    # --- HTTP ---
+
+    async def _atender(self, reader, writer):
+        tarefa = asyncio.current_task()
+        self._conexoes.add(tarefa)
+        try:
+            linha = (await reader.readline()).decode('latin-1').split()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass  # cabeçalhos da requisição não são usados
+            metodo, caminho = (linha + ['', ''])[:2]
+            caminho = caminho.split('?', 1)[0]
+
+            if metodo != 'GET':
+                await self._responder(writer, 405, 'text/plain', b'Metodo nao suportado')
+            elif caminho == '/':
+                await self._responder(writer, 200, 'text/html; charset=utf-8', self.pagina())
+            elif caminho == '/plotly.min.js':
+                await self._responder(writer, 200, 'application/javascript', self._biblioteca(),
+                                      extra='Cache-Control: public, max-age=31536000\r\n')
+            elif caminho == '/eventos':
+                await self._transmitir(writer)
+            else:
+                await self._responder(writer, 404, 'text/plain', b'Nao encontrado')
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            self._conexoes.discard(tarefa)
+
+    async def _responder(self, writer, status, tipo, corpo, extra=''):
+        motivos = {200: 'OK', 404: 'Not Found', 405: 'Method Not Allowed'}
+        writer.write((f'HTTP/1.1 {status} {motivos[status]}\r\n'
+                      f'Content-Type: {tipo}\r\n'
+                      f'Content-Length: {len(corpo)}\r\n'
+                      f'{extra}Connection: close\r\n\r\n').encode('latin-1') + corpo)
+        await writer.drain()
+
+    async def _transmitir(self, writer):
+        fila = asyncio.Queue(maxsize=self.fila_por_cliente)
+        self.clientes.add(fila)
+        try:
+            writer.write(CABECALHO_SSE.encode('utf-8'))
+            await writer.drain()
+            while True:
+                try:
+                    mensagem = await asyncio.wait_for(fila.get(), timeout=15)
+                    if mensagem is None:
+                        break
+                    writer.write(f'data: {mensagem}\n\n'.encode('utf-8'))
+                except asyncio.TimeoutError:
+                    writer.write(b': keep-alive\n\n')  # mantém proxies com a conexão aberta
+                await writer.drain()
+        finally:
+            self.clientes.discard(fila)
+
+    def _biblioteca(self):
+        if self._plotlyjs is None:
+            from plotly.offline import get_plotlyjs
+            self._plotlyjs = get_plotlyjs().encode('utf-8')
+        return self._plotlyjs
+
+    def pagina(self):
+        """HTML completo do dashboard com o estado atual da fonte."""
+        fig = self.construir_figura(**self.fonte.estado())
+        script = JS_CLIENTE % {'indices': json.dumps(indices_paineis(fig)),
+                               'max_pontos': self.max_pontos}
+        return fig.to_html(include_plotlyjs='plotly.min.js', post_script=script).encode('utf-8')
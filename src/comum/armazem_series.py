@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Armazém de Séries Temporais em Buffers Circulares (mmap)
+
+Guarda o histórico das métricas do dashboard em arquivos de tamanho fixo,
+um por métrica e dispositivo, mapeados em memória com NumPy:
+
+    <diretorio>/<metrica>/<dispositivo>.ring
+
+- Inserção O(1): cada amostra sobrescreve a mais antiga quando o buffer
+  enche; a memória e o disco ficam constantes com ingestão contínua.
+- Leitura sem cópia: cada amostra é gravada duas vezes (posições i e
+  i + capacidade), então qualquer janela das últimas N amostras é uma fatia
+  contígua do arquivo. janela() e intervalo() devolvem views NumPy que podem
+  ir direto para reduzir_serie()/trace_linha().
+- Persistente: ao reabrir o diretório, os buffers continuam de onde pararam,
+  sem reprocessar nada.
+
+Formato do arquivo: cabeçalho de 64 bytes (assinatura, capacidade, total de
+amostras gravadas), seguido de 2 x capacidade timestamps (datetime64[ns]) e
+2 x capacidade valores (float64).
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+
+ASSINATURA = b'DSHRING1'
+TAMANHO_CABECALHO = 64
+_CABECALHO = np.dtype([('assinatura', 'S8'), ('capacidade', '<i8'), ('escritos', '<i8')])
+
+
+def _nome_arquivo(texto):
+    """Nome seguro para o sistema de arquivos (ex.: 'Gi1/0/1' -> 'Gi1_0_1')."""
+    return re.sub(r'[^\w.-]', '_', str(texto)) or '_'
+
+
+class BufferCircular:
+    """Buffer circular persistente de (timestamp, valor) com capacidade fixa."""
+
+    def __init__(self, caminho, capacidade):
+        self.caminho = Path(caminho)
+        if self.caminho.exists():
+            cabecalho = np.fromfile(self.caminho, dtype=_CABECALHO, count=1)[0]
+            if cabecalho['assinatura'] != ASSINATURA:
+                raise ValueError(f'{self.caminho} não é um buffer circular válido')
+            capacidade = int(cabecalho['capacidade'])
+        else:
+            if capacidade <= 0:
+                raise ValueError('A capacidade deve ser positiva')
+            self.caminho.parent.mkdir(parents=True, exist_ok=True)
+            tamanho = TAMANHO_CABECALHO + 2 * capacidade * (8 + 8)
+            with open(self.caminho, 'wb') as arquivo:
+                arquivo.truncate(tamanho)
+            cabecalho = np.memmap(self.caminho, dtype=_CABECALHO, mode='r+', shape=(1,))
+            cabecalho[0] = (ASSINATURA, capacidade, 0)
+            cabecalho.flush()
+            del cabecalho
+
+        self.capacidade = capacidade
+        self._cabecalho = np.memmap(self.caminho, dtype=_CABECALHO, mode='r+', shape=(1,))
+        self._t = np.memmap(self.caminho, dtype='<M8[ns]', mode='r+',
+                            offset=TAMANHO_CABECALHO, shape=(2 * capacidade,))
+        self._v = np.memmap(self.caminho, dtype='<f8', mode='r+',
+                            offset=TAMANHO_CABECALHO + 16 * capacidade, shape=(2 * capacidade,))
+
+    @property
+    def escritos(self):
+        """Total de amostras já gravadas (inclusive as sobrescritas)."""
+        return int(self._cabecalho[0]['escritos'])
+
+    def __len__(self):
+        return min(self.escritos, self.capacidade)
+
+    def anexar(self, momento, valor):
+        """Grava uma amostra (momento: datetime, datetime64 ou epoch em segundos)."""
+        escritos = self.escritos
+        posicao = escritos % self.capacidade
+        t = _para_datetime64(momento)
+        self._t[posicao] = self._t[posicao + self.capacidade] = t
+        self._v[posicao] = self._v[posicao + self.capacidade] = valor
+        # O contador é atualizado por último: uma queda no meio não expõe amostra pela metade
+        self._cabecalho[0]['escritos'] = escritos + 1
+
+    def anexar_lote(self, momentos, valores):
+        """Grava várias amostras de uma vez (vetorizado)."""
+        t = _para_datetime64(momentos)
+        v = np.asarray(valores, dtype=np.float64)
+        if t.shape != v.shape:
+            raise ValueError(f'momentos e valores com tamanhos diferentes: {t.shape} != {v.shape}')
+        pulados = max(len(v) - self.capacidade, 0)  # só as últimas cabem
+        t, v = t[pulados:], v[pulados:]
+        escritos = self.escritos + pulados
+        posicoes = (escritos + np.arange(len(v))) % self.capacidade
+        for deslocamento in (0, self.capacidade):
+            self._t[posicoes + deslocamento] = t
+            self._v[posicoes + deslocamento] = v
+        self._cabecalho[0]['escritos'] = escritos + len(v)
+
+    def janela(self, ultimos=None):
+        """
+        Views (t, v) das últimas `ultimos` amostras (todas, se None), em ordem
+        cronológica e sem cópia.
+        """
+        n = len(self) if ultimos is None else min(ultimos, len(self))
+        fim = self.escritos % self.capacidade + self.capacidade
+        if self.escritos < self.capacidade:
+            fim = self.escritos  # ainda não deu a volta: dados na primeira metade
+        return self._t[fim - n:fim], self._v[fim - n:fim]
+
+    def intervalo(self, inicio=None, fim=None):
+        """Views (t, v) das amostras com inicio <= t < fim (timestamps crescentes)."""
+        t, v = self.janela()
+        a = 0 if inicio is None else int(np.searchsorted(t, _para_datetime64(inicio), 'left'))
+        b = len(t) if fim is None else int(np.searchsorted(t, _para_datetime64(fim), 'left'))
+        return t[a:b], v[a:b]
+
+    def sincronizar(self):
+        """Força a gravação das páginas alteradas no disco."""
+        for mapa in (self._t, self._v, self._cabecalho):
+            mapa.flush()
+
+
+def _para_datetime64(momento):
+    valores = np.asarray(momento)
+    if valores.dtype.kind in 'iuf':  # epoch em segundos
+        return (valores * 1e9).astype('<M8[ns]')
+    return valores.astype('<M8[ns]')
+
+
+class ArmazemSeries:
+    """
+    Conjunto de buffers circulares, um por (métrica, dispositivo).
+
+    Os buffers são abertos sob demanda e ficam em cache; `capacidade` vale
+    para séries novas (as existentes mantêm a capacidade gravada no arquivo).
+    """
+
+    def __init__(self, diretorio, capacidade=86_400):
+        self.diretorio = Path(diretorio)
+        self.capacidade = capacidade
+        self._buffers = {}
+
+    def buffer(self, metrica, dispositivo, capacidade=None):
+        """Buffer da série; `capacidade` substitui o padrão ao criar uma série nova."""
+        chave = (metrica, dispositivo)
+        if chave not in self._buffers:
+            caminho = self.diretorio / _nome_arquivo(metrica) / f'{_nome_arquivo(dispositivo)}.ring'
+            self._buffers[chave] = BufferCircular(caminho, capacidade or self.capacidade)
+        return self._buffers[chave]
+
+    def anexar(self, metrica, dispositivo, momento, valor):
+        self.buffer(metrica, dispositivo).anexar(momento, valor)
+
+    def anexar_lote(self, metrica, dispositivo, momentos, valores):
+        self.buffer(metrica, dispositivo).anexar_lote(momentos, valores)
+
+    def janela(self, metrica, dispositivo, ultimos=None):
+        return self.buffer(metrica, dispositivo).janela(ultimos)
+
+    def intervalo(self, metrica, dispositivo, inicio=None, fim=None):
+        return self.buffer(metrica, dispositivo).intervalo(inicio, fim)
+
+    def series(self):
+        """Lista (métrica, dispositivo) das séries em disco (nomes já normalizados)."""
+        return sorted((caminho.parent.name, caminho.stem)
+                      for caminho in self.diretorio.glob('*/*.ring'))
+
+    def sincronizar(self):
+        for buffer in self._buffers.values():
+            buffer.sincronizar()
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark da Geração dos Gráficos
+
+Roda os construtores de linha, barras, pizza, do dashboard MVP, do heatmap,
+da dispersão latência × perda e do status de interfaces com dados sintéticos
+em escalas crescentes (10 a 5M pontos, 5 a 50.000 dispositivos)
+e mede, para cada cenário:
+
+- construcao_s: tempo de construir_figura()
+- serializacao_s: tempo de gerar o HTML (renderizar_html, sem cache e sem disco)
+- memoria_pico_mb: pico de memória alocada (tracemalloc) em construção + HTML
+- html_bytes: tamanho do HTML (sem o plotly.js, que é um asset compartilhado)
+
+Cada construtor é aquecido antes da medição (imports tardios do plotly não
+entram no primeiro cenário). Os tempos são o menor valor entre as
+repetições; a memória é medida em uma execução separada, porque o
+tracemalloc deixa o código bem mais lento.
+
+O resultado é gravado em JSON. Com --base, cada métrica é comparada com a
+de um resultado anterior e o comando termina com código 1 se alguma piorar
+além da tolerância (--falhar-regressao), o que permite usar o benchmark na CI
+ou antes de atualizar o plotly.
+
+Uso:
+    python src/benchmark.py                           # cenários rápidos
+    python src/benchmark.py --completo --saida base.json
+    python src/benchmark.py --base base.json --falhar-regressao
+"""
+
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from comum.build import DIR_RAIZ, carregar_modulo
+from comum.saida import renderizar_html
+
+DIR_BASICO = DIR_RAIZ / 'src' / 'basico'
+ARQUIVO_PADRAO = DIR_RAIZ / '.cache' / 'benchmark' / 'ultimo.json'
+
+# (pontos, dispositivos) por gráfico; os rápidos são um subconjunto dos completos
+CENARIOS = {
+    'linha': [(10, 0), (1_000, 0), (100_000, 0), (1_000_000, 0)],
+    'barras': [(0, 5), (0, 100), (0, 1_000), (0, 10_000)],
+    'pizza': [(0, 5), (0, 100), (0, 1_000), (0, 10_000)],
+    'mvp': [(10, 5), (1_440, 100), (86_400, 1_000), (1_000_000, 10_000)],
+    'heatmap': [(1_440, 5), (1_440, 100), (1_440, 1_000), (1_440, 5_000)],
+    'dispersao': [(1_000, 0), (100_000, 0), (1_000_000, 0), (5_000_000, 0)],
+    'interfaces': [(0, 100), (0, 1_000), (0, 10_000), (0, 50_000)],
+}
+CENARIOS_RAPIDOS = {
+    'linha': [(10, 0), (100_000, 0)],
+    'barras': [(0, 5), (0, 1_000)],
+    'pizza': [(0, 5), (0, 1_000)],
+    'mvp': [(10, 5), (86_400, 1_000)],
+    'heatmap': [(1_440, 5), (1_440, 1_000)],
+    'dispersao': [(1_000, 0), (1_000_000, 0)],
+    'interfaces': [(0, 100), (0, 10_000)],
+}
+
+METRICAS = ('construcao_s', 'serializacao_s', 'memoria_pico_mb', 'html_bytes')
+# Diferenças absolutas abaixo destes valores são ruído, não regressão
+TOLERANCIA_ABSOLUTA = {'construcao_s': 0.005, 'serializacao_s': 0.005,
+                       'memoria_pico_mb': 1.0, 'html_bytes': 1024}
+
+CORES = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#43e97b', '#fa709a']
+
+
+def _nomes(prefixo, n):
+    return [f'{prefixo}-{i:05d}' for i in range(n)]
+
+
+def dados_sinteticos(grafico, pontos, dispositivos, semente=0):
+    """Argumentos de construir_figura() para o gráfico e a escala pedidos."""
+    rng = np.random.default_rng(semente)
+    if grafico == 'linha':
+        return {'semanas': np.arange(1, pontos + 1),
+                'labs_completos': np.cumsum(rng.integers(0, 5, pontos))}
+    if grafico == 'barras':
+        return {'dominios': _nomes('SW', dispositivos),
+                'labs_completos': rng.integers(0, 50, dispositivos),
+                'cores': [CORES[i % len(CORES)] for i in range(dispositivos)]}
+    if grafico == 'pizza':
+        return {'categorias': _nomes('VLAN', dispositivos),
+                'quantidade': rng.integers(1, 200, dispositivos),
+                'cores': [CORES[i % len(CORES)] for i in range(dispositivos)]}
+    if grafico == 'mvp':
+        switches = _nomes('SW', dispositivos)
+        inicio = np.datetime64('2025-01-01T00:00:00')
+        return {
+            'horas': inicio + np.arange(pontos) * np.timedelta64(86_400 // max(min(pontos, 86_400), 1), 's'),
+            'trafego_mbps': rng.gamma(4, 50, pontos).round(1),
+            'switches': switches,
+            'interfaces_up': rng.integers(0, 48, dispositivos),
+            'interfaces_down': rng.integers(0, 8, dispositivos),
+            'vlans': _nomes('VLAN', 5),
+            'num_dispositivos': rng.integers(10, 200, 5),
+            'dispositivos': switches,
+            'cpu_percent': rng.uniform(0, 100, dispositivos).round(1),
+        }
+    if grafico == 'heatmap':
+        # `pontos` minutos por dispositivo, no formato longo dos coletores
+        inicio = np.datetime64('2025-01-01T00:00', 'm')
+        return {'dispositivos': pd.Categorical.from_codes(np.repeat(np.arange(dispositivos), pontos),
+                                                          _nomes('SW', dispositivos)),
+                'tempos': np.tile(inicio + np.arange(pontos), dispositivos),
+                'utilizacao': rng.uniform(0, 100, pontos * dispositivos).round(1)}
+    if grafico == 'dispersao':
+        latencia = rng.lognormal(3, 0.5, pontos).round(2)
+        return {'latencia_ms': latencia,
+                'perda_pct': np.clip(rng.exponential(latencia / 1_000), 0, 100).round(3)}
+    if grafico == 'interfaces':
+        # 50 switches por site
+        portas = rng.choice([24, 48], dispositivos)
+        down = rng.binomial(portas, 0.05)
+        return {'switches': _nomes('SW', dispositivos),
+                'sites': [f'SITE-{i // 50:04d}' for i in range(dispositivos)],
+                'papeis': rng.choice(['CORE', 'DIST', 'ACCESS'], dispositivos, p=[0.02, 0.08, 0.9]),
+                'interfaces_up': portas - down, 'interfaces_down': down}
+    raise ValueError(f'Gráfico desconhecido: {grafico!r}')
+
+
+def construtores():
+    """{gráfico: construir_figura} dos scripts de src/basico."""
+    scripts = {'linha': '01_line_chart.py', 'barras': '02_bar_chart.py',
+               'pizza': '03_pie_chart.py', 'mvp': '04_dashboard_mvp.py',
+               'heatmap': '05_utilization_heatmap.py', 'dispersao': '06_latency_loss_scatter.py',
+               'interfaces': '07_interface_status.py'}
+    return {nome: carregar_modulo(DIR_BASICO / arquivo).construir_figura
+            for nome, arquivo in scripts.items()}
+
+
+def medir_cenario(construir, dados, repeticoes=3):
+    """Métricas de um cenário (ver docstring do módulo)."""
+    construcao, serializacao = [], []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        fig = construir(**dados)
+        meio = time.perf_counter()
+        html = renderizar_html(fig, 'plotly.min.js')
+        fim = time.perf_counter()
+        construcao.append(meio - inicio)
+        serializacao.append(fim - meio)
+        del fig
+
+    tracemalloc.start()
+    try:
+        renderizar_html(construir(**dados), 'plotly.min.js')
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'construcao_s': round(min(construcao), 5),
+            'serializacao_s': round(min(serializacao), 5),
+            'memoria_pico_mb': round(pico / 2**20, 2),
+            'html_bytes': len(html)}
+
+
+def executar(graficos=None, completo=False, repeticoes=3, progresso=None):
+    """Roda os cenários e devolve o resultado completo (dicionário serializável)."""
+    import plotly
+
+    cenarios = CENARIOS if completo else CENARIOS_RAPIDOS
+    funcoes = construtores()
+    resultados = []
+    for grafico in graficos or cenarios:
+        # Aquecimento fora da medição: imports tardios do plotly, template, plotly.js
+        renderizar_html(funcoes[grafico](**dados_sinteticos(grafico, *CENARIOS[grafico][0])), 'plotly.min.js')
+        for pontos, dispositivos in cenarios[grafico]:
+            dados = dados_sinteticos(grafico, pontos, dispositivos)
+            metricas = medir_cenario(funcoes[grafico], dados, repeticoes)
+            resultado = {'grafico': grafico, 'pontos': pontos, 'dispositivos': dispositivos, **metricas}
+            resultados.append(resultado)
+            if progresso:
+                progresso(resultado)
+    return {
+        'meta': {'data': datetime.now().isoformat(timespec='seconds'),
+                 'python': platform.python_version(),
+                 'plotly': plotly.__version__,
+                 'numpy': np.__version__,
+                 'plataforma': platform.platform(),
+                 'repeticoes': repeticoes},
+        'resultados': resultados,
+    }
+
+
+def _chave(resultado):
+    return resultado['grafico'], resultado['pontos'], resultado['dispositivos']
+
+
+def comparar(atual, base, tolerancia=0.25):
+    """
+    Lista de regressões: métricas que pioraram mais que `tolerancia` (fração)
+    e mais que TOLERANCIA_ABSOLUTA em relação à base.
+    """
+    anteriores = {_chave(r): r for r in base['resultados']}
+    regressoes = []
+    for resultado in atual['resultados']:
+        anterior = anteriores.get(_chave(resultado))
+        if anterior is None:
+            continue
+        for metrica in METRICAS:
+            novo, antigo = resultado[metrica], anterior.get(metrica)
+            if antigo is None:
+                continue
+            if novo - antigo > TOLERANCIA_ABSOLUTA[metrica] and novo > antigo * (1 + tolerancia):
+                regressoes.append({'grafico': resultado['grafico'], 'pontos': resultado['pontos'],
+                                   'dispositivos': resultado['dispositivos'], 'metrica': metrica,
+                                   'base': antigo, 'atual': novo,
+                                   'variacao': round(novo / antigo - 1, 3) if antigo else None})
+    return regressoes
+
+
+def _linha(resultado):
+    return (f"{resultado['grafico']:<7} {resultado['pontos']:>9} {resultado['dispositivos']:>7} "
+            f"{resultado['construcao_s'] * 1e3:>10.1f} {resultado['serializacao_s'] * 1e3:>10.1f} "
+            f"{resultado['memoria_pico_mb']:>9.1f} {resultado['html_bytes'] / 1024:>10.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark da geração dos gráficos.')
+    parser.add_argument('graficos', nargs='*', metavar='GRAFICO',
+                        help=f"subconjunto de: {', '.join(CENARIOS)} (padrão: todos)")
+    parser.add_argument('--completo', action='store_true',
+                        help='todas as escalas (até 5M pontos e 50.000 dispositivos)')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--saida', type=Path, default=ARQUIVO_PADRAO,
+                        help=f'arquivo JSON do resultado (padrão: {ARQUIVO_PADRAO.relative_to(DIR_RAIZ)})')
+    parser.add_argument('--base', type=Path, help='resultado anterior para comparação')
+    parser.add_argument('--tolerancia', type=float, default=0.25,
+                        help='piora relativa aceita antes de acusar regressão (padrão: 0.25)')
+    parser.add_argument('--falhar-regressao', action='store_true',
+                        help='termina com código 1 se houver regressão em relação à base')
+    args = parser.parse_args(argv)
+    desconhecidos = set(args.graficos) - set(CENARIOS)
+    if desconhecidos:
+        parser.error(f"gráfico(s) desconhecido(s): {', '.join(sorted(desconhecidos))}")
+
+    print(f"{'Gráfico':<7} {'Pontos':>9} {'Disp.':>7} {'Constr.ms':>10} {'Serial.ms':>10} "
+          f"{'Pico MB':>9} {'HTML KB':>10}")
+    atual = executar(args.graficos or None, args.completo, args.repeticoes,
+                     progresso=lambda r: print(_linha(r), flush=True))
+
+    args.saida.parent.mkdir(parents=True, exist_ok=True)
+    args.saida.write_text(json.dumps(atual, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\n💾 Resultado salvo em {args.saida}")
+
+    if not args.base:
+        return 0
+    regressoes = comparar(atual, json.loads(args.base.read_text(encoding='utf-8')), args.tolerancia)
+    if not regressoes:
+        print(f"✅ Nenhuma regressão em relação a {args.base}")
+        return 0
+    for r in regressoes:
+        variacao = f" (+{r['variacao']:.0%})" if r['variacao'] is not None else ''
+        print(f"⚠️  {r['grafico']} ({r['pontos']} pts, {r['dispositivos']} disp.) {r['metrica']}: "
+              f"{r['base']} -> {r['atual']}{variacao}")
+    return 1 if args.falhar_regressao else 0
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Arrays Numéricos em Base64 (typed arrays) no HTML
+
+O plotly 5.18 serializa arrays numéricos como listas JSON de números: 86.400
+amostras de tráfego viram ~1,5 MB de texto que o navegador ainda precisa
+interpretar número a número. Este módulo troca os arrays numéricos grandes
+dos traces pelo formato binário do plotly.js:
+
+    {"dtype": "f8", "bdata": "<base64>", "shape": "5000, 1440"}
+
+Os bytes são little-endian, no menor tipo inteiro que comporta os valores
+(ou float64/float32). O plotly.js 2.27, embutido no plotly 5.18, ainda não
+entende esse formato, então a página recebe um pequeno decodificador
+(DECODIFICADOR_JS) que transforma cada objeto em Float64Array, Int32Array...
+antes de Plotly.newPlot/Plotly.react. Arrays 2D (z de heatmaps) viram uma
+lista de linhas, cada uma um typed array sem cópia do mesmo buffer.
+
+Arrays com menos de LIMITE_BINARIO elementos continuam em JSON: o ganho seria
+mínimo e o HTML dos gráficos pequenos fica igual ao de antes.
+Defina DASHBOARDS_BINARIO=0 para desativar.
+"""
+
+import base64
+import os
+
+import numpy as np
+
+LIMITE_BINARIO = 256
+
+# Atributos que aceitam números mas são tratados como texto/rótulo pelo plotly.js
+CHAVES_TEXTO = frozenset({'text', 'hovertext', 'ids', 'labels', 'customdata', 'name'})
+
+# Ordem de preferência ao reduzir inteiros (o JavaScript não tem Int64Array utilizável)
+_TIPOS_INTEIROS = ('i1', 'u1', 'i2', 'u2', 'i4', 'u4')
+
+DECODIFICADOR_JS = """(function () {
+  var TIPOS = {f8: Float64Array, f4: Float32Array, i1: Int8Array, u1: Uint8Array,
+               i2: Int16Array, u2: Uint16Array, i4: Int32Array, u4: Uint32Array};
+  function decodificar(valor) {
+    if (Array.isArray(valor)) {
+      for (var i = 0; i < valor.length; i++) valor[i] = decodificar(valor[i]);
+    } else if (valor && typeof valor === 'object') {
+      if (typeof valor.bdata === 'string' && TIPOS[valor.dtype]) {
+        var texto = atob(valor.bdata), bytes = new Uint8Array(texto.length);
+        for (var j = 0; j < texto.length; j++) bytes[j] = texto.charCodeAt(j);
+        var array = new TIPOS[valor.dtype](bytes.buffer);
+        var forma = valor.shape ? String(valor.shape).split(',').map(Number) : [array.length];
+        if (forma.length < 2) return array;
+        var linhas = [];
+        for (var k = 0; k < forma[0]; k++) linhas.push(array.subarray(k * forma[1], (k + 1) * forma[1]));
+        return linhas;
+      }
+      for (var chave in valor) {
+        if (Object.prototype.hasOwnProperty.call(valor, chave)) valor[chave] = decodificar(valor[chave]);
+      }
+    }
+    return valor;
+  }
+  ['newPlot', 'react'].forEach(function (metodo) {
+    var original = Plotly[metodo];
+    Plotly[metodo] = function (div, dados) {
+      decodificar(Array.isArray(dados) ? dados : (dados && dados.data) || []);
+      return original.apply(this, arguments);
+    };
+  });
+})();"""
+
+
+def binario_habilitado():
+    """Indica se a codificação binária está ativa (DASHBOARDS_BINARIO)."""
+    return os.environ.get('DASHBOARDS_BINARIO', '1').strip() != '0'
+
+
+def _array_numerico(valor):
+    """ndarray numérico para listas/tuplas/arrays só de números; senão None."""
+    if isinstance(valor, np.ndarray):
+        return valor if valor.dtype.kind in 'iuf' else None
+    if not isinstance(valor, (list, tuple)) or not valor:
+        return None
+    if isinstance(valor[0], (bool, np.bool_)) or not isinstance(valor[0], (int, float, np.number, list, tuple)):
+        return None  # descarta rápido listas de texto/datas sem converter tudo
+    try:
+        array = np.asarray(valor)
+    except ValueError:  # listas irregulares
+        return None
+    return array if array.dtype.kind in 'iuf' else None
+
+
+def _menor_tipo(array):
+    """Menor dtype little-endian compatível com os typed arrays do JavaScript."""
+    if array.dtype.kind == 'f':
+        return np.dtype('<f4') if array.dtype.itemsize <= 4 else np.dtype('<f8')
+    if not array.size:
+        return np.dtype('<i4')
+    minimo, maximo = int(array.min()), int(array.max())
+    for codigo in _TIPOS_INTEIROS:
+        info = np.iinfo(np.dtype(codigo))
+        if info.min <= minimo and maximo <= info.max:
+            return np.dtype('<' + codigo)
+    return np.dtype('<f8')  # int64 fora da faixa de 32 bits
+
+
+def codificar_array(array):
+    """Objeto {dtype, bdata[, shape]} com os bytes do array em base64."""
+    tipo = _menor_tipo(array)
+    dados = np.ascontiguousarray(array, dtype=tipo)
+    codificado = {'dtype': tipo.str[1:], 'bdata': base64.b64encode(dados.tobytes()).decode('ascii')}
+    if dados.ndim > 1:
+        codificado['shape'] = ', '.join(str(n) for n in dados.shape)
+    return codificado
+
+
+def decodificar_array(codificado):
+    """Inverso de codificar_array(): ndarray a partir de {dtype, bdata[, shape]}."""
+    array = np.frombuffer(base64.b64decode(codificado['bdata']), dtype='<' + codificado['dtype'])
+    if 'shape' in codificado:
+        array = array.reshape([int(n) for n in str(codificado['shape']).split(',')])
+    return array
+
+
+def decodificar_figura(valor):
+    """Cópia de `valor` com os objetos {dtype, bdata} já codificados de volta em ndarray."""
+    if isinstance(valor, dict):
+        if isinstance(valor.get('bdata'), str) and 'dtype' in valor:
+            return decodificar_array(valor)
+        return {chave: decodificar_figura(item) for chave, item in valor.items()}
+    if isinstance(valor, list):
+        return [decodificar_figura(item) for item in valor]
+    return valor
+
+
+def codificar_valor(valor, limite=LIMITE_BINARIO):
+    """`valor` em base64 se for um array numérico com `limite` elementos ou mais; senão `valor`."""
+    array = _array_numerico(valor)
+    if array is not None and array.size >= limite and array.ndim <= 2:
+        if array.dtype.kind != 'f' or np.isfinite(array).all():  # NaN/inf viram null no JSON
+            return codificar_array(array)
+    return valor
+
+
+def _codificar(valor, limite):
+    if isinstance(valor, dict):
+        return {chave: item if chave in CHAVES_TEXTO else _codificar(item, limite)
+                for chave, item in valor.items()}
+    codificado = codificar_valor(valor, limite)
+    if codificado is not valor:
+        return codificado
+    if isinstance(valor, (list, tuple)) and valor and isinstance(valor[0], dict):
+        return [_codificar(item, limite) for item in valor]
+    return valor
+
+
+def codificar_figura(fig, limite=LIMITE_BINARIO):
+    """
+    Dicionário da figura com os arrays numéricos dos traces em base64.
+
+    O layout fica como está; a figura original não é alterada.
+    """
+    dados = fig if isinstance(fig, dict) else fig.to_plotly_json()
+    codificada = dict(dados)
+    codificada['data'] = [_codificar(trace, limite) for trace in dados.get('data', [])]
+    return codificada
+
+
+def injetar_decodificador(html, sempre=False):
+    """
+    Insere DECODIFICADOR_JS antes do script que chama Plotly.newPlot (se houver
+    bdata ou com `sempre`, para HTML que recebe os dados depois).
+    """
+    posicao = html.find('Plotly.newPlot')
+    if posicao < 0 or not (sempre or '"bdata":' in html):
+        return html
+    inicio = html.rfind('<script', 0, posicao)
+    return (html[:inicio] + '<script type="text/javascript">' + DECODIFICADOR_JS + '</script>\n'
+            + html[inicio:])
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Build Paralelo dos Dashboards
+
+Encontra todos os módulos de gráficos em src/, renderiza cada um em um pool
+de processos (um worker por núcleo) e pula os gráficos cujo código e
+entradas não mudaram desde o último build.
+
+Um módulo de gráfico é qualquer arquivo NN_nome.py (exceto as versões
+*_commented.py) que defina:
+
+- SAIDA: nome do arquivo HTML gerado em docs/
+- construir_figura(): função que retorna a figura Plotly
+- ENTRADAS (opcional): lista de arquivos de dados, relativos à raiz do
+  repositório, que também entram no hash
+- salvar(fig, destino) (opcional): grava a figura e os arquivos que a
+  acompanham (ex.: detalhes do drill-down) no lugar de salvar_html()
+
+O hash de cada gráfico combina o código do módulo, o pacote comum/, a
+versão do Plotly, os modos de saída (DASHBOARDS_PLOTLYJS, _BINARIO, _DELTA,
+_FRAGMENTOS, _JSON e _LIMITE_WEBGL) e o conteúdo das ENTRADAS. O resultado fica em
+.cache/build_manifest.json, fora de docs/ para não ser publicado.
+
+Todos os dashboards são gerados a partir deste único processo: o plotly só é
+importado quando há algo para renderizar, e uma única vez (os workers
+criados por fork herdam os módulos já carregados; com -j 1 nem há pool).
+Rodar um interpretador por script custava mais em inicialização e imports
+do que a renderização em si.
+
+Uso:
+    python src/build.py              # build incremental em todos os núcleos
+    python src/build.py --forcar     # renderiza tudo novamente
+    python src/build.py -j 2         # limita o número de processos
+    python src/build.py -j 1 04 '0[12]*'   # seleção por nome/padrão, sem pool
+    python src/build.py --listar     # gráficos disponíveis
+"""
+
+import argparse
+import ast
+import fnmatch
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from comum.instrumentacao import etapa
+from comum.saida import DIR_DOCS, salvar_html
+
+DIR_RAIZ = Path(__file__).resolve().parents[2]
+DIR_SRC = DIR_RAIZ / 'src'
+DIR_COMUM = Path(__file__).resolve().parent
+ARQUIVO_MANIFESTO = DIR_RAIZ / '.cache' / 'build_manifest.json'
+
+
+def descobrir_graficos(raiz=DIR_SRC, ignorados=None):
+    """
+    Lista (ordenada) dos scripts NN_nome.py que definem construir_figura().
+    Os que não definem são acrescentados a `ignorados` (lista), se informada.
+    """
+    graficos = []
+    for caminho in sorted(Path(raiz).rglob('[0-9][0-9]_*.py')):
+        if caminho.stem.endswith('_commented'):
+            continue
+        arvore = ast.parse(caminho.read_text(encoding='utf-8'))
+        funcoes = {no.name for no in arvore.body if isinstance(no, ast.FunctionDef)}
+        if 'construir_figura' in funcoes:
+            graficos.append(caminho)
+        elif ignorados is not None:
+            ignorados.append(caminho)
+    return graficos
+
+
+def selecionar_graficos(nomes, raiz=DIR_SRC):
+    """
+    Resolve caminhos, nomes ('04_dashboard_mvp'), prefixos ('04') ou padrões
+    ('0[12]*') nos scripts de gráfico. ValueError se algum não corresponder.
+    """
+    disponiveis = descobrir_graficos(raiz)
+    selecionados = []
+    for nome in nomes:
+        caminho = Path(nome)
+        if caminho.is_file():
+            encontrados = [caminho.resolve()]
+        else:
+            encontrados = [g for g in disponiveis
+                           if fnmatch.fnmatch(g.stem, nome) or g.stem.startswith(nome)]
+        if not encontrados:
+            raise ValueError(f'Nenhum gráfico corresponde a {nome!r} (veja --listar)')
+        selecionados.extend(g for g in encontrados if g not in selecionados)
+    return selecionados
+
+
+def precarregar_plotly():
+    """Importa o plotly (inclusive plotly.offline, usado no HTML) e o template padrão."""
+    import plotly.graph_objects  # noqa: F401
+    import plotly.io as pio
+    import plotly.offline  # noqa: F401
+    import plotly.subplots  # noqa: F401
+
+    pio.templates[pio.templates.default]
+
+
+def _entradas_declaradas(caminho):
+    """Lê ENTRADAS do módulo sem importá-lo (apenas literais são aceitos)."""
+    arvore = ast.parse(caminho.read_text(encoding='utf-8'))
+    for no in arvore.body:
+        if isinstance(no, ast.Assign) and any(
+                isinstance(alvo, ast.Name) and alvo.id == 'ENTRADAS' for alvo in no.targets):
+            return list(ast.literal_eval(no.value))
+    return []
+
+
+def modos_saida():
+    """Modos de saída efetivos no ambiente: mudam o HTML de todos os gráficos."""
+    from comum.binario import binario_habilitado
+    from comum.delta import delta_habilitado
+    from comum.fragmentos import fragmentos_habilitados
+    from comum.json_rapido import motor_json
+    from comum.saida import modo_plotlyjs
+    from comum.traces import limite_webgl
+
+    return {'plotlyjs': modo_plotlyjs(), 'binario': binario_habilitado(), 'delta': delta_habilitado(),
+            'fragmentos': fragmentos_habilitados(), 'json': motor_json(), 'limite_webgl': limite_webgl()}
+
+
+def _hash_comum():
+    """Hash do pacote comum/, da versão do Plotly e dos modos de saída (afetam todos os gráficos)."""
+    from importlib.metadata import version
+
+    h = hashlib.sha256(version('plotly').encode())
+    h.update(json.dumps(modos_saida(), sort_keys=True).encode())
+    for arquivo in sorted(DIR_COMUM.rglob('*.py')):
+        h.update(arquivo.relative_to(DIR_COMUM).as_posix().encode())
+        h.update(arquivo.read_bytes())
+    return h.hexdigest()
+
+
+def hash_grafico(caminho, base):
+    """Hash do código do gráfico + entradas declaradas + hash comum `base`."""
+    h = hashlib.sha256(base.encode())
+    h.update(caminho.read_bytes())
+    for entrada in _entradas_declaradas(caminho):
+        arquivo = DIR_RAIZ / entrada
+        h.update(entrada.encode())
+        h.update(arquivo.read_bytes() if arquivo.exists() else b'<ausente>')
+    return h.hexdigest()
+
+
+def carregar_modulo(caminho):
+    """Importa um script NN_nome.py (nomes com dígito não são importáveis com import)."""
+    nome = f'dashboards_{caminho.stem}'
+    spec = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def renderizar(caminho, destino=DIR_DOCS):
+    """Executa construir_figura() e salva o HTML. Roda dentro dos workers."""
+    inicio = time.perf_counter()
+    with etapa('carregar_modulo'):
+        modulo = carregar_modulo(Path(caminho))
+    with etapa('construir_figura'):
+        fig = modulo.construir_figura()
+    if hasattr(modulo, 'salvar'):
+        saida = modulo.salvar(fig, destino)
+    else:
+        saida = salvar_html(fig, modulo.SAIDA, destino=destino)
+    return str(saida), time.perf_counter() - inicio
+
+
+def _renderizar_pendentes(pendentes, processos, destino):
+    """Gera (chave, (saida, duracao) ou exceção) para cada gráfico pendente."""
+    if processos == 1:
+        for chave, (caminho, _) in pendentes.items():
+            try:
+                yield chave, renderizar(caminho, destino)
+            except Exception as erro:  # um gráfico com erro não derruba o build
+                yield chave, erro
+        return
+
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        futuros = {pool.submit(renderizar, caminho, destino): chave
+                   for chave, (caminho, _) in pendentes.items()}
+        for futuro in as_completed(futuros):
+            try:
+                yield futuros[futuro], futuro.result()
+            except Exception as erro:
+                yield futuros[futuro], erro
+
+
+def _ler_manifesto():
+    try:
+        return json.loads(ARQUIVO_MANIFESTO.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _gravar_manifesto(manifesto):
+    ARQUIVO_MANIFESTO.parent.mkdir(parents=True, exist_ok=True)
+    temporario = ARQUIVO_MANIFESTO.with_suffix('.tmp')
+    temporario.write_text(json.dumps(manifesto, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(temporario, ARQUIVO_MANIFESTO)
+
+
+def construir(graficos=None, processos=None, forcar=False, destino=DIR_DOCS):
+    """
+    Renderiza os gráficos alterados em paralelo.
+
+    Retorna um dicionário {'gerados': [...], 'pulados': [...], 'falhas': {...}}
+    com os caminhos relativos à raiz do repositório.
+    """
+    graficos = descobrir_graficos() if graficos is None else selecionar_graficos(graficos)
+    manifesto = _ler_manifesto()
+    base = _hash_comum()
+
+    pendentes = {}
+    resultado = {'gerados': [], 'pulados': [], 'falhas': {}}
+    for caminho in graficos:
+        chave = caminho.relative_to(DIR_RAIZ).as_posix()
+        digest = hash_grafico(caminho, base)
+        anterior = manifesto.get(chave, {})
+        saida_existe = 'saida' in anterior and (DIR_RAIZ / anterior['saida']).is_file()
+        if not forcar and anterior.get('hash') == digest and saida_existe:
+            resultado['pulados'].append(chave)
+        else:
+            pendentes[chave] = (caminho, digest)
+
+    if pendentes:
+        # Antes do pool: os workers (fork) já nascem com o plotly importado
+        precarregar_plotly()
+        processos = min(processos or os.cpu_count() or 1, len(pendentes))
+        for chave, retorno in _renderizar_pendentes(pendentes, processos, destino):
+            if isinstance(retorno, Exception):
+                resultado['falhas'][chave] = f'{type(retorno).__name__}: {retorno}'
+                continue
+            saida, duracao = retorno
+            manifesto[chave] = {'hash': pendentes[chave][1],
+                                'saida': os.path.relpath(saida, DIR_RAIZ),
+                                'duracao_s': round(duracao, 3)}
+            resultado['gerados'].append(chave)
+        _gravar_manifesto(manifesto)
+
+    resultado['gerados'].sort()
+    return resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gera todos os dashboards de docs/ em paralelo.')
+    parser.add_argument('graficos', nargs='*',
+                        help='scripts, nomes, prefixos ou padrões (padrão: todos em src/)')
+    parser.add_argument('-j', '--processos', type=int, default=None,
+                        help='número de processos (padrão: todos os núcleos; 1 = sem pool)')
+    parser.add_argument('--forcar', action='store_true',
+                        help='ignora o manifesto e renderiza tudo')
+    parser.add_argument('--listar', action='store_true',
+                        help='lista os gráficos disponíveis e sai')
+    args = parser.parse_args(argv)
+
+    ignorados = []
+    disponiveis = descobrir_graficos(ignorados=ignorados)
+    for caminho in ignorados:
+        print(f"⚠️  {caminho.relative_to(DIR_RAIZ).as_posix()} ignorado (sem construir_figura())")
+    if args.listar:
+        for caminho in disponiveis:
+            print(caminho.relative_to(DIR_RAIZ).as_posix())
+        return 0
+
+    try:
+        resultado = construir(args.graficos or None, processos=args.processos, forcar=args.forcar)
+    except ValueError as erro:
+        print(f"❌ {erro}")
+        return 2
+    for chave in resultado['gerados']:
+        print(f"✅ {chave}")
+    for chave in resultado['pulados']:
+        print(f"⏭️  {chave} (sem alterações)")
+    for chave, erro in resultado['falhas'].items():
+        print(f"❌ {chave}: {erro}")
+    return 1 if resultado['falhas'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
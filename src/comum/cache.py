@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Cache de Renderização Endereçado por Conteúdo
+
+Guarda o HTML já serializado de cada figura em .cache/render/, indexado pelo
+hash da figura normalizada (dados + layout). Quando a figura não mudou, o
+HTML anterior é reaproveitado sem passar de novo pela serialização do Plotly
+e o arquivo em docs/ não é reescrito, evitando commits sem alteração real
+no GitHub Pages.
+
+Campos voláteis ficam fora do hash, por exemplo a anotação
+"Atualizado em: ..." do rodapé do dashboard MVP. Uma anotação é considerada
+volátil quando tem name='atualizado_em' ou quando o texto começa com
+"Atualizado em". Num acerto, a página continua com o rodapé da renderização
+guardada: "Atualizado em" passa a indicar quando os dados mudaram pela última
+vez, não o horário do build (é isso que evita regravar o arquivo). Os eixos
+não podem depender do relógio: o MVP usa horas cheias na série de tráfego.
+
+O tamanho em disco é limitado (padrão 256 MB, ajustável pela variável
+DASHBOARDS_CACHE_MB). Ao ultrapassar o limite, os itens usados há mais tempo
+são removidos (LRU pelo horário de modificação, atualizado a cada acerto).
+"""
+
+import copy
+import hashlib
+import os
+from pathlib import Path
+
+from comum.json_rapido import dumps
+
+DIR_CACHE = Path(__file__).resolve().parents[2] / '.cache' / 'render'
+LIMITE_PADRAO_MB = 256
+
+NOMES_VOLATEIS = {'atualizado_em'}
+PREFIXOS_VOLATEIS = ('Atualizado em',)
+
+
+def _anotacao_volatil(anotacao):
+    if anotacao.get('name') in NOMES_VOLATEIS:
+        return True
+    return str(anotacao.get('text', '')).startswith(PREFIXOS_VOLATEIS)
+
+
+def normalizar_figura(fig):
+    """Retorna o dicionário da figura sem os campos voláteis."""
+    dados = fig if isinstance(fig, dict) else fig.to_plotly_json()
+    dados = copy.deepcopy(dados)
+    layout = dados.get('layout', {})
+    if 'annotations' in layout:
+        layout['annotations'] = [a for a in layout['annotations'] if not _anotacao_volatil(a)]
+    return dados
+
+
+def hash_figura(fig, *extras):
+    """
+    Hash SHA-256 da figura normalizada.
+
+    `extras` são strings que também mudam o resultado final (modo de
+    inclusão do plotly.js, versão do Plotly etc.) e entram na chave.
+    """
+    texto = dumps(normalizar_figura(fig), ordenar=True)
+    h = hashlib.sha256(texto.encode('utf-8'))
+    for extra in extras:
+        h.update(b'\0' + str(extra).encode('utf-8'))
+    return h.hexdigest()
+
+
+class CacheRenderizacao:
+    """Armazenamento em disco de artefatos renderizados com despejo LRU."""
+
+    def __init__(self, diretorio=DIR_CACHE, limite_mb=None):
+        self.diretorio = Path(diretorio)
+        if limite_mb is None:
+            limite_mb = float(os.environ.get('DASHBOARDS_CACHE_MB', LIMITE_PADRAO_MB))
+        self.limite_bytes = int(limite_mb * 1024 * 1024)
+
+    def _caminho(self, chave, extensao):
+        return self.diretorio / f'{chave}.{extensao}'
+
+    def obter(self, chave, extensao='html'):
+        """Conteúdo em bytes do item, ou None se não estiver no cache."""
+        caminho = self._caminho(chave, extensao)
+        try:
+            conteudo = caminho.read_bytes()
+        except FileNotFoundError:
+            return None
+        # Marca o item como usado recentemente (ordem do LRU)
+        os.utime(caminho)
+        return conteudo
+
+    def guardar(self, chave, conteudo, extensao='html'):
+        """Grava o item de forma atômica e aplica o limite de tamanho."""
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        caminho = self._caminho(chave, extensao)
+        temporario = caminho.with_name(f'.{caminho.name}.{os.getpid()}.tmp')
+        temporario.write_bytes(conteudo)
+        os.replace(temporario, caminho)
+        self.despejar(manter=caminho)
+
+    def despejar(self, manter=None):
+        """Remove os itens menos usados até o cache caber no limite."""
+        itens = []
+        for caminho in self.diretorio.glob('*.*'):
+            if caminho.name.startswith('.'):
+                continue
+            try:
+                info = caminho.stat()
+            except FileNotFoundError:  # removido por outro processo
+                continue
+            itens.append((info.st_mtime, info.st_size, caminho))
+
+        total = sum(tamanho for _, tamanho, _ in itens)
+        for _, tamanho, caminho in sorted(itens, key=lambda item: item[0]):
+            if total <= self.limite_bytes:
+                break
+            if caminho == manter:
+                continue
+            caminho.unlink(missing_ok=True)
+            total -= tamanho
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Coletor SSH Concorrente de Interfaces e CPU
+
+Consulta muitos equipamentos por SSH ao mesmo tempo, com um pool limitado de
+workers, timeout por dispositivo e retentativas com espera exponencial. O
+resultado é convertido para as mesmas listas que o dashboard MVP usa
+(switches, interfaces_up, interfaces_down, dispositivos, cpu_percent).
+
+Comandos (Cisco IOS):
+    show ip interface brief                        -> interfaces UP/DOWN
+    show processes cpu | include CPU utilization   -> CPU (%) nos últimos 5 s
+
+Com um comum.pool_ssh.PoolSessoesSSH em `pool`, as sessões ficam abertas
+entre ciclos de coleta e o custo de handshake é pago uma única vez.
+
+Para testar sem equipamentos, use comum.ssh_falso.ServidorSSHFalso.
+
+Requer paramiko (pip install paramiko).
+"""
+
+import re
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+COMANDO_INTERFACES = 'show ip interface brief'
+COMANDO_CPU = 'show processes cpu | include CPU utilization'
+
+_REGEX_CPU = re.compile(r'CPU utilization for five seconds:\s*(\d+(?:\.\d+)?)%')
+
+
+@dataclass
+class Dispositivo:
+    """Equipamento a ser coletado. Só switches entram no painel de interfaces."""
+    nome: str
+    host: str
+    porta: int = 22
+    usuario: str = ''
+    senha: str = ''
+    papel: str = 'switch'
+
+
+@dataclass
+class ResultadoColeta:
+    """Resultado da coleta de um dispositivo (ok=False quando todas as tentativas falharam)."""
+    dispositivo: Dispositivo
+    ok: bool = False
+    interfaces_up: Optional[int] = None
+    interfaces_down: Optional[int] = None
+    cpu_percent: Optional[float] = None
+    erro: str = ''
+    tentativas: int = 0
+    duracao_s: float = 0.0
+    saidas: dict = field(default_factory=dict, repr=False)
+
+
+class ErroComando(Exception):
+    """O equipamento respondeu ao comando com erro."""
+
+
+def contar_interfaces(saida):
+    """Conta interfaces UP e DOWN na saída de `show ip interface brief`."""
+    up = down = 0
+    for linha in saida.splitlines():
+        campos = linha.split()
+        if len(campos) < 6 or campos[0] == 'Interface':
+            continue
+        # A última coluna é o protocolo (up/down); Status pode ter duas palavras
+        if campos[-1].lower() == 'up':
+            up += 1
+        else:
+            down += 1
+    return up, down
+
+
+def extrair_cpu(saida):
+    """CPU (%) dos últimos 5 segundos na saída de `show processes cpu`."""
+    encontrado = _REGEX_CPU.search(saida)
+    if not encontrado:
+        raise ValueError('Utilização de CPU não encontrada na saída do comando')
+    return float(encontrado.group(1))
+
+
+class ColetorSSH:
+    """
+    Executa os comandos em vários dispositivos em paralelo.
+
+    - max_workers: conexões simultâneas
+    - timeout: segundos para conectar, autenticar e para cada comando
+    - tentativas: total de tentativas por dispositivo (erros de autenticação
+      não são repetidos)
+    - espera_base: espera antes da 2ª tentativa (dobra a cada nova tentativa)
+    - pool: PoolSessoesSSH opcional para reaproveitar sessões entre coletas
+    """
+
+    def __init__(self, max_workers=50, timeout=10.0, tentativas=3, espera_base=0.5, pool=None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.espera_base = espera_base
+        self.pool = pool
+
+    # --- Sessões SSH ---
+
+    def abrir_sessao(self, dispositivo):
+        """Abre um paramiko.SSHClient autenticado no dispositivo."""
+        import paramiko
+
+        cliente = paramiko.SSHClient()
+        cliente.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        cliente.connect(dispositivo.host, port=dispositivo.porta,
+                        username=dispositivo.usuario, password=dispositivo.senha,
+                        timeout=self.timeout, banner_timeout=self.timeout,
+                        auth_timeout=self.timeout, look_for_keys=False, allow_agent=False)
+        return cliente
+
+    def executar(self, cliente, comando):
+        """Executa um comando e retorna a saída (texto)."""
+        _, stdout, stderr = cliente.exec_command(comando, timeout=self.timeout)
+        try:
+            saida = stdout.read().decode('utf-8', 'replace')
+            if stdout.channel.recv_exit_status() != 0:
+                raise ErroComando(stderr.read().decode('utf-8', 'replace').strip() or comando)
+        finally:
+            stdout.channel.close()
+        return saida
+
+    def _consultar(self, dispositivo):
+        """Uma tentativa completa: obtém a sessão e executa os comandos."""
+        if self.pool is not None:
+            with self.pool.sessao(dispositivo) as cliente:
+                return {comando: self.executar(cliente, comando)
+                        for comando in self.comandos(dispositivo)}
+
+        cliente = self.abrir_sessao(dispositivo)
+        try:
+            return {comando: self.executar(cliente, comando)
+                    for comando in self.comandos(dispositivo)}
+        finally:
+            cliente.close()
+
+    def comandos(self, dispositivo):
+        if dispositivo.papel == 'switch':
+            return (COMANDO_INTERFACES, COMANDO_CPU)
+        return (COMANDO_CPU,)
+
+    # --- Coleta ---
+
+    def coletar_dispositivo(self, dispositivo):
+        """Coleta um dispositivo com retentativas; nunca levanta exceção."""
+        import paramiko
+
+        resultado = ResultadoColeta(dispositivo)
+        inicio = time.perf_counter()
+        for tentativa in range(1, self.tentativas + 1):
+            resultado.tentativas = tentativa
+            try:
+                resultado.saidas = self._consultar(dispositivo)
+                self._interpretar(resultado)
+                resultado.ok, resultado.erro = True, ''
+                break
+            except paramiko.AuthenticationException as erro:
+                resultado.erro = f'Falha de autenticação: {erro}'
+                break
+            except (paramiko.SSHException, socket.timeout, OSError, EOFError,
+                    ErroComando, ValueError) as erro:
+                resultado.erro = f'{type(erro).__name__}: {erro}'
+                if tentativa < self.tentativas:
+                    time.sleep(self.espera_base * 2 ** (tentativa - 1))
+        resultado.duracao_s = time.perf_counter() - inicio
+        return resultado
+
+    def _interpretar(self, resultado):
+        saidas = resultado.saidas
+        if COMANDO_INTERFACES in saidas:
+            resultado.interfaces_up, resultado.interfaces_down = contar_interfaces(saidas[COMANDO_INTERFACES])
+        resultado.cpu_percent = extrair_cpu(saidas[COMANDO_CPU])
+
+    def coletar(self, dispositivos):
+        """Coleta todos os dispositivos em paralelo, na ordem recebida."""
+        dispositivos = list(dispositivos)
+        if not dispositivos:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(dispositivos))) as pool:
+            return list(pool.map(self.coletar_dispositivo, dispositivos))
+
+
+def dados_dashboard(resultados):
+    """
+    Converte os resultados nas listas usadas por construir_figura() do MVP.
+
+    Dispositivos com falha ficam de fora dos painéis.
+    """
+    dados = {'switches': [], 'interfaces_up': [], 'interfaces_down': [],
+             'dispositivos': [], 'cpu_percent': []}
+    for resultado in resultados:
+        if not resultado.ok:
+            continue
+        nome = resultado.dispositivo.nome
+        if resultado.interfaces_up is not None:
+            dados['switches'].append(nome)
+            dados['interfaces_up'].append(resultado.interfaces_up)
+            dados['interfaces_down'].append(resultado.interfaces_down)
+        dados['dispositivos'].append(nome)
+        dados['cpu_percent'].append(resultado.cpu_percent)
+    return dados
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Atualização Incremental (Delta) entre Versões de um Dashboard
+
+O dashboard MVP é regenerado a cada minuto, mas boa parte dos valores
+(distribuição de VLANs, contagem de interfaces) não muda. Com
+DASHBOARDS_DELTA=1, salvar_html() publica ao lado de NOME.html:
+
+- NOME.figura.json: {"versao": ..., "figura": {"data": [...], "layout": {...}}}
+- NOME.delta.json: {"de": versão anterior, "para": versão atual,
+  "operacoes": [...]}, um JSON Patch (RFC 6902: add/remove/replace) mínimo
+  entre a figura anterior e a atual
+
+e o HTML recebe um pequeno script (ATUALIZADOR_JS) que consulta o delta
+periodicamente: se o navegador tem a versão "de", aplica só as operações e
+redesenha com Plotly.react; se perdeu alguma versão (ou não há delta), baixa
+a figura completa. Telões sempre abertos deixam de baixar a figura inteira a
+cada minuto.
+
+A figura publicada usa a mesma representação do HTML (arrays grandes em
+base64 quando DASHBOARDS_BINARIO está ativo). A versão é o hash do JSON da
+figura, incluindo o rodapé "Atualizado em".
+"""
+
+import copy
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from comum.binario import codificar_figura
+from comum.json_rapido import dumps
+
+INTERVALO_PADRAO_S = 60
+
+ATUALIZADOR_JS = """(function () {
+  var COMPLETO = %(completo)s, DELTA = %(delta)s, INTERVALO = %(intervalo)d;
+  var versao = %(versao)s, estado = null, div = null;
+  function copia(valor) { return JSON.parse(JSON.stringify(valor)); }
+  function buscar(url) {
+    return fetch(url, {cache: 'no-cache'}).then(function (resposta) {
+      if (!resposta.ok) throw new Error(url + ': ' + resposta.status);
+      return resposta.json();
+    });
+  }
+  function aplicar(documento, operacoes) {
+    operacoes.forEach(function (op) {
+      var partes = op.path.split('/').slice(1).map(function (parte) {
+        return parte.replace(/~1/g, '/').replace(/~0/g, '~');
+      });
+      var chave = partes.pop(), alvo = documento;
+      partes.forEach(function (parte) { alvo = alvo[parte]; });
+      if (Array.isArray(alvo)) {
+        var i = chave === '-' ? alvo.length : Number(chave);
+        if (op.op === 'add') alvo.splice(i, 0, op.value);
+        else if (op.op === 'remove') alvo.splice(i, 1);
+        else alvo[i] = op.value;
+      } else if (op.op === 'remove') {
+        delete alvo[chave];
+      } else {
+        alvo[chave] = op.value;
+      }
+    });
+  }
+  function desenhar(figura, novaVersao) {
+    estado = figura;
+    versao = novaVersao;
+    return Plotly.react(div, copia(estado.data), copia(estado.layout));
+  }
+  function atualizar() {
+    buscar(DELTA).then(function (delta) {
+      if (delta.para === versao) return;
+      if (delta.de !== versao) throw new Error('versão ' + versao + ' sem delta');
+      var figura = copia(estado);
+      aplicar(figura, delta.operacoes);
+      return desenhar(figura, delta.para);
+    }).catch(function () {
+      return buscar(COMPLETO).then(function (completo) {
+        if (completo.versao !== versao) return desenhar(completo.figura, completo.versao);
+      });
+    }).catch(function (erro) { console.warn('Atualização do dashboard falhou:', erro); });
+  }
+  // Guarda a figura como chegou do servidor (antes do decodificador binário)
+  var original = Plotly.newPlot;
+  Plotly.newPlot = function (alvo, dados, layout) {
+    Plotly.newPlot = original;
+    div = alvo;
+    estado = copia({data: dados, layout: layout || {}});
+    setInterval(atualizar, INTERVALO * 1000);
+    return original.apply(this, arguments);
+  };
+})();"""
+
+
+def delta_habilitado():
+    """Indica se a figura e o delta são publicados junto com o HTML (DASHBOARDS_DELTA)."""
+    return os.environ.get('DASHBOARDS_DELTA', '0').strip() not in ('', '0')
+
+
+def _token(chave):
+    return str(chave).replace('~', '~0').replace('/', '~1')
+
+
+def _tamanho(valor):
+    return len(dumps(valor))
+
+
+def _deslocamento(anterior, atual, caminho, tentativas=8):
+    """
+    Janela deslizante (ex.: últimas 24h): `atual` começa com anterior[k:].
+    Vira k removes no início e adds no fim; None se não for o caso.
+    """
+    if not atual or not anterior:
+        return None
+    k = -1
+    for _ in range(tentativas):
+        try:
+            k = anterior.index(atual[0], k + 1)
+        except ValueError:
+            return None
+        restante = len(anterior) - k
+        if k and restante <= len(atual) and anterior[k:] == atual[:restante]:
+            return ([{'op': 'remove', 'path': f'{caminho}/0'}] * k
+                    + [{'op': 'add', 'path': f'{caminho}/-', 'value': valor} for valor in atual[restante:]])
+    return None
+
+
+def diferenca(anterior, atual, caminho=''):
+    """
+    Operações JSON Patch que transformam `anterior` em `atual`.
+
+    Dicionários e listas são comparados item a item. Para listas, fica a
+    menor entre: operações item a item, deslocamento de janela (removes no
+    início e adds no fim) e um único replace.
+    """
+    if anterior == atual:
+        return []
+    if isinstance(anterior, dict) and isinstance(atual, dict):
+        operacoes = [{'op': 'remove', 'path': f'{caminho}/{_token(chave)}'}
+                     for chave in anterior if chave not in atual]
+        for chave, valor in atual.items():
+            subcaminho = f'{caminho}/{_token(chave)}'
+            if chave in anterior:
+                operacoes.extend(diferenca(anterior[chave], valor, subcaminho))
+            else:
+                operacoes.append({'op': 'add', 'path': subcaminho, 'value': valor})
+        return operacoes
+    if isinstance(anterior, list) and isinstance(atual, list):
+        comum = min(len(anterior), len(atual))
+        operacoes = []
+        for i in range(comum):
+            operacoes.extend(diferenca(anterior[i], atual[i], f'{caminho}/{i}'))
+        operacoes.extend({'op': 'add', 'path': f'{caminho}/{i}', 'value': atual[i]}
+                         for i in range(comum, len(atual)))
+        operacoes.extend({'op': 'remove', 'path': f'{caminho}/{i}'}
+                         for i in reversed(range(comum, len(anterior))))
+        substituicao = [{'op': 'replace', 'path': caminho, 'value': atual}]
+        candidatas = [operacoes, _deslocamento(anterior, atual, caminho)]
+        if caminho:
+            candidatas.append(substituicao)
+        return min((c for c in candidatas if c is not None), key=_tamanho)
+    return [{'op': 'replace', 'path': caminho, 'value': atual}]
+
+
+def aplicar(documento, operacoes):
+    """Aplica as `operacoes` a uma cópia de `documento` e a devolve."""
+    documento = copy.deepcopy(documento)
+    for operacao in operacoes:
+        *partes, chave = [p.replace('~1', '/').replace('~0', '~') for p in operacao['path'].split('/')[1:]]
+        alvo = documento
+        for parte in partes:
+            alvo = alvo[int(parte) if isinstance(alvo, list) else parte]
+        if isinstance(alvo, list):
+            i = len(alvo) if chave == '-' else int(chave)
+            if operacao['op'] == 'add':
+                alvo.insert(i, operacao['value'])
+            elif operacao['op'] == 'remove':
+                del alvo[i]
+            else:
+                alvo[i] = operacao['value']
+        elif operacao['op'] == 'remove':
+            del alvo[chave]
+        else:
+            alvo[chave] = operacao['value']
+    return documento
+
+
+def arquivos_delta(caminho_html):
+    """(NOME.figura.json, NOME.delta.json) ao lado de `caminho_html`."""
+    caminho_html = Path(caminho_html)
+    return (caminho_html.with_name(f'{caminho_html.stem}.figura.json'),
+            caminho_html.with_name(f'{caminho_html.stem}.delta.json'))
+
+
+def _gravar_atomico(caminho, texto):
+    """Grava em arquivo temporário e renomeia: o navegador nunca baixa um JSON pela metade."""
+    temporario = caminho.with_name(f'.{caminho.name}.{os.getpid()}.tmp')
+    temporario.write_text(texto, encoding='utf-8')
+    os.replace(temporario, caminho)
+
+
+def publicar(fig, caminho_html, binario=True):
+    """
+    Grava a figura completa e o delta em relação à versão publicada antes.
+    Retorna a versão atual. Se a versão não mudou, nada é regravado.
+    """
+    dados = codificar_figura(fig) if binario else (fig if isinstance(fig, dict) else fig.to_plotly_json())
+    texto = dumps({'data': dados.get('data', []), 'layout': dados.get('layout', {})})
+    versao = hashlib.sha256(texto.encode('utf-8')).hexdigest()[:16]
+    caminho_figura, caminho_delta = arquivos_delta(caminho_html)
+
+    try:
+        anterior = json.loads(caminho_figura.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        anterior = None
+    if anterior is not None and anterior.get('versao') == versao:
+        return versao
+    if anterior is None:
+        caminho_delta.unlink(missing_ok=True)
+    else:
+        delta = {'de': anterior.get('versao'), 'para': versao,
+                 'operacoes': diferenca(anterior.get('figura'), json.loads(texto))}
+        _gravar_atomico(caminho_delta, dumps(delta))
+    _gravar_atomico(caminho_figura, f'{{"versao":"{versao}","figura":{texto}}}')
+    return versao
+
+
+def injetar_atualizador(html, caminho_html, versao, intervalo=INTERVALO_PADRAO_S):
+    """Insere ATUALIZADOR_JS antes do script que chama Plotly.newPlot."""
+    posicao = html.find('Plotly.newPlot')
+    if posicao < 0:
+        return html
+    caminho_figura, caminho_delta = arquivos_delta(caminho_html)
+    script = ATUALIZADOR_JS % {'completo': json.dumps(caminho_figura.name),
+                               'delta': json.dumps(caminho_delta.name),
+                               'versao': json.dumps(versao), 'intervalo': intervalo}
+    inicio = html.rfind('<script', 0, posicao)
+    return html[:inicio] + '<script type="text/javascript">' + script + '</script>\n' + html[inicio:]
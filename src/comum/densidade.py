@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Dispersão com Densidade: Pontos Brutos ou Histograma 2D + Pontos Isolados
+
+Um scatter com milhões de sondas (latência × perda de pacotes) vira uma
+mancha ilegível e um HTML de centenas de MB. resumir_dispersao() decide pelo
+tamanho:
+
+- Até `limite_pontos`: os próprios pontos.
+- Acima: histograma 2D calculado no servidor (contagem por célula, com
+  np.bincount sobre os índices das células) e, como pontos individuais, só
+  os isolados: sondas fora da faixa principal (acima do quantil `quantil`)
+  ou em células com no máximo `esparso` sondas. Os isolados são limitados
+  a `max_isolados`, mantendo os mais extremos.
+
+Com o limite de células e de isolados, o HTML fica em algumas centenas de KB
+seja qual for o número de sondas.
+"""
+
+import numpy as np
+
+LIMITE_PONTOS = 20_000
+BINS = (200, 100)          # (colunas em x, linhas em y)
+QUANTIL_FAIXA = 0.999
+ESPARSO = 2
+MAX_ISOLADOS = 5_000
+
+
+def _faixa(valores, quantil):
+    """(0 ou mínimo, quantil) dos valores; nunca um intervalo vazio."""
+    inicio = min(0.0, float(valores.min()))
+    fim = float(np.quantile(valores, quantil))
+    return inicio, fim if fim > inicio else inicio + 1.0
+
+
+def binar_2d(x, y, faixa_x, faixa_y, bins=BINS):
+    """
+    Índice da célula de cada ponto (-1 fora das faixas) e a contagem por
+    célula, em matriz (linhas em y, colunas em x).
+    """
+    nx, ny = bins
+    ix = np.floor((x - faixa_x[0]) * (nx / (faixa_x[1] - faixa_x[0]))).astype(np.int64)
+    iy = np.floor((y - faixa_y[0]) * (ny / (faixa_y[1] - faixa_y[0]))).astype(np.int64)
+    # O fim da faixa entra na última célula (como no np.histogram2d)
+    ix[x == faixa_x[1]] = nx - 1
+    iy[y == faixa_y[1]] = ny - 1
+    dentro = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+    celulas = np.where(dentro, iy * nx + ix, -1)
+    contagem = np.bincount(celulas[dentro], minlength=nx * ny)
+    return celulas, contagem.reshape(ny, nx)
+
+
+def resumir_dispersao(x, y, limite_pontos=LIMITE_PONTOS, bins=BINS, quantil=QUANTIL_FAIXA,
+                      esparso=ESPARSO, max_isolados=MAX_ISOLADOS):
+    """
+    Resumo da dispersão de (x, y) para desenho.
+
+    Retorna um dicionário com 'modo' ('pontos' ou 'densidade'), 'total' e
+    os pontos a desenhar ('x', 'y'). No modo densidade também traz 'z'
+    (contagem por célula, NaN nas vazias ou só com isolados), 'x_centros',
+    'y_centros' e 'descartados' (isolados além de `max_isolados`).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    validos = np.isfinite(x) & np.isfinite(y)
+    if not validos.all():
+        x, y = x[validos], y[validos]
+    if len(x) <= limite_pontos:
+        return {'modo': 'pontos', 'total': len(x), 'x': x, 'y': y}
+
+    faixa_x, faixa_y = _faixa(x, quantil), _faixa(y, quantil)
+    celulas, contagem = binar_2d(x, y, faixa_x, faixa_y, bins)
+
+    # Isolados: fora das faixas ou em células quase vazias
+    plana = contagem.ravel()
+    isolados = (celulas < 0) | (plana[np.maximum(celulas, 0)] <= esparso)
+    if esparso:
+        plana = np.where(plana <= esparso, 0, plana)
+    indices = np.flatnonzero(isolados)
+    descartados = max(len(indices) - max_isolados, 0)
+    if descartados:
+        # Mais extremos primeiro: maior distância relativa ao fim das faixas
+        extremo = np.maximum(x[indices] / faixa_x[1], y[indices] / faixa_y[1])
+        indices = indices[np.argpartition(-extremo, max_isolados - 1)[:max_isolados]]
+        indices.sort()
+
+    nx, ny = bins
+    largura_x = (faixa_x[1] - faixa_x[0]) / nx
+    largura_y = (faixa_y[1] - faixa_y[0]) / ny
+    z = plana.reshape(ny, nx).astype(np.float32)
+    z[z == 0] = np.nan
+    return {
+        'modo': 'densidade', 'total': len(x),
+        'x': x[indices], 'y': y[indices], 'descartados': descartados,
+        'z': z,
+        'x_centros': faixa_x[0] + largura_x * (np.arange(nx) + 0.5),
+        'y_centros': faixa_y[0] + largura_y * (np.arange(ny) + 0.5),
+    }
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Esqueleto de Dashboard: HTML Pré-compilado com Campos Substituíveis
+
+Para gerar o mesmo dashboard para centenas de sites, montar a figura inteira
+(subplots, eixos, cores, anotações) e serializar o layout para cada site
+repete o mesmo trabalho centenas de vezes. O Esqueleto faz isso uma vez só:
+
+    esqueleto = Esqueleto(construir_figura(), {'y_trafego': [('data', 0, 'y')], ...})
+    html = esqueleto.renderizar({'y_trafego': [...], ...})
+
+Na criação, cada campo da figura é trocado por um marcador, a figura é
+serializada para HTML e o texto é quebrado nos marcadores. Por site resta
+apenas serializar os valores dos campos e juntar as partes: o custo passa a
+depender do tamanho dos dados, não da complexidade do layout.
+
+Um campo pode apontar para vários caminhos (ex.: y e text do mesmo trace).
+Com DASHBOARDS_BINARIO ativo, arrays numéricos grandes dos traces vão em
+base64 como em salvar_html(), e o decodificador já fica no esqueleto.
+
+gerar_sites() renderiza muitos sites em paralelo; o esqueleto é enviado uma
+vez para cada worker e a preparação dos dados de cada site (ex.: redução da
+série de tráfego) também roda nos workers.
+"""
+
+import copy
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from comum.binario import CHAVES_TEXTO, binario_habilitado, codificar_valor, injetar_decodificador
+from comum.figura import validacao_habilitada, validar
+from comum.json_rapido import para_json_plotly, usando_motor
+from comum.saida import MODO_COMPARTILHADO, garantir_plotlyjs, gravar_se_mudou, modo_plotlyjs
+
+_MARCADOR = '@@campo:{}@@'
+_PADRAO_MARCADOR = re.compile(r'"@@campo:(\w+)@@"')
+
+
+def _definir(alvo, caminho, valor):
+    for parte in caminho[:-1]:
+        alvo = alvo[parte]
+    alvo[caminho[-1]]  # KeyError/IndexError se o caminho não existir
+    alvo[caminho[-1]] = valor
+
+
+class Esqueleto:
+    """HTML de uma figura com campos de dados substituíveis por valores novos."""
+
+    def __init__(self, fig, campos, include_plotlyjs=True, binario=None):
+        import plotly.io as pio
+
+        self.binario = binario_habilitado() if binario is None else binario
+        figura = copy.deepcopy(dict(fig) if isinstance(fig, dict) else fig.to_plotly_json())
+        if validacao_habilitada():
+            validar(figura)
+
+        self.codificaveis = set()
+        for nome, caminhos in campos.items():
+            for caminho in caminhos:
+                try:
+                    _definir(figura, caminho, _MARCADOR.format(nome))
+                except (KeyError, IndexError, TypeError):
+                    raise ValueError(f'Campo {nome!r}: caminho inexistente na figura: {caminho}') from None
+            # Mesmo critério de codificar_figura(): só traces, e nunca atributos de texto
+            if all(c[0] == 'data' and c[-1] not in CHAVES_TEXTO for c in caminhos):
+                self.codificaveis.add(nome)
+
+        with usando_motor():
+            html = pio.to_html(figura, include_plotlyjs=include_plotlyjs, validate=False)
+        if self.binario:
+            html = injetar_decodificador(html, sempre=True)
+
+        # Partes pares: texto fixo; ímpares: nomes dos campos
+        self.partes = _PADRAO_MARCADOR.split(html)
+        self.campos = frozenset(self.partes[1::2])
+        ausentes = set(campos) - self.campos
+        if ausentes:
+            raise ValueError(f"Campo(s) sem marcador no HTML: {', '.join(sorted(ausentes))}")
+
+    def _serializar(self, nome, valor):
+        if self.binario and nome in self.codificaveis:
+            valor = codificar_valor(valor)
+        return para_json_plotly(valor)
+
+    def renderizar(self, valores):
+        """HTML (bytes) com os `valores` ({campo: valor}) no lugar dos campos."""
+        faltando = self.campos - set(valores)
+        if faltando:
+            raise ValueError(f"Valores ausentes para: {', '.join(sorted(faltando))}")
+        serializados = {nome: self._serializar(nome, valores[nome]) for nome in self.campos}
+        partes = list(self.partes)
+        for i in range(1, len(partes), 2):
+            partes[i] = serializados[partes[i]]
+        return ''.join(partes).encode('utf-8')
+
+
+# --- Geração em paralelo ---
+
+_worker = {}
+
+
+def _iniciar_worker(esqueleto, preparar):
+    _worker.update(esqueleto=esqueleto, preparar=preparar)
+
+
+def _gerar_site(tarefa):
+    nome, dados, destino = tarefa
+    valores = _worker['preparar'](dados) if _worker['preparar'] else dados
+    caminho = Path(destino) / f'{nome}.html'
+    gravar_se_mudou(caminho, _worker['esqueleto'].renderizar(valores))
+    return str(caminho)
+
+
+def gerar_sites(criar_esqueleto, sites, destino, processos=None, preparar=None):
+    """
+    Grava `destino/<site>.html` para cada (site, dados) de `sites`.
+
+    `criar_esqueleto(include_plotlyjs)` monta o Esqueleto uma única vez; no
+    modo compartilhado o plotly.js é gravado em `destino`. `preparar(dados)`,
+    se informado, roda nos workers e devolve os valores dos campos; sem ele,
+    `dados` já são os valores. Retorna a lista de arquivos gerados.
+    """
+    destino = Path(destino)
+    destino.mkdir(parents=True, exist_ok=True)
+    include_plotlyjs = garantir_plotlyjs(destino) if modo_plotlyjs() == MODO_COMPARTILHADO else True
+    esqueleto = criar_esqueleto(include_plotlyjs)
+
+    tarefas = ((nome, dados, destino) for nome, dados in sites)
+    processos = processos or os.cpu_count() or 1
+    if processos == 1:
+        _iniciar_worker(esqueleto, preparar)
+        return [_gerar_site(tarefa) for tarefa in tarefas]
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_worker,
+                             initargs=(esqueleto, preparar)) as pool:
+        return list(pool.map(_gerar_site, tarefas, chunksize=8))
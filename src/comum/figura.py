@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Construção de Figuras como Dicionários (sem validação a cada propriedade)
+
+go.Figure(), add_trace(go.Bar(...)) e update_layout(...) passam cada
+propriedade pelos validadores do plotly. Com milhares de traces essa
+validação custa mais do que os próprios dados. FiguraDict monta a mesma
+especificação (data + layout) diretamente em dicionários, com uma API
+parecida com a do go.Figure:
+
+    fig = FiguraDict.subplots(rows=2, cols=2, subplot_titles=(...))
+    fig.add_trace('bar', x=switches, y=interfaces_up, name='UP', row=1, col=2)
+    fig.update_layout(title_text='Dashboard', plot_bgcolor='#F8F9FA')
+
+- Nomes com sublinhado viram caminhos (xaxis_title_text -> xaxis.title.text),
+  como no plotly; títulos em texto viram {'text': ...}.
+- O template padrão do plotly é aplicado como no go.Figure.
+- Os subplots são calculados uma única vez pelo make_subplots (só o layout).
+- A validação completa (go.Figure(fig)) roda uma vez, na exportação, apenas
+  com DASHBOARDS_VALIDAR=1 (modo de depuração/testes).
+
+FiguraDict é um dict {'data': [...], 'layout': {...}}: salvar_html(),
+o cache e pio.to_html(fig, validate=False) aceitam a figura diretamente.
+"""
+
+import copy
+import os
+import re
+from functools import lru_cache
+
+# Propriedades do plotly que têm sublinhado no próprio nome
+PROPRIEDADES_COM_SUBLINHADO = frozenset({
+    'error_x', 'error_y', 'error_z', 'plot_bgcolor', 'paper_bgcolor',
+    'copy_xstyle', 'copy_ystyle', 'copy_zstyle',
+})
+
+
+def validacao_habilitada():
+    """Indica se as figuras em dicionário são validadas na exportação (DASHBOARDS_VALIDAR)."""
+    return os.environ.get('DASHBOARDS_VALIDAR', '0').strip() not in ('', '0')
+
+
+@lru_cache(maxsize=None)
+def _template(nome):
+    import plotly.io as pio
+
+    return pio.templates[nome].to_plotly_json()
+
+
+def template(nome=None):
+    """Dicionário do template `nome` (padrão: o template padrão do plotly)."""
+    import plotly.io as pio
+
+    nome = nome or pio.templates.default
+    return copy.deepcopy(_template(nome)) if nome else {}
+
+
+def _caminho(chave):
+    if chave in PROPRIEDADES_COM_SUBLINHADO or '_' not in chave:
+        return [chave]
+    for literal in PROPRIEDADES_COM_SUBLINHADO:
+        if chave.startswith(literal + '_'):
+            return [literal] + _caminho(chave[len(literal) + 1:])
+    primeiro, resto = chave.split('_', 1)
+    return [primeiro] + _caminho(resto)
+
+
+def _normalizar(chave, valor):
+    if chave == 'title' and isinstance(valor, str):
+        return {'text': valor}
+    if isinstance(valor, dict):
+        return expandir(valor)
+    return valor
+
+
+def mesclar(destino, origem):
+    """Mescla `origem` em `destino` recursivamente (dicionários aninhados)."""
+    for chave, valor in origem.items():
+        if isinstance(valor, dict) and isinstance(destino.get(chave), dict):
+            mesclar(destino[chave], valor)
+        else:
+            destino[chave] = valor
+    return destino
+
+
+def expandir(propriedades):
+    """Converte nomes com sublinhado em dicionários aninhados."""
+    resultado = {}
+    for chave, valor in propriedades.items():
+        *caminho, ultima = _caminho(chave)
+        alvo = resultado
+        for parte in caminho:
+            alvo = alvo.setdefault(parte, {})
+        mesclar(alvo, {ultima: _normalizar(ultima, valor)})
+    return resultado
+
+
+def validar(fig):
+    """Valida a figura completa com os validadores do plotly (ValueError se inválida)."""
+    import plotly.graph_objects as go
+
+    from comum.binario import decodificar_figura
+
+    # Arrays já codificados pelos scripts (ex.: z_compacto) voltam a ndarray:
+    # os validadores do plotly 5.18 não conhecem {dtype, bdata}
+    go.Figure(decodificar_figura(dict(fig)))
+
+
+class FiguraDict(dict):
+    """Figura Plotly como dicionário, com os métodos de construção mais usados."""
+
+    def __init__(self, data=None, layout=None):
+        super().__init__(data=list(data or []), layout={'template': template()})
+        self._subplots = {}
+        if layout:
+            self.update_layout(**layout)
+
+    @classmethod
+    def subplots(cls, rows=1, cols=1, **opcoes):
+        """Grade de subplots com o mesmo layout do plotly.subplots.make_subplots."""
+        from plotly.subplots import make_subplots
+
+        base = make_subplots(rows=rows, cols=cols, **opcoes)
+        fig = cls()
+        fig['layout'] = base.layout.to_plotly_json()
+        for linha in range(1, rows + 1):
+            for coluna in range(1, cols + 1):
+                subplot = base.get_subplot(linha, coluna)
+                if subplot is None:
+                    continue
+                if hasattr(subplot, 'xaxis'):
+                    fig._subplots[linha, coluna] = {
+                        'xaxis': subplot.xaxis.plotly_name.replace('axis', ''),
+                        'yaxis': subplot.yaxis.plotly_name.replace('axis', ''),
+                    }
+                elif hasattr(subplot, 'x'):
+                    fig._subplots[linha, coluna] = {'domain': {'x': list(subplot.x), 'y': list(subplot.y)}}
+        return fig
+
+    @property
+    def data(self):
+        return self['data']
+
+    @property
+    def layout(self):
+        return self['layout']
+
+    def _referencias(self, row, col):
+        if row is None and col is None:
+            return {}
+        try:
+            return copy.deepcopy(self._subplots[row, col])
+        except KeyError:
+            raise ValueError(f'Subplot inexistente ou sem suporte: row={row}, col={col}') from None
+
+    def add_trace(self, tipo, row=None, col=None, **propriedades):
+        """Adiciona um trace `tipo` ('scatter', 'bar'...) ou um dicionário de trace pronto."""
+        trace = dict(tipo) if isinstance(tipo, dict) else {'type': tipo}
+        mesclar(trace, expandir(propriedades))
+        mesclar(trace, self._referencias(row, col))
+        self['data'].append(trace)
+        return self
+
+    def update_traces(self, selector=None, **propriedades):
+        expandidas = expandir(propriedades)
+        for trace in self['data']:
+            if all(trace.get(chave) == valor for chave, valor in (selector or {}).items()):
+                mesclar(trace, copy.deepcopy(expandidas))
+        return self
+
+    def update_layout(self, **propriedades):
+        if isinstance(propriedades.get('template'), str):
+            self['layout']['template'] = template(propriedades.pop('template'))
+        mesclar(self['layout'], expandir(propriedades))
+        return self
+
+    def _update_eixo(self, eixo, row, col, propriedades):
+        if row is not None or col is not None:
+            nomes = [self._referencias(row, col)[eixo].replace(eixo[0], eixo, 1)]
+        else:
+            # Como no go.Figure: sem row/col, todos os eixos do tipo
+            nomes = [nome for nome in self['layout'] if re.fullmatch(f'{eixo}[0-9]*', nome)] or [eixo]
+        for nome in nomes:
+            mesclar(self['layout'].setdefault(nome, {}), expandir(propriedades))
+        return self
+
+    def update_xaxes(self, row=None, col=None, **propriedades):
+        return self._update_eixo('xaxis', row, col, propriedades)
+
+    def update_yaxes(self, row=None, col=None, **propriedades):
+        return self._update_eixo('yaxis', row, col, propriedades)
+
+    def add_annotation(self, **propriedades):
+        self['layout'].setdefault('annotations', []).append(expandir(propriedades))
+        return self
+
+    # --- Compatibilidade com o go.Figure na exportação ---
+
+    def to_plotly_json(self):
+        return {'data': self['data'], 'layout': self['layout']}
+
+    def validar(self):
+        validar(self)
+        return self
+
+    def to_html(self, **opcoes):
+        import plotly.io as pio
+
+        if validacao_habilitada():
+            self.validar()
+        return pio.to_html(self.to_plotly_json(), validate=False, **opcoes)
+
+    def write_html(self, arquivo, **opcoes):
+        import plotly.io as pio
+
+        if validacao_habilitada():
+            self.validar()
+        return pio.write_html(self.to_plotly_json(), arquivo, validate=False, **opcoes)
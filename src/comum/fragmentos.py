@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Dashboard em Fragmentos Carregados sob Demanda
+
+Um dashboard de subplots vira um HTML único: o navegador precisa baixar e
+interpretar os dados de todos os painéis antes de desenhar o primeiro. Com
+DASHBOARDS_FRAGMENTOS=1, salvar_html() grava em vez disso:
+
+- NOME.html: uma casca pequena com o título, uma div por painel e o painel
+  crítico (o primeiro, no canto superior esquerdo) embutido
+- NOME.paineis/<n>.json: a figura de cada um dos demais painéis
+
+e a casca (CASCA_JS) só baixa e desenha um painel quando ele se aproxima da
+área visível (IntersectionObserver). O primeiro gráfico aparece sem esperar
+pelo resto da página.
+
+dividir_paineis() separa a figura de subplots: traces do mesmo par de eixos
+(ou com `domain` próprio, como a pizza) formam um painel, que recebe os eixos
+sem `domain` e o título do subplot mais próximo. As demais anotações (ex.:
+"Atualizado em") vão para o rodapé da casca. O modo delta (comum.delta) não
+se aplica aos fragmentos; figuras de um painel só e páginas com
+`post_script` (drill-down) continuam em um HTML único.
+"""
+
+import html
+import os
+from pathlib import Path
+
+from comum.binario import DECODIFICADOR_JS, codificar_figura
+from comum.json_rapido import dumps
+
+ALTURA_PAINEL = 450
+
+# Chaves do layout que pertencem à figura inteira, não a um painel
+_CHAVES_GLOBAIS = ('annotations', 'title', 'height', 'width', 'grid', 'shapes', 'images')
+
+CASCA_HTML = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>%(titulo)s</title>
+<style>
+body { margin: 0; font-family: Arial, sans-serif; background: %(fundo)s; }
+h1 { text-align: center; color: #2C3E50; font-size: 26px; margin: 20px 10px; }
+.paineis { display: grid; grid-template-columns: repeat(auto-fit, minmax(520px, 1fr)); gap: 16px; padding: 0 16px; }
+.painel { min-height: %(altura)dpx; }
+footer { text-align: center; color: #7F8C8D; font-size: 11px; margin: 16px; }
+</style>
+%(plotlyjs)s
+</head>
+<body>
+<h1>%(titulo)s</h1>
+<div class="paineis">
+%(divs)s
+</div>
+<footer>%(rodape)s</footer>
+<script type="application/json" id="painel-critico">%(critico)s</script>
+<script type="text/javascript">%(decodificador)s</script>
+<script type="text/javascript">%(casca)s</script>
+</body>
+</html>
+"""
+
+CASCA_JS = """(function () {
+  var CONFIG = {responsive: true}, template;
+  function desenhar(div, figura) {
+    figura.layout.template = figura.layout.template || template;
+    return Plotly.newPlot(div, figura.data, figura.layout, CONFIG);
+  }
+  function carregar(div) {
+    fetch(div.getAttribute('data-src')).then(function (resposta) {
+      if (!resposta.ok) throw new Error(div.getAttribute('data-src') + ': ' + resposta.status);
+      return resposta.json();
+    }).then(function (figura) { return desenhar(div, figura); })
+      .catch(function (erro) { console.warn('Painel indisponível:', erro); });
+  }
+  // Painel crítico: já está na página, desenha sem esperar nada
+  var critico = JSON.parse(document.getElementById('painel-critico').textContent);
+  template = critico.layout.template;
+  desenhar(document.getElementById('painel-0'), critico);
+  var pendentes = document.querySelectorAll('.painel[data-src]');
+  if (!('IntersectionObserver' in window)) {
+    Array.prototype.forEach.call(pendentes, carregar);
+    return;
+  }
+  var observador = new IntersectionObserver(function (entradas) {
+    entradas.forEach(function (entrada) {
+      if (!entrada.isIntersecting) return;
+      observador.unobserve(entrada.target);
+      carregar(entrada.target);
+    });
+  }, {rootMargin: '200px'});
+  Array.prototype.forEach.call(pendentes, function (div) { observador.observe(div); });
+})();"""
+
+
+def fragmentos_habilitados():
+    """Indica se os dashboards são gravados em fragmentos (DASHBOARDS_FRAGMENTOS)."""
+    return os.environ.get('DASHBOARDS_FRAGMENTOS', '0').strip() not in ('', '0')
+
+
+def _texto(valor):
+    return valor.get('text', '') if isinstance(valor, dict) else (valor or '')
+
+
+def _grupo(trace, i):
+    """Chave do painel de um trace: o par de eixos ou, com `domain`, o próprio trace."""
+    if 'domain' in trace:
+        return ('domain', i)
+    return (trace.get('xaxis', 'x'), trace.get('yaxis', 'y'))
+
+
+def _eixo(layout, referencia):
+    """'x2' -> layout['xaxis2']."""
+    return layout.get(f'{referencia[0]}axis{referencia[1:]}', {})
+
+
+def _posicao(layout, grupo, trace):
+    """(centro em x, topo em y) do painel, em coordenadas do papel."""
+    if grupo[0] == 'domain':
+        dominio_x = trace['domain'].get('x', [0, 1])
+        dominio_y = trace['domain'].get('y', [0, 1])
+    else:
+        dominio_x = _eixo(layout, grupo[0]).get('domain', [0, 1])
+        dominio_y = _eixo(layout, grupo[1]).get('domain', [0, 1])
+    return (dominio_x[0] + dominio_x[1]) / 2, dominio_y[1]
+
+
+def varios_paineis(fig):
+    """Indica se a figura tem mais de um painel (só essas são fragmentadas)."""
+    dados = fig if isinstance(fig, dict) else fig.to_plotly_json()
+    return len({_grupo(trace, i) for i, trace in enumerate(dados.get('data', []))}) > 1
+
+
+def dividir_paineis(fig, altura=ALTURA_PAINEL):
+    """
+    Separa uma figura de subplots em figuras independentes, uma por painel.
+
+    Retorna (título, rodapé, [figuras]) com os painéis de cima para baixo e
+    da esquerda para a direita.
+    """
+    dados = fig if isinstance(fig, dict) else fig.to_plotly_json()
+    layout = dados.get('layout', {})
+    anotacoes = layout.get('annotations', [])
+    # Títulos dos subplots (make_subplots): centralizados acima de cada painel
+    titulos = [a for a in anotacoes
+               if a.get('yanchor') == 'bottom' and a.get('xanchor') == 'center' and not a.get('name')]
+    rodape = [a for a in anotacoes if not any(a is t for t in titulos)]
+    base = {chave: valor for chave, valor in layout.items()
+            if chave not in _CHAVES_GLOBAIS and not chave.startswith(('xaxis', 'yaxis'))}
+
+    grupos = {}
+    for i, trace in enumerate(dados.get('data', [])):
+        grupos.setdefault(_grupo(trace, i), []).append(trace)
+
+    paineis = []
+    livres = list(titulos)
+    for grupo, traces in grupos.items():
+        x, topo = _posicao(layout, grupo, traces[0])
+        painel = {'data': [], 'layout': dict(base, height=altura)}
+        if grupo[0] == 'domain':
+            painel['data'] = [{k: v for k, v in trace.items() if k != 'domain'} for trace in traces]
+        else:
+            painel['data'] = [{k: v for k, v in trace.items() if k not in ('xaxis', 'yaxis')}
+                              for trace in traces]
+            for nome, referencia in (('xaxis', grupo[0]), ('yaxis', grupo[1])):
+                painel['layout'][nome] = {k: v for k, v in _eixo(layout, referencia).items()
+                                          if k not in ('domain', 'anchor')}
+        if livres:
+            titulo = min(livres, key=lambda a: (a.get('x', 0) - x) ** 2 + (a.get('y', 0) - topo) ** 2)
+            livres.remove(titulo)
+            painel['layout']['title'] = {'text': titulo.get('text', ''), 'x': 0.5}
+        # Topo arredondado: a pizza (domain próprio) fica na mesma linha do subplot vizinho
+        paineis.append(((-round(topo, 1), x), painel))
+
+    paineis.sort(key=lambda item: item[0])
+    return (_texto(layout.get('title')), ' · '.join(a.get('text', '') for a in rodape),
+            [painel for _, painel in paineis])
+
+
+def pasta_paineis(caminho_html):
+    """Pasta NOME.paineis/ ao lado de `caminho_html`."""
+    caminho_html = Path(caminho_html)
+    return caminho_html.with_name(f'{caminho_html.stem}.paineis')
+
+
+def _json_painel(painel, binario, template=True):
+    if not template:
+        # Os painéis baixados depois usam o template do painel crítico
+        painel = dict(painel, layout={k: v for k, v in painel['layout'].items() if k != 'template'})
+    return dumps(codificar_figura(painel) if binario else painel)
+
+
+def renderizar_casca(fig, caminho_html, include_plotlyjs, binario=True):
+    """
+    HTML da casca (bytes) e {nome do arquivo: JSON} dos painéis carregados
+    sob demanda. `include_plotlyjs` é o nome do asset compartilhado ou True
+    (biblioteca embutida).
+    """
+    dados = fig if isinstance(fig, dict) else fig.to_plotly_json()
+    titulo, rodape, paineis = dividir_paineis(dados)
+    pasta = pasta_paineis(caminho_html).name
+    arquivos = {f'{i}.json': _json_painel(painel, binario, template=False)
+                for i, painel in enumerate(paineis[1:], 1)}
+    divs = ['<div class="painel" id="painel-0"></div>']
+    divs += [f'<div class="painel" id="painel-{i}" data-src="{pasta}/{nome}"></div>'
+             for i, nome in enumerate(arquivos, 1)]
+
+    if include_plotlyjs is True:
+        from plotly.offline import get_plotlyjs
+
+        plotlyjs = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+    else:
+        plotlyjs = f'<script src="{html.escape(include_plotlyjs)}"></script>'
+    critico = _json_painel(paineis[0], binario) if paineis else '{"data": [], "layout": {}}'
+    pagina = CASCA_HTML % {
+        'titulo': html.escape(titulo),
+        'fundo': html.escape(str(dados.get('layout', {}).get('paper_bgcolor', 'white'))),
+        'altura': ALTURA_PAINEL,
+        'plotlyjs': plotlyjs,
+        'divs': '\n'.join(divs),
+        'rodape': html.escape(rodape),
+        # '</' encerraria o <script> antes da hora
+        'critico': critico.replace('</', '<\\/'),
+        'decodificador': DECODIFICADOR_JS,
+        'casca': CASCA_JS,
+    }
+    return pagina.encode('utf-8'), arquivos
+
+
+def salvar_fragmentos(fig, caminho_html, include_plotlyjs, binario=True):
+    """Grava a casca em `caminho_html` e os painéis em NOME.paineis/ (só o que mudou)."""
+    from comum.saida import gravar_se_mudou
+
+    pagina, arquivos = renderizar_casca(fig, caminho_html, include_plotlyjs, binario)
+    pasta = pasta_paineis(caminho_html)
+    pasta.mkdir(parents=True, exist_ok=True)
+    for nome, conteudo in arquivos.items():
+        gravar_se_mudou(pasta / nome, conteudo.encode('utf-8'))
+    for antigo in pasta.glob('*.json'):
+        if antigo.name not in arquivos:
+            antigo.unlink()
+    gravar_se_mudou(caminho_html, pagina)
+    return caminho_html
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Matriz Dispositivo × Tempo para Heatmaps de Utilização
+
+Transforma amostras no formato longo (dispositivo, horário, valor), como
+chegam dos coletores, na matriz de um heatmap: uma linha por dispositivo,
+uma coluna por intervalo de tempo. Tudo é vetorizado (pd.factorize +
+np.bincount/np.maximum.at), sem laços em Python: 5.000 dispositivos ×
+1.440 minutos (7,2M amostras) viram matriz em menos de 0,5 s.
+
+- As colunas são agregadas no servidor para a resolução exibida: o intervalo
+  de cada coluna é um múltiplo de 1 minuto que dá no máximo `largura_px`
+  colunas (1.440 minutos em 1.000 px -> colunas de 2 minutos).
+- As linhas são ordenadas por um índice calculado sobre as amostras brutas:
+  pico ('pico') ou média ('media') de cada dispositivo, do maior para o menor.
+- Células sem amostra ficam NaN (lacunas no heatmap).
+
+Para milhões de amostras, passe os dispositivos como pd.Categorical (ou
+Series category): fatorar strings custa mais que todo o resto.
+"""
+
+import numpy as np
+import pandas as pd
+
+from comum.binario import binario_habilitado, codificar_array
+
+AGREGADOS = ('avg', 'max')
+ORDENACOES = ('pico', 'media')
+LARGURA_PADRAO_PX = 1000
+
+
+def passo_colunas(duracao_s, largura_px=LARGURA_PADRAO_PX, minimo_s=60):
+    """Intervalo (s) de cada coluna: múltiplo de `minimo_s` com no máximo `largura_px` colunas."""
+    return max(1, -(-int(duracao_s) // (largura_px * minimo_s))) * minimo_s
+
+
+def _por_dispositivo(codigos, valores, n, ordenar):
+    """Pico ou média de cada dispositivo nas amostras brutas."""
+    if ordenar == 'pico':
+        indice = np.full(n, -np.inf)
+        np.maximum.at(indice, codigos, valores)
+        return indice
+    contagem = np.bincount(codigos, minlength=n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.bincount(codigos, weights=valores, minlength=n) / contagem
+
+
+def matriz_utilizacao(dispositivos, tempos, valores, inicio=None, fim=None,
+                      largura_px=LARGURA_PADRAO_PX, agregado='avg', ordenar='pico'):
+    """
+    Pivota as amostras em uma matriz dispositivo × tempo.
+
+    Retorna (nomes das linhas, início de cada coluna em datetime64[s],
+    matriz float com NaN nas células vazias, intervalo das colunas em s).
+    `agregado` ('avg' ou 'max') combina as amostras de uma mesma célula;
+    `ordenar` ('pico', 'media' ou None) define a ordem das linhas.
+    """
+    if agregado not in AGREGADOS:
+        raise ValueError(f"Agregado inválido: {agregado!r} (use {', '.join(AGREGADOS)})")
+    if ordenar is not None and ordenar not in ORDENACOES:
+        raise ValueError(f"Ordenação inválida: {ordenar!r} (use {', '.join(ORDENACOES)})")
+
+    codigos, nomes = pd.factorize(dispositivos)
+    segundos = np.asarray(tempos, dtype='datetime64[s]').astype(np.int64)
+    valores = np.asarray(valores, dtype=np.float64)
+    inicio = int(segundos.min()) if inicio is None else int(np.datetime64(inicio, 's').astype(np.int64))
+    fim = int(segundos.max()) + 1 if fim is None else int(np.datetime64(fim, 's').astype(np.int64))
+
+    passo = passo_colunas(fim - inicio, largura_px)
+    n_colunas = max(1, -(-(fim - inicio) // passo))
+    colunas = (segundos - inicio) // passo
+    validos = (codigos >= 0) & (colunas >= 0) & (colunas < n_colunas) & np.isfinite(valores)
+    if not validos.all():  # cópias só quando há amostras fora da janela, sem dispositivo ou NaN
+        codigos, colunas, valores = codigos[validos], colunas[validos], valores[validos]
+
+    n = len(nomes)
+    celulas = codigos * n_colunas + colunas
+    contagem = np.bincount(celulas, minlength=n * n_colunas)
+    if agregado == 'avg':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            matriz = np.bincount(celulas, weights=valores, minlength=n * n_colunas) / contagem
+    else:
+        matriz = np.full(n * n_colunas, -np.inf)
+        np.maximum.at(matriz, celulas, valores)
+        matriz[contagem == 0] = np.nan
+    matriz = matriz.reshape(n, n_colunas)
+
+    nomes = np.asarray(nomes)
+    if ordenar:
+        # Estável: empates mantêm a ordem de aparição; NaN (sem amostras) no fim
+        indice = np.nan_to_num(_por_dispositivo(codigos, valores, n, ordenar), nan=-np.inf)
+        ordem = np.argsort(-indice, kind='stable')
+        matriz, nomes = matriz[ordem], nomes[ordem]
+
+    inicios = (inicio + np.arange(n_colunas) * passo).astype('datetime64[s]')
+    return nomes, inicios, matriz, passo
+
+
+def z_compacto(matriz, inteiro=True):
+    """
+    z do heatmap no menor formato: uint8 (arredondado a 1 p.p.) quando não há
+    lacunas e os valores cabem em 0-255; senão float32 com NaN em base64
+    (ou a própria matriz, com DASHBOARDS_BINARIO=0). Com inteiro=False
+    (escalas contínuas, ex.: log10 de contagens) nunca arredonda para uint8.
+    """
+    if (inteiro and matriz.size and np.isfinite(matriz).all()
+            and matriz.min() >= 0 and matriz.max() <= 255):
+        return np.rint(matriz).astype(np.uint8)
+    if binario_habilitado():
+        # codificar_figura() deixaria a matriz em JSON por causa dos NaN;
+        # em Float32Array o NaN chega intacto e o plotly.js o trata como lacuna
+        return codificar_array(matriz.astype(np.float32))
+    return matriz
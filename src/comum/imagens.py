@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Exportação em Lote de Imagens Estáticas (PNG/SVG/PDF)
+
+Gera PNG, SVG e/ou PDF de cada gráfico, ao lado do HTML em docs/, para os
+relatórios por e-mail.
+
+A exportação usa o kaleido, que renderiza em um processo do Chromium. O
+custo está em subir esse processo, não em cada imagem: exportar figura por
+figura, em scripts separados, pagava a inicialização toda vez. Aqui um pool
+pequeno de workers de vida longa é criado uma vez; cada worker sobe o seu
+renderizador no início (com uma imagem de aquecimento) e o reaproveita para
+todos os gráficos que receber. Cada worker também monta as figuras que
+exporta, então só o caminho do script atravessa o pool.
+
+O kaleido é opcional (requerimentos.txt); sem ele, exportar() levanta
+ImportError com a instrução de instalação.
+
+Uso:
+    python src/exportar_imagens.py                    # PNG, SVG e PDF de todos
+    python src/exportar_imagens.py -f png -j 2 04     # só PNG do MVP
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from comum.binario import decodificar_figura
+from comum.build import DIR_RAIZ, carregar_modulo, descobrir_graficos, precarregar_plotly, selecionar_graficos
+from comum.saida import DIR_DOCS, gravar_se_mudou
+
+FORMATOS = ('png', 'svg', 'pdf')
+
+# Cada renderizador é um Chromium: poucos workers já ocupam a máquina
+PROCESSOS_PADRAO = 4
+LARGURA_PADRAO = 1200
+
+
+def kaleido_disponivel():
+    """Indica se o pacote kaleido está instalado."""
+    return importlib.util.find_spec('kaleido') is not None
+
+
+def _iniciar_renderizador():
+    """Sobe o renderizador do kaleido neste processo (inicializador dos workers)."""
+    import plotly.io as pio
+
+    # Sem MathJax: os dashboards não usam LaTeX e o carregamento é lento
+    pio.kaleido.scope.mathjax = None
+    pio.to_image({'data': [], 'layout': {}}, format='png', width=10, height=10,
+                 validate=False, engine='kaleido')
+
+
+def exportar_grafico(caminho, formatos=FORMATOS, destino=DIR_DOCS, largura=LARGURA_PADRAO, escala=1):
+    """
+    Monta a figura do script `caminho` e grava NOME.<formato> em `destino`.
+    Retorna (arquivos gravados, duração em segundos).
+    """
+    import plotly.io as pio
+
+    inicio = time.perf_counter()
+    modulo = carregar_modulo(Path(caminho))
+    fig = modulo.construir_figura()
+    # z_compacto() e afins vêm como {'dtype', 'bdata'}: o kaleido quer listas
+    dados = decodificar_figura(dict(fig) if isinstance(fig, dict) else fig.to_plotly_json())
+    # Mantém a altura do layout (ex.: 950 px no MVP); a largura é a do relatório
+    altura = dados.get('layout', {}).get('height')
+
+    arquivos = []
+    for formato in formatos:
+        imagem = pio.to_image(dados, format=formato, width=largura, height=altura,
+                              scale=escala, validate=False, engine='kaleido')
+        arquivo = Path(destino) / Path(modulo.SAIDA).with_suffix(f'.{formato}').name
+        gravar_se_mudou(arquivo, imagem)
+        arquivos.append(str(arquivo))
+    return arquivos, time.perf_counter() - inicio
+
+
+def _exportar_todos(graficos, processos, opcoes):
+    """Gera (caminho, (arquivos, duração) ou exceção) para cada gráfico."""
+    if processos == 1:
+        _iniciar_renderizador()
+        for caminho in graficos:
+            try:
+                yield caminho, exportar_grafico(caminho, **opcoes)
+            except Exception as erro:  # um gráfico com erro não derruba o lote
+                yield caminho, erro
+        return
+
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_renderizador) as pool:
+        futuros = {pool.submit(exportar_grafico, caminho, **opcoes): caminho for caminho in graficos}
+        for futuro in as_completed(futuros):
+            try:
+                yield futuros[futuro], futuro.result()
+            except Exception as erro:
+                yield futuros[futuro], erro
+
+
+def exportar(graficos=None, formatos=FORMATOS, processos=None, destino=DIR_DOCS,
+             largura=LARGURA_PADRAO, escala=1):
+    """
+    Exporta as imagens dos gráficos selecionados (padrão: todos) em lote.
+
+    Retorna {'gerados': {script: [arquivos]}, 'falhas': {script: erro}}.
+    """
+    desconhecidos = set(formatos) - set(FORMATOS)
+    if desconhecidos:
+        raise ValueError(f"Formato(s) inválido(s): {', '.join(sorted(desconhecidos))} "
+                         f"(use {', '.join(FORMATOS)})")
+    if not kaleido_disponivel():
+        raise ImportError('Exportação de imagens requer o kaleido: pip install kaleido==0.2.1')
+
+    graficos = descobrir_graficos() if graficos is None else selecionar_graficos(graficos)
+    resultado = {'gerados': {}, 'falhas': {}}
+    if not graficos:
+        return resultado
+
+    Path(destino).mkdir(parents=True, exist_ok=True)
+    # Antes do pool: os workers (fork) já nascem com o plotly importado; o
+    # Chromium, ao contrário, sobe em cada worker
+    precarregar_plotly()
+    processos = min(processos or min(PROCESSOS_PADRAO, os.cpu_count() or 1), len(graficos))
+    opcoes = {'formatos': tuple(formatos), 'destino': destino, 'largura': largura, 'escala': escala}
+    for caminho, retorno in _exportar_todos(graficos, processos, opcoes):
+        chave = Path(caminho).relative_to(DIR_RAIZ).as_posix()
+        if isinstance(retorno, Exception):
+            resultado['falhas'][chave] = f'{type(retorno).__name__}: {retorno}'
+        else:
+            resultado['gerados'][chave] = retorno[0]
+    return resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Exporta PNG/SVG/PDF dos gráficos em lote.')
+    parser.add_argument('graficos', nargs='*',
+                        help='scripts, nomes, prefixos ou padrões (padrão: todos em src/)')
+    parser.add_argument('-f', '--formatos', nargs='+', default=list(FORMATOS), choices=FORMATOS)
+    parser.add_argument('-j', '--processos', type=int, default=None,
+                        help=f'renderizadores em paralelo (padrão: até {PROCESSOS_PADRAO}; 1 = sem pool)')
+    parser.add_argument('--largura', type=int, default=LARGURA_PADRAO,
+                        help=f'largura das imagens em px (padrão: {LARGURA_PADRAO})')
+    parser.add_argument('--escala', type=float, default=1,
+                        help='fator de resolução (2 = PNG com o dobro de pixels)')
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    try:
+        resultado = exportar(args.graficos or None, args.formatos, args.processos,
+                             largura=args.largura, escala=args.escala)
+    except (ImportError, ValueError) as erro:
+        print(f"❌ {erro}")
+        return 2
+    for chave, arquivos in sorted(resultado['gerados'].items()):
+        print(f"✅ {chave}: {', '.join(Path(a).name for a in arquivos)}")
+    for chave, erro in resultado['falhas'].items():
+        print(f"❌ {chave}: {erro}")
+    print(f"⏱️  {len(resultado['gerados'])} gráfico(s) em {time.perf_counter() - inicio:.1f}s")
+    return 1 if resultado['falhas'] else 0
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentação por Etapa do Build dos Dashboards
+
+Quando um dashboard fica lento, mostra em qual etapa o tempo vai (preparação
+dos dados, subplots, traces, layout, serialização, gravação) sem precisar
+anexar um profiler. Cada etapa é marcada com um bloco with:
+
+    with etapa('traces'):
+        fig.add_trace(...)
+
+e registra tempo de parede, tempo de CPU, memória alocada ao final da etapa e
+pico de memória durante a etapa (tracemalloc). Etapas podem ser aninhadas.
+
+Fica desligada por padrão (etapa() não faz nada). Com
+DASHBOARDS_INSTRUMENTAR=1, salvar_html() grava ao lado do HTML:
+
+- NOME.trace.json: etapas com caminho, início e métricas (JSON estruturado)
+- NOME.folded: pilhas no formato "a;b;c valor" (tempo de parede próprio, em
+  microssegundos), aceito por flamegraph.pl e speedscope
+
+O tracemalloc deixa o código mais lento; compare os tempos entre builds
+instrumentados, não com builds normais.
+"""
+
+import json
+import os
+import platform
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+_etapas = []   # etapas concluídas desde o último salvar_rastro()
+_pilha = []    # etapas abertas: [nome, pico observado nas filhas, tempo das filhas]
+
+
+def instrumentacao_habilitada():
+    """Indica se as etapas são medidas (DASHBOARDS_INSTRUMENTAR)."""
+    return os.environ.get('DASHBOARDS_INSTRUMENTAR', '0').strip() not in ('', '0')
+
+
+def _memoria():
+    """(alocada, pico desde o último reset) em bytes."""
+    return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+
+
+@contextmanager
+def etapa(nome):
+    """Mede o bloco como a etapa `nome` (não faz nada sem DASHBOARDS_INSTRUMENTAR)."""
+    if not instrumentacao_habilitada():
+        yield
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    # O pico do tracemalloc é global: antes de zerá-lo para esta etapa, o
+    # pico até aqui fica guardado na etapa mãe
+    if _pilha:
+        _pilha[-1][1] = max(_pilha[-1][1], _memoria()[1])
+    memoria_inicio = _memoria()[0]
+    tracemalloc.reset_peak()
+    _pilha.append([nome, 0, 0.0])
+    inicio, inicio_cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        parede, cpu = time.perf_counter() - inicio, time.process_time() - inicio_cpu
+        memoria_fim, pico = _memoria()
+        _, pico_filhas, parede_filhas = _pilha.pop()
+        pico = max(pico, pico_filhas)
+        if _pilha:
+            _pilha[-1][1] = max(_pilha[-1][1], pico)
+            _pilha[-1][2] += parede
+        tracemalloc.reset_peak()
+        _etapas.append({
+            'nome': nome,
+            'caminho': [item[0] for item in _pilha] + [nome],
+            'inicio_s': inicio,
+            'parede_s': round(parede, 6),
+            'parede_propria_s': round(parede - parede_filhas, 6),
+            'cpu_s': round(cpu, 6),
+            'memoria_alocada_mb': round((memoria_fim - memoria_inicio) / 2**20, 3),
+            'memoria_pico_mb': round((pico - memoria_inicio) / 2**20, 3),
+        })
+
+
+def coletar_etapas():
+    """Devolve e limpa as etapas concluídas (em ordem de início)."""
+    etapas = sorted(_etapas, key=lambda e: e['inicio_s'])
+    _etapas.clear()
+    if etapas:
+        origem = etapas[0]['inicio_s']
+        for item in etapas:
+            item['inicio_s'] = round(item['inicio_s'] - origem, 6)
+    return etapas
+
+
+def pilhas_folded(etapas, raiz):
+    """Linhas "raiz;etapa;subetapa microssegundos" com o tempo próprio de cada etapa."""
+    linhas = []
+    for item in etapas:
+        microssegundos = max(round(item['parede_propria_s'] * 1e6), 0)
+        if microssegundos:
+            linhas.append(f"{';'.join([raiz, *item['caminho']])} {microssegundos}")
+    return linhas
+
+
+def salvar_rastro(caminho_html):
+    """
+    Grava NOME.trace.json e NOME.folded ao lado de `caminho_html` com as
+    etapas medidas desde o último salvamento. Retorna os caminhos (ou None
+    se a instrumentação estiver desligada).
+    """
+    if not instrumentacao_habilitada():
+        return None
+    caminho_html = Path(caminho_html)
+    etapas = coletar_etapas()
+    rastro = {
+        'meta': {'html': caminho_html.name,
+                 'data': datetime.now().isoformat(timespec='seconds'),
+                 'python': platform.python_version(),
+                 'pid': os.getpid()},
+        'totais': {'parede_s': round(sum(e['parede_s'] for e in etapas if len(e['caminho']) == 1), 6),
+                   'cpu_s': round(sum(e['cpu_s'] for e in etapas if len(e['caminho']) == 1), 6)},
+        'etapas': etapas,
+    }
+    caminho_json = caminho_html.with_suffix('.trace.json')
+    caminho_folded = caminho_html.with_suffix('.folded')
+    caminho_json.write_text(json.dumps(rastro, indent=2, ensure_ascii=False), encoding='utf-8')
+    linhas = pilhas_folded(etapas, caminho_html.stem)
+    caminho_folded.write_text('\n'.join(linhas) + '\n' if linhas else '', encoding='utf-8')
+    return caminho_json, caminho_folded
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Motor JSON Rápido para Serialização das Figuras
+
+A serialização (fig.to_json / write_html) é uma das etapas mais caras do
+build. Com o orjson instalado (requerimentos.txt), os arrays NumPy e as
+datas são serializados nativamente pelo orjson (OPT_SERIALIZE_NUMPY), sem
+passar por .tolist() nem pelo PlotlyJSONEncoder; o resto (pandas, Decimal,
+arrays que o orjson não aceita) ainda usa o PlotlyJSONEncoder.default como
+hook. Sem orjson, vale a biblioteca padrão.
+
+Os dois motores geram o mesmo JSON, mas não o mesmo texto byte a byte (o
+orjson escreve 1e16 onde o Python escreve 1e+16 e não escapa acentos). Isso
+não muda o que o navegador lê; o hash do build e a chave do cache incluem o
+motor, então trocar de motor apenas regera as páginas.
+
+O motor é escolhido pela variável DASHBOARDS_JSON: 'auto' (padrão, orjson se
+disponível), 'orjson' ou 'json'. Qualquer objeto que o orjson recuse (ex.:
+inteiros maiores que 64 bits) é serializado pela biblioteca padrão.
+
+usando_motor() faz o plotly.io (to_html, write_html, to_json) usar o mesmo
+motor dentro de um bloco with, pelo motor de JSON do próprio plotly
+(plotly.io.json.config.default_engine), sem substituir funções do plotly.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:  # dependência opcional
+    orjson = None
+
+MOTORES = ('auto', 'orjson', 'json')
+
+
+def motor_json():
+    """Motor efetivo ('orjson' ou 'json') conforme DASHBOARDS_JSON."""
+    motor = os.environ.get('DASHBOARDS_JSON', 'auto').strip().lower()
+    if motor not in MOTORES:
+        raise ValueError(f"DASHBOARDS_JSON inválido: {motor!r} (use {', '.join(MOTORES)})")
+    if motor == 'auto':
+        return 'orjson' if orjson is not None else 'json'
+    if motor == 'orjson' and orjson is None:
+        raise ImportError('DASHBOARDS_JSON=orjson, mas o pacote orjson não está instalado')
+    return motor
+
+
+def _dumps_orjson(obj, ordenar):
+    from plotly.utils import PlotlyJSONEncoder
+
+    opcoes = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if ordenar:
+        opcoes |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=PlotlyJSONEncoder().default, option=opcoes).decode('utf-8')
+
+
+def _dumps_json(obj, ordenar):
+    from plotly.utils import PlotlyJSONEncoder
+
+    return json.dumps(obj, cls=PlotlyJSONEncoder, sort_keys=ordenar, separators=(',', ':'))
+
+
+def dumps(obj, ordenar=False, motor=None):
+    """JSON compacto de `obj` (mesmos valores que o PlotlyJSONEncoder em qualquer motor)."""
+    motor = motor or motor_json()
+    if motor == 'orjson':
+        try:
+            return _dumps_orjson(obj, ordenar)
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return _dumps_json(obj, ordenar)
+
+
+def para_json_plotly(obj, motor=None):
+    """plotly.io.json.to_json_plotly(obj) com o motor escolhido: o mesmo texto do to_html()."""
+    from plotly.io.json import to_json_plotly
+
+    return to_json_plotly(obj, engine=motor or motor_json())
+
+
+@contextmanager
+def usando_motor(motor=None):
+    """Faz o plotly.io serializar com o motor escolhido dentro do bloco."""
+    from plotly.io.json import config
+
+    anterior = config.default_engine
+    config.default_engine = motor or motor_json()
+    try:
+        yield
+    finally:
+        config.default_engine = anterior
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Classificação por Limiares (verde / laranja / vermelho) Vetorizada
+
+Painéis de CPU, memória e erros de interface pintam cada barra conforme a
+faixa do valor. Uma cor em texto por barra ('#EF553B') calculada em Python
+custa um laço por dispositivo e ~10 bytes por barra no HTML. Aqui o array
+inteiro é classificado de uma vez com np.digitize e cada barra recebe só o
+número da classe (0, 1, 2... em uint8, que vai em base64 com
+DASHBOARDS_BINARIO); a cor sai de uma colorscale em degraus:
+
+    marker=marcador_classes(cpu_percent, FAIXAS_CPU)
+    # {'color': [0, 1, 0, 2, 0], 'colorscale': [...], 'cmin': -0.5, 'cmax': 2.5}
+
+A regra é a mesma do dashboard MVP: com limites (50, 70), verde abaixo de 50,
+laranja de 50 até abaixo de 70 e vermelho a partir de 70. Valores
+inválidos (NaN) ficam na última classe.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+VERDE, LARANJA, VERMELHO = '#00CC96', '#FFA15A', '#EF553B'
+
+
+@dataclass(frozen=True)
+class Faixas:
+    """Limiares crescentes e uma cor por classe (len(cores) == len(limites) + 1)."""
+    limites: tuple
+    cores: tuple = (VERDE, LARANJA, VERMELHO)
+    rotulos: tuple = ('normal', 'atenção', 'crítico')
+
+    def __post_init__(self):
+        if len(self.cores) != len(self.limites) + 1:
+            raise ValueError(f'{len(self.limites)} limites pedem {len(self.limites) + 1} cores, '
+                             f'não {len(self.cores)}')
+        if any(b <= a for a, b in zip(self.limites, self.limites[1:])):
+            raise ValueError(f'Limites fora de ordem crescente: {self.limites}')
+
+
+FAIXAS_CPU = Faixas((50, 70))
+FAIXAS_MEMORIA = Faixas((70, 85))
+# Erros de interface em % dos pacotes recebidos (CRC, input errors)
+FAIXAS_ERROS_INTERFACE = Faixas((0.01, 0.1))
+
+
+def classificar(valores, faixas):
+    """Classe (0 .. len(limites)) de cada valor, em uint8."""
+    valores = np.asarray(valores, dtype=np.float64)
+    classes = np.digitize(valores, faixas.limites)
+    return classes.astype(np.uint8)
+
+
+def escala_classes(faixas):
+    """Colorscale em degraus que leva a classe i (com cmin/cmax de marcador_classes) à cor i."""
+    n = len(faixas.cores)
+    escala = []
+    for i, cor in enumerate(faixas.cores):
+        escala += [[i / n, cor], [(i + 1) / n, cor]]
+    return escala
+
+
+def escala_marcador(faixas):
+    """colorscale, cmin e cmax de um `marker` cujo color são classes de classificar()."""
+    return {'colorscale': escala_classes(faixas), 'cmin': -0.5, 'cmax': len(faixas.cores) - 0.5,
+            'showscale': False}
+
+
+def marcador_classes(valores, faixas, **propriedades):
+    """`marker` de um trace com as cores por classe (color numérico + colorscale)."""
+    return {'color': classificar(valores, faixas), **escala_marcador(faixas), **propriedades}
+
+
+def escala_valores(faixas, zmin=0, zmax=100):
+    """Colorscale em degraus para valores brutos entre zmin e zmax (heatmaps)."""
+    cortes = [0.0] + [min(max((limite - zmin) / (zmax - zmin), 0.0), 1.0) for limite in faixas.limites] + [1.0]
+    escala = []
+    for cor, inicio, fim in zip(faixas.cores, cortes, cortes[1:]):
+        escala += [[inicio, cor], [fim, cor]]
+    return escala
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Poller SNMP Assíncrono de Contadores de Interface
+
+Coleta contadores do IF-MIB (ifHCInOctets/ifHCOutOctets, 64 bits) de muitos
+equipamentos ao mesmo tempo usando SNMPv2c GETBULK:
+
+- Todas as colunas de um dispositivo vão na mesma requisição, junto com o
+  sysUpTime (non-repeater), e cada resposta traz dezenas de interfaces.
+- Um único socket UDP atende todos os dispositivos; as respostas são
+  associadas pelo request-id.
+- Um semáforo limita quantos dispositivos ficam em voo simultaneamente.
+
+A cada ciclo, coletar() compara com o ciclo anterior e devolve a taxa em
+bits/s por interface, usando o sysUpTime do próprio equipamento como base de
+tempo (trata a volta do contador conforme o tipo do varbind, Counter32 ou
+Counter64, e ignora equipamentos reiniciados).
+trafego_total_mbps() resume as taxas no valor usado pelo painel de tráfego do
+dashboard MVP.
+
+Para testar sem equipamentos, use comum.snmp_falso.AgenteSNMPFalso.
+"""
+
+import asyncio
+import itertools
+import random
+import socket
+from dataclasses import dataclass
+
+from comum import snmp
+from comum.snmp import IF_HC_IN_OCTETS, IF_HC_OUT_OCTETS, SYS_UPTIME
+
+COLUNAS_PADRAO = {'entrada': IF_HC_IN_OCTETS, 'saida': IF_HC_OUT_OCTETS}
+# Volta do contador por tipo do varbind (sem tipo conhecido: 64 bits)
+_MODULOS_CONTADOR = {snmp.COUNTER32: 1 << 32, snmp.COUNTER64: 1 << 64}
+TAMANHO_BUFFER_UDP = 4 * 1024 * 1024
+
+
+@dataclass
+class AgenteSNMP:
+    """Equipamento consultado por SNMP."""
+    nome: str
+    host: str
+    porta: int = 161
+    comunidade: str = 'public'
+
+
+class _ProtocoloCliente(asyncio.DatagramProtocol):
+    """Socket UDP compartilhado: entrega cada resposta à requisição de mesmo id."""
+
+    def __init__(self):
+        self.pendentes = {}
+
+    def datagram_received(self, dados, endereco):
+        try:
+            _, _, pdu = snmp.decodificar(dados)
+        except snmp.ErroSNMP:
+            return
+        futuro = self.pendentes.pop(pdu.request_id, None)
+        if futuro is not None and not futuro.done():
+            futuro.set_result(pdu)
+
+
+class PollerSNMP:
+    """
+    Coleta periódica de contadores via GETBULK.
+
+    - colunas: {nome: OID da coluna} a percorrer em cada dispositivo
+    - max_em_voo: dispositivos consultados ao mesmo tempo
+    - timeout/tentativas: por requisição UDP
+    - max_repeticoes: linhas pedidas por GETBULK
+    """
+
+    def __init__(self, agentes, colunas=None, max_em_voo=256, timeout=2.0,
+                 tentativas=2, max_repeticoes=25):
+        self.agentes = list(agentes)
+        self.colunas = dict(colunas or COLUNAS_PADRAO)
+        self.max_em_voo = max_em_voo
+        self.timeout = timeout
+        self.tentativas = tentativas
+        self.max_repeticoes = max_repeticoes
+        self.erros = {}
+        self._anteriores = {}  # nome -> leitura de percorrer()
+        self._ids = itertools.count(random.randrange(1, 1 << 30))
+        self._transporte = None
+        self._protocolo = None
+
+    async def __aenter__(self):
+        return await self.iniciar()
+
+    async def __aexit__(self, *excecao):
+        self.fechar()
+
+    async def iniciar(self):
+        loop = asyncio.get_running_loop()
+        self._transporte, self._protocolo = await loop.create_datagram_endpoint(
+            _ProtocoloCliente, local_addr=('0.0.0.0', 0))
+        # Muitas respostas GETBULK chegam juntas: buffer maior evita descarte pelo kernel
+        socket_udp = self._transporte.get_extra_info('socket')
+        try:
+            socket_udp.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TAMANHO_BUFFER_UDP)
+        except OSError:
+            pass
+        return self
+
+    def fechar(self):
+        if self._transporte:
+            self._transporte.close()
+            self._transporte = None
+
+    async def _requisitar(self, agente, tipo, varbinds, non_repeaters=0, max_repeticoes=0):
+        """Envia a PDU e espera a resposta, repetindo em caso de timeout."""
+        loop = asyncio.get_running_loop()
+        for tentativa in range(self.tentativas):
+            request_id = next(self._ids) & 0x7FFFFFFF
+            pdu = snmp.PDU(tipo, request_id, [(o, snmp.NULL, None) for o in varbinds],
+                           non_repeaters, max_repeticoes)
+            futuro = loop.create_future()
+            self._protocolo.pendentes[request_id] = futuro
+            self._transporte.sendto(snmp.codificar(agente.comunidade, pdu), (agente.host, agente.porta))
+            try:
+                resposta = await asyncio.wait_for(futuro, self.timeout)
+            except asyncio.TimeoutError:
+                self._protocolo.pendentes.pop(request_id, None)
+                continue
+            if resposta.erro:
+                raise snmp.ErroSNMP(f'error-status={resposta.erro} index={resposta.indice_erro}')
+            return resposta
+        raise TimeoutError(f'{agente.nome}: sem resposta após {self.tentativas} tentativa(s)')
+
+    async def percorrer(self, agente):
+        """
+        Lê todas as colunas do dispositivo com GETBULK.
+
+        Retorna (sysUpTime em centésimos, {coluna: {ifIndex: valor}},
+        {coluna: {ifIndex: tipo do varbind}}).
+        """
+        valores = {nome: {} for nome in self.colunas}
+        tipos = {nome: {} for nome in self.colunas}
+        cursores = dict(self.colunas)
+        uptime = None
+
+        while cursores:
+            ativos = list(cursores)
+            fixos = [SYS_UPTIME[:-1]] if uptime is None else []
+            resposta = await self._requisitar(
+                agente, snmp.GET_BULK, fixos + [cursores[nome] for nome in ativos],
+                non_repeaters=len(fixos), max_repeticoes=self.max_repeticoes)
+
+            varbinds = resposta.varbinds
+            if fixos:
+                uptime = varbinds[0][2]
+                varbinds = varbinds[1:]
+
+            terminados = set()
+            for posicao, (o, tag, valor) in enumerate(varbinds):
+                nome = ativos[posicao % len(ativos)]
+                if nome in terminados:
+                    continue
+                prefixo = self.colunas[nome]
+                if tag in snmp.EXCECOES or o[:len(prefixo)] != prefixo:
+                    terminados.add(nome)
+                    continue
+                sufixo = o[len(prefixo):]  # ifIndex (tupla se a tabela tiver índice composto)
+                indice = sufixo[0] if len(sufixo) == 1 else sufixo
+                valores[nome][indice] = valor
+                tipos[nome][indice] = tag
+                cursores[nome] = o
+            for nome in terminados:
+                cursores.pop(nome, None)
+            if not varbinds:
+                break
+        return uptime, valores, tipos
+
+    async def _coletar_agente(self, agente, semaforo):
+        async with semaforo:
+            try:
+                leitura = await self.percorrer(agente)
+            except (TimeoutError, snmp.ErroSNMP, OSError) as erro:
+                self.erros[agente.nome] = f'{type(erro).__name__}: {erro}'
+                return agente.nome, None
+        self.erros.pop(agente.nome, None)
+        return agente.nome, leitura
+
+    async def coletar(self):
+        """
+        Um ciclo de coleta em todos os agentes.
+
+        Retorna {nome: {ifIndex: {coluna: bits/s}}}. No primeiro ciclo (ou após
+        reinício do equipamento) ainda não há base de comparação e o
+        dispositivo vem com dicionário vazio; dispositivos com erro ficam de
+        fora (ver self.erros).
+        """
+        semaforo = asyncio.Semaphore(self.max_em_voo)
+        leituras = await asyncio.gather(*(self._coletar_agente(a, semaforo) for a in self.agentes))
+
+        taxas = {}
+        for nome, leitura in leituras:
+            if leitura is None:
+                continue
+            anterior = self._anteriores.get(nome)
+            self._anteriores[nome] = leitura
+            taxas[nome] = calcular_taxas(anterior, leitura)
+        return taxas
+
+
+def calcular_taxas(anterior, atual):
+    """
+    Taxa em bits/s por interface entre duas leituras de percorrer()
+    (uptime, {coluna: {indice: octetos}}, {coluna: {indice: tipo}}).
+    """
+    if anterior is None:
+        return {}
+    uptime_anterior, valores_anteriores, _ = anterior
+    uptime, valores, tipos = atual
+    segundos = (uptime - uptime_anterior) / 100
+    if segundos <= 0:  # reinício (sysUpTime voltou) ou leituras no mesmo instante
+        return {}
+
+    taxas = {}
+    for coluna, contadores in valores.items():
+        base = valores_anteriores.get(coluna, {})
+        tipos_coluna = tipos.get(coluna, {})
+        for indice, octetos in contadores.items():
+            if indice in base:
+                modulo = _MODULOS_CONTADOR.get(tipos_coluna.get(indice), 1 << 64)
+                delta = (octetos - base[indice]) % modulo
+                taxas.setdefault(indice, {})[coluna] = delta * 8 / segundos
+    return taxas
+
+
+def trafego_total_mbps(taxas, colunas=('entrada', 'saida')):
+    """Soma das taxas de todas as interfaces, em Mbps (painel de tráfego do MVP)."""
+    total = sum(valores.get(coluna, 0.0)
+                for interfaces in taxas.values()
+                for valores in interfaces.values()
+                for coluna in colunas)
+    return round(total / 1e6, 1)
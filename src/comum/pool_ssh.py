@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Pool de Sessões SSH Persistentes
+
+Mantém sessões SSH autenticadas abertas por dispositivo e as reaproveita
+entre ciclos de coleta. Sem o pool, cada ciclo paga de novo a conexão TCP,
+a troca de chaves e a autenticação, que costumam demorar mais que o próprio
+comando.
+
+- Antes de reutilizar, a sessão passa por uma verificação de saúde
+  (transporte ativo, autenticado e aceitando escrita).
+- Sessões ociosas há mais de `ocioso_max` segundos são fechadas.
+- Uma sessão que gerou erro durante o uso é descartada, nunca devolvida.
+
+Uso com o coletor:
+    with PoolSessoesSSH(coletor.abrir_sessao) as pool:
+        coletor.pool = pool
+        coletor.coletar(dispositivos)   # 1º ciclo: abre as sessões
+        coletor.coletar(dispositivos)   # próximos: só executa os comandos
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+def _chave(dispositivo):
+    return (dispositivo.host, dispositivo.porta, dispositivo.usuario)
+
+
+def sessao_saudavel(cliente):
+    """Indica se o paramiko.SSHClient ainda pode executar comandos."""
+    transporte = cliente.get_transport()
+    if transporte is None or not transporte.is_active() or not transporte.is_authenticated():
+        return False
+    try:
+        transporte.send_ignore()  # falha se o socket já foi fechado do outro lado
+    except Exception:  # EOFError, OSError ou paramiko.SSHException
+        return False
+    return True
+
+
+class PoolSessoesSSH:
+    """
+    Sessões SSH reutilizáveis, indexadas por (host, porta, usuário).
+
+    - abrir: função que recebe o dispositivo e retorna um SSHClient conectado
+    - max_por_dispositivo: sessões ociosas guardadas por dispositivo
+    - ocioso_max: segundos sem uso até a sessão ser fechada
+    """
+
+    def __init__(self, abrir, max_por_dispositivo=1, ocioso_max=300.0):
+        self.abrir = abrir
+        self.max_por_dispositivo = max_por_dispositivo
+        self.ocioso_max = ocioso_max
+        self._ociosas = {}  # chave -> [(cliente, último uso), ...]
+        self._trava = threading.Lock()
+        self.abertas = 0
+        self.reutilizadas = 0
+        self.descartadas = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    @contextmanager
+    def sessao(self, dispositivo):
+        """Empresta uma sessão do dispositivo; devolve ao pool se não houver erro."""
+        cliente = self._pegar(dispositivo)
+        try:
+            yield cliente
+        except BaseException:
+            self._descartar(cliente)
+            raise
+        self._devolver(dispositivo, cliente)
+
+    def _pegar(self, dispositivo):
+        self.despejar_ociosas()
+        while True:
+            with self._trava:
+                fila = self._ociosas.get(_chave(dispositivo))
+                cliente = fila.pop()[0] if fila else None
+            if cliente is None:
+                break
+            if sessao_saudavel(cliente):
+                with self._trava:
+                    self.reutilizadas += 1
+                return cliente
+            self._descartar(cliente)
+
+        cliente = self.abrir(dispositivo)
+        with self._trava:
+            self.abertas += 1
+        return cliente
+
+    def _devolver(self, dispositivo, cliente):
+        with self._trava:
+            fila = self._ociosas.setdefault(_chave(dispositivo), [])
+            if len(fila) < self.max_por_dispositivo:
+                fila.append((cliente, time.monotonic()))
+                return
+        self._descartar(cliente)
+
+    def _descartar(self, cliente):
+        with self._trava:
+            self.descartadas += 1
+        try:
+            cliente.close()
+        except Exception:
+            pass
+
+    def despejar_ociosas(self):
+        """Fecha as sessões sem uso há mais de ocioso_max segundos."""
+        limite = time.monotonic() - self.ocioso_max
+        vencidas = []
+        with self._trava:
+            for chave, fila in list(self._ociosas.items()):
+                vencidas.extend(cliente for cliente, uso in fila if uso < limite)
+                fila[:] = [(cliente, uso) for cliente, uso in fila if uso >= limite]
+                if not fila:
+                    del self._ociosas[chave]
+        for cliente in vencidas:
+            self._descartar(cliente)
+
+    def fechar(self):
+        """Fecha todas as sessões ociosas."""
+        with self._trava:
+            todas = [cliente for fila in self._ociosas.values() for cliente, _ in fila]
+            self._ociosas.clear()
+        for cliente in todas:
+            self._descartar(cliente)
+
+    def __len__(self):
+        with self._trava:
+            return sum(len(fila) for fila in self._ociosas.values())
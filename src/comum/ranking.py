@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Piores Switches (ou Grupos) por Interfaces DOWN
+
+piores() escolhe os N piores com heapq.nlargest (heap de tamanho N,
+O(n log N)) sem ordenar a lista toda. painel_interfaces() aplica a seleção
+ao painel de interfaces do dashboard MVP, tanto na página quanto nas
+atualizações do servidor ao vivo. Fica fora de comum.status_interfaces
+porque o MVP não deve importar pandas só para isso.
+"""
+
+import heapq
+
+import numpy as np
+
+TOP_N = 10
+# Acima disso o painel de interfaces do MVP mostra só os piores switches
+# (visão completa da rede em 07_interface_status.py)
+MAX_SWITCHES_PAINEL = 20
+
+
+def piores(up, down, n=TOP_N):
+    """
+    Índices dos `n` switches (ou grupos) com mais interfaces DOWN (empate:
+    maior fração DOWN), do pior para o melhor.
+    """
+    up = np.asarray(up).tolist()
+    down = np.asarray(down).tolist()
+    return heapq.nlargest(n, range(len(down)),
+                          key=lambda i: (down[i], down[i] / ((up[i] + down[i]) or 1)))
+
+
+def painel_interfaces(switches, interfaces_up, interfaces_down, limite=MAX_SWITCHES_PAINEL):
+    """(switches, up, down, título) do painel de interfaces: todos ou os `limite` piores."""
+    if len(switches) <= limite:
+        return switches, interfaces_up, interfaces_down, '🔌 Status de Interfaces por Switch'
+    indices = piores(interfaces_up, interfaces_down, limite)
+    return ([switches[i] for i in indices], [interfaces_up[i] for i in indices],
+            [interfaces_down[i] for i in indices],
+            f'🔌 Interfaces - {limite} Piores de {len(switches)} Switches')
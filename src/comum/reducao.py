@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Redução de Séries Temporais (downsampling)
+
+Diminui a quantidade de pontos de uma série antes de virar trace, mantendo o
+formato visual da curva. Um gráfico com 800 px de largura não consegue
+mostrar 86.400 amostras por segundo de um dia inteiro: o HTML fica enorme e o
+navegador trava, sem nenhum ganho de informação.
+
+Métodos disponíveis:
+
+- 'lttb' (Largest-Triangle-Three-Buckets): divide a série em baldes e, em
+  cada um, escolhe o ponto que forma o maior triângulo com o ponto escolhido
+  no balde anterior e a média do próximo balde. Preserva picos e vales.
+- 'minmax': guarda o mínimo e o máximo de cada balde, garantindo que nenhum
+  pico apareça cortado (ideal para contadores de interface).
+
+As funções trabalham com índices, então o eixo X pode ser numérico, datetime
+ou texto (ex.: 'HH:MM'); para texto, as amostras são tratadas como
+igualmente espaçadas.
+"""
+
+import numpy as np
+
+METODOS = ('lttb', 'minmax')
+
+
+def _eixo_numerico(x):
+    """Converte o eixo X para float64 (índices, se não for numérico)."""
+    valores = np.asarray(x)
+    if valores.dtype.kind in 'iuf':
+        return valores.astype(np.float64, copy=False)
+    if valores.dtype.kind == 'M':
+        return valores.astype('datetime64[ns]').view(np.int64).astype(np.float64)
+    return np.arange(len(valores), dtype=np.float64)
+
+
+def indices_lttb(x, y, n_pontos):
+    """Índices (ordenados) escolhidos pelo LTTB para `n_pontos` amostras."""
+    y = np.asarray(y, dtype=np.float64)
+    total = len(y)
+    if n_pontos >= total:
+        return np.arange(total)
+    if n_pontos < 3:
+        raise ValueError('O LTTB precisa de pelo menos 3 pontos (primeiro, último e um balde)')
+
+    xs = _eixo_numerico(x)
+    # Primeiro e último pontos são sempre mantidos; o miolo vira n_pontos - 2 baldes
+    limites = np.linspace(1, total - 1, n_pontos - 1).astype(np.intp)
+    indices = np.empty(n_pontos, dtype=np.intp)
+    indices[0], indices[-1] = 0, total - 1
+
+    anterior = 0
+    for balde in range(n_pontos - 2):
+        inicio, fim = limites[balde], limites[balde + 1]
+        # Média do próximo balde (no último, o próprio ponto final)
+        prox_inicio = fim
+        prox_fim = limites[balde + 2] if balde + 2 < len(limites) else total
+        media_x = xs[prox_inicio:prox_fim].mean()
+        media_y = y[prox_inicio:prox_fim].mean()
+
+        # Área (x2) do triângulo anterior -> candidato -> média do próximo balde
+        ax, ay = xs[anterior], y[anterior]
+        areas = np.abs((ax - media_x) * (y[inicio:fim] - ay) - (ax - xs[inicio:fim]) * (media_y - ay))
+        anterior = inicio + int(np.argmax(areas))
+        indices[balde + 1] = anterior
+    return indices
+
+
+def indices_minmax(y, n_pontos):
+    """Índices do mínimo e do máximo de cada balde (n_pontos // 2 baldes)."""
+    y = np.asarray(y, dtype=np.float64)
+    total = len(y)
+    if n_pontos >= total:
+        return np.arange(total)
+
+    n_baldes = max(n_pontos // 2, 1)
+    baldes = np.minimum((np.arange(total) * n_baldes) // total, n_baldes - 1)
+    # Ordena por (balde, valor): o primeiro de cada balde é o mínimo, o último é o máximo
+    ordem = np.lexsort((y, baldes))
+    inicio_balde = np.searchsorted(baldes[ordem], np.arange(n_baldes))
+    fim_balde = np.append(inicio_balde[1:], total) - 1
+    escolhidos = np.concatenate([ordem[inicio_balde], ordem[fim_balde]])
+    return np.unique(escolhidos)
+
+
+def reduzir_serie(x, y, largura_px, metodo='lttb', pontos_por_pixel=1):
+    """
+    Reduz a série (x, y) para caber em `largura_px` pixels.
+
+    Retorna (x_reduzido, y_reduzido) no mesmo tipo de sequência recebido
+    quando possível (listas continuam listas). Séries que já cabem na
+    largura são devolvidas sem alteração.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método de redução inválido: {metodo!r} (use {' ou '.join(METODOS)})")
+    if len(x) != len(y):
+        raise ValueError(f'x e y com tamanhos diferentes: {len(x)} != {len(y)}')
+
+    n_pontos = max(int(largura_px * pontos_por_pixel), 3)
+    if len(y) <= n_pontos:
+        return x, y
+
+    if metodo == 'lttb':
+        indices = indices_lttb(x, y, n_pontos)
+    else:
+        indices = indices_minmax(y, n_pontos)
+    return _selecionar(x, indices), _selecionar(y, indices)
+
+
+def _selecionar(valores, indices):
+    if hasattr(valores, 'iloc'):  # pandas.Series
+        return valores.iloc[indices]
+    if isinstance(valores, (list, tuple, range)):
+        return [valores[i] for i in indices.tolist()]
+    return valores[indices]  # numpy.ndarray, pandas.Index
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Agregações Pré-calculadas (rollups) 1m / 5m / 1h / 1d
+
+Mantém, de forma incremental conforme as amostras chegam, o mínimo, a média,
+o máximo e o percentil 95 de cada métrica em várias resoluções. Assim as
+visões de 7 e 90 dias leem alguns milhares de pontos já agregados em vez de
+milhões de amostras brutas.
+
+- Cada amostra entra no balde de 1 minuto; quando o balde fecha, ele é
+  gravado e mesclado no balde de 5 minutos, que ao fechar alimenta o de
+  1 hora, e assim por diante.
+- O p95 usa um sketch de histograma logarítmico (erro relativo de 1%), que
+  pode ser mesclado entre resoluções sem guardar as amostras.
+- Os baldes fechados ficam no ArmazemSeries, como séries próprias
+  ('<metrica>.<resolucao>.<agregado>'), com capacidade por resolução.
+- consultar() escolhe sozinha a resolução mais grossa que ainda preenche a
+  largura pedida do gráfico.
+
+Os baldes ainda abertos ficam só em memória: ao reiniciar o processo, o
+balde em andamento de cada resolução é perdido.
+
+Valores menores ou iguais a zero entram no p95 como zero (as métricas do
+dashboard não são negativas).
+"""
+
+import math
+
+import numpy as np
+
+from comum.armazem_series import ArmazemSeries
+
+# Resoluções em segundos, da mais fina para a mais grossa
+RESOLUCOES = {'1m': 60, '5m': 300, '1h': 3600, '1d': 86_400}
+
+# Baldes guardados por resolução: 7 dias de 1m, 90 dias de 5m, 2 anos de 1h, 5 anos de 1d
+CAPACIDADES = {'1m': 7 * 1440, '5m': 90 * 288, '1h': 2 * 365 * 24, '1d': 5 * 365}
+
+AGREGADOS = ('min', 'avg', 'max', 'p95')
+
+
+class SketchQuantil:
+    """Histograma com baldes logarítmicos (estilo DDSketch), mesclável."""
+
+    def __init__(self, precisao=0.01):
+        self.precisao = precisao
+        self._log_gamma = math.log((1 + precisao) / (1 - precisao))
+        self.contagens = {}
+        self.zeros = 0
+        self.total = 0
+
+    def adicionar(self, valores):
+        valores = np.asarray(valores, dtype=np.float64).ravel()
+        positivos = valores[valores > 0]
+        self.zeros += len(valores) - len(positivos)
+        self.total += len(valores)
+        if len(positivos):
+            chaves, contagens = np.unique(np.ceil(np.log(positivos) / self._log_gamma).astype(np.int64),
+                                          return_counts=True)
+            for chave, contagem in zip(chaves.tolist(), contagens.tolist()):
+                self.contagens[chave] = self.contagens.get(chave, 0) + contagem
+
+    def mesclar(self, outro):
+        for chave, contagem in outro.contagens.items():
+            self.contagens[chave] = self.contagens.get(chave, 0) + contagem
+        self.zeros += outro.zeros
+        self.total += outro.total
+
+    def quantil(self, q):
+        if not self.total:
+            return math.nan
+        posicao = q * (self.total - 1)
+        acumulado = self.zeros
+        if posicao < acumulado:
+            return 0.0
+        for chave in sorted(self.contagens):
+            acumulado += self.contagens[chave]
+            if posicao < acumulado:
+                # Ponto médio do balde: erro relativo <= precisao
+                return 2 * math.exp(chave * self._log_gamma) / (1 + math.exp(self._log_gamma))
+        return 2 * math.exp(max(self.contagens) * self._log_gamma) / (1 + math.exp(self._log_gamma))
+
+
+class Balde:
+    """Estatísticas de um intervalo [inicio, inicio + resolução)."""
+
+    def __init__(self, inicio, precisao=0.01):
+        self.inicio = inicio
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.soma = 0.0
+        self.quantidade = 0
+        self.sketch = SketchQuantil(precisao)
+
+    def adicionar(self, valores):
+        valores = np.asarray(valores, dtype=np.float64).ravel()
+        if not len(valores):
+            return
+        self.minimo = min(self.minimo, float(valores.min()))
+        self.maximo = max(self.maximo, float(valores.max()))
+        self.soma += float(valores.sum())
+        self.quantidade += len(valores)
+        self.sketch.adicionar(valores)
+
+    def mesclar(self, outro):
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        self.soma += outro.soma
+        self.quantidade += outro.quantidade
+        self.sketch.mesclar(outro.sketch)
+
+    def agregados(self):
+        return {'min': self.minimo, 'avg': self.soma / self.quantidade,
+                'max': self.maximo, 'p95': self.sketch.quantil(0.95)}
+
+
+def escolher_resolucao(duracao_s, largura_px, resolucoes=RESOLUCOES):
+    """
+    Resolução mais grossa com pelo menos um balde por pixel em `duracao_s`.
+
+    Retorna None quando nem a mais fina preenche a largura (use os dados brutos).
+    """
+    for nome, segundos in sorted(resolucoes.items(), key=lambda item: -item[1]):
+        if duracao_s / segundos >= largura_px:
+            return nome
+    return None
+
+
+class Rollups:
+    """
+    Ingestão de amostras com agregação incremental em várias resoluções.
+
+    As amostras brutas também são gravadas no armazém (série '<metrica>').
+    """
+
+    def __init__(self, armazem, resolucoes=None, capacidades=None, precisao=0.01):
+        self.armazem = armazem if isinstance(armazem, ArmazemSeries) else ArmazemSeries(armazem)
+        self.resolucoes = dict(sorted((resolucoes or RESOLUCOES).items(), key=lambda item: item[1]))
+        self.capacidades = {**CAPACIDADES, **(capacidades or {})}
+        self.precisao = precisao
+        self._abertos = {}  # (metrica, dispositivo) -> [Balde por resolução, na ordem de self.resolucoes]
+
+    @staticmethod
+    def nome_serie(metrica, resolucao, agregado):
+        return f'{metrica}.{resolucao}.{agregado}'
+
+    def anexar(self, metrica, dispositivo, momento, valor):
+        self.anexar_lote(metrica, dispositivo, [momento], [valor])
+
+    def anexar_lote(self, metrica, dispositivo, momentos, valores):
+        """Grava as amostras brutas e atualiza os baldes (timestamps crescentes)."""
+        t = np.asarray(momentos)
+        t = (t * 1e9).astype('<M8[ns]') if t.dtype.kind in 'iuf' else t.astype('<M8[ns]')
+        v = np.asarray(valores, dtype=np.float64)
+        self.armazem.anexar_lote(metrica, dispositivo, t, v)
+
+        # Agrupa por balde da resolução mais fina (vetorizado)
+        segundos = t.astype(np.int64) // 1_000_000_000
+        menor = next(iter(self.resolucoes.values()))
+        inicios = segundos // menor * menor
+        cortes = np.flatnonzero(np.diff(inicios)) + 1
+        for grupo_t, grupo_v in zip(np.split(inicios, cortes), np.split(v, cortes)):
+            if len(grupo_v):
+                self._adicionar(metrica, dispositivo, int(grupo_t[0]), grupo_v)
+
+    def _adicionar(self, metrica, dispositivo, inicio, valores):
+        abertos = self._abertos.setdefault((metrica, dispositivo), [None] * len(self.resolucoes))
+        balde = abertos[0]
+        if balde is not None and balde.inicio != inicio:
+            self._fechar_nivel(metrica, dispositivo, 0)
+            balde = None
+        if balde is None:
+            balde = abertos[0] = Balde(inicio, self.precisao)
+        balde.adicionar(valores)
+
+    def _fechar_nivel(self, metrica, dispositivo, nivel):
+        """Grava o balde aberto do nível e o mescla no nível seguinte."""
+        abertos = self._abertos[(metrica, dispositivo)]
+        balde = abertos[nivel]
+        if balde is None:
+            return
+        abertos[nivel] = None
+        resolucao = list(self.resolucoes)[nivel]
+        momento = np.datetime64(balde.inicio, 's')
+        for agregado, valor in balde.agregados().items():
+            self.armazem.buffer(self.nome_serie(metrica, resolucao, agregado), dispositivo,
+                                self.capacidades.get(resolucao)).anexar(momento, valor)
+
+        if nivel + 1 < len(abertos):
+            tamanho = list(self.resolucoes.values())[nivel + 1]
+            inicio = balde.inicio // tamanho * tamanho
+            superior = abertos[nivel + 1]
+            if superior is not None and superior.inicio != inicio:
+                self._fechar_nivel(metrica, dispositivo, nivel + 1)
+                superior = None
+            if superior is None:
+                superior = abertos[nivel + 1] = Balde(inicio, self.precisao)
+            superior.mesclar(balde)
+
+    def fechar(self, ate=None):
+        """
+        Fecha os baldes que terminam até `ate` (epoch em segundos ou datetime64);
+        sem argumento, fecha todos (ex.: antes de encerrar o processo).
+        """
+        limite = math.inf if ate is None else int(np.datetime64(ate, 's').astype(np.int64)
+                                                   if not isinstance(ate, (int, float)) else ate)
+        tamanhos = list(self.resolucoes.values())
+        for (metrica, dispositivo), abertos in self._abertos.items():
+            for nivel, tamanho in enumerate(tamanhos):
+                balde = abertos[nivel]
+                if balde is not None and balde.inicio + tamanho <= limite:
+                    self._fechar_nivel(metrica, dispositivo, nivel)
+
+    def consultar(self, metrica, dispositivo, inicio, fim, largura_px, agregado='avg'):
+        """
+        Série (t, v, resolucao) para o intervalo [inicio, fim) e a largura em pixels.
+
+        Usa a resolução mais grossa que ainda preenche a largura; se nenhuma
+        preencher, devolve as amostras brutas (resolucao=None).
+        """
+        if agregado not in AGREGADOS:
+            raise ValueError(f"Agregado inválido: {agregado!r} (use {', '.join(AGREGADOS)})")
+        inicio, fim = np.datetime64(inicio, 'ns'), np.datetime64(fim, 'ns')
+        duracao = (fim - inicio) / np.timedelta64(1, 's')
+        resolucao = escolher_resolucao(duracao, largura_px, self.resolucoes)
+        if resolucao is None:
+            t, v = self.armazem.intervalo(metrica, dispositivo, inicio, fim)
+        else:
+            t, v = self.armazem.buffer(self.nome_serie(metrica, resolucao, agregado), dispositivo,
+                                       self.capacidades.get(resolucao)).intervalo(inicio, fim)
+        return t, v, resolucao
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Exportação de Gráficos para docs/
+
+Centraliza a escrita dos arquivos HTML gerados pelos scripts.
+
+Por padrão a biblioteca plotly.js é gravada uma única vez em docs/, em um
+arquivo versionado e identificado pelo hash do conteúdo
+(ex.: plotly-2.27.0.3f2a9c1b4d5e.min.js), e cada página apenas referencia
+esse arquivo. Assim o navegador baixa e guarda em cache a biblioteca uma
+só vez, em vez de receber ~3.5 MB embutidos em cada HTML.
+
+Para gerar páginas autossuficientes (com a biblioteca embutida), defina a
+variável de ambiente DASHBOARDS_PLOTLYJS=embutido.
+
+O HTML passa pelo cache de renderização (comum.cache): se a figura não mudou
+desde a última exportação, o HTML anterior é reaproveitado e o arquivo em
+docs/ não é reescrito. Defina DASHBOARDS_CACHE=0 para desativar.
+
+Arrays numéricos grandes dos traces vão em base64 (comum.binario), com um
+decodificador embutido na página; DASHBOARDS_BINARIO=0 volta ao JSON puro.
+
+Com DASHBOARDS_DELTA=1 a figura completa e o delta em relação à versão
+anterior também são publicados, e a página passa a se atualizar sozinha
+aplicando só o delta (comum.delta).
+
+`post_script` (JavaScript executado depois do Plotly.newPlot, com {plot_id}
+trocado pelo id da div) entra no HTML e na chave do cache; é assim que as
+páginas com drill-down (comum.status_interfaces) registram o clique.
+
+Com DASHBOARDS_FRAGMENTOS=1 a página vira uma casca que embute só o primeiro
+painel e baixa os demais (NOME.paineis/*.json) quando entram na tela
+(comum.fragmentos).
+
+Com DASHBOARDS_INSTRUMENTAR=1 as etapas da exportação (e as marcadas pelos
+scripts) são medidas e gravadas ao lado do HTML (comum.instrumentacao).
+"""
+
+import hashlib
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+
+from comum.binario import binario_habilitado, codificar_figura, injetar_decodificador
+from comum.cache import CacheRenderizacao, hash_figura
+from comum.delta import delta_habilitado, injetar_atualizador, publicar
+from comum.figura import validacao_habilitada, validar
+from comum.fragmentos import fragmentos_habilitados, pasta_paineis, salvar_fragmentos, varios_paineis
+from comum.instrumentacao import etapa, salvar_rastro
+from comum.json_rapido import motor_json, usando_motor
+
+# Pasta publicada pelo GitHub Pages
+DIR_DOCS = Path(__file__).resolve().parents[2] / 'docs'
+
+MODO_COMPARTILHADO = 'compartilhado'
+MODO_EMBUTIDO = 'embutido'
+MODOS = (MODO_COMPARTILHADO, MODO_EMBUTIDO)
+
+
+def modo_plotlyjs():
+    """Retorna o modo de inclusão do plotly.js definido no ambiente."""
+    modo = os.environ.get('DASHBOARDS_PLOTLYJS', MODO_COMPARTILHADO).strip().lower()
+    if modo not in MODOS:
+        raise ValueError(f"DASHBOARDS_PLOTLYJS inválido: {modo!r} (use {' ou '.join(MODOS)})")
+    return modo
+
+
+def cache_habilitado():
+    """Indica se o cache de renderização está ativo (DASHBOARDS_CACHE)."""
+    return os.environ.get('DASHBOARDS_CACHE', '1').strip() != '0'
+
+
+def gravar_se_mudou(caminho, conteudo):
+    """Grava `conteudo` (bytes) apenas se diferente do arquivo atual."""
+    caminho = Path(caminho)
+    try:
+        if caminho.read_bytes() == conteudo:
+            return False
+    except FileNotFoundError:
+        pass
+    caminho.write_bytes(conteudo)
+    return True
+
+
+@lru_cache(maxsize=None)
+def _plotlyjs():
+    """(nome versionado, conteúdo) do plotly.js; lido e hasheado uma vez por processo."""
+    from plotly.offline import get_plotlyjs, get_plotlyjs_version
+
+    conteudo = get_plotlyjs().encode('utf-8')
+    digest = hashlib.sha256(conteudo).hexdigest()[:12]
+    return f'plotly-{get_plotlyjs_version()}.{digest}.min.js', conteudo
+
+
+def garantir_plotlyjs(destino=DIR_DOCS):
+    """
+    Grava o plotly.js versionado em `destino` (se ainda não existir).
+
+    Retorna o nome do arquivo, para ser usado como referência relativa
+    nas páginas HTML geradas na mesma pasta.
+    """
+    nome, conteudo = _plotlyjs()
+
+    destino = Path(destino)
+    destino.mkdir(parents=True, exist_ok=True)
+    caminho = destino / nome
+    if not caminho.exists():
+        # Grava em arquivo temporário e renomeia: builds paralelos nunca
+        # enxergam um asset pela metade
+        temporario = caminho.with_name(f'.{nome}.{os.getpid()}.tmp')
+        temporario.write_bytes(conteudo)
+        os.replace(temporario, caminho)
+    return nome
+
+
+def renderizar_html(fig, include_plotlyjs, binario=None, post_script=None):
+    """
+    HTML completo da figura (bytes), com os arrays grandes em base64 se `binario`.
+
+    A serialização usa o motor escolhido em comum.json_rapido (o orjson do
+    próprio plotly quando disponível). Figuras em
+    dicionário (comum.figura) só são validadas com DASHBOARDS_VALIDAR=1.
+    """
+    import plotly.io as pio
+
+    binario = binario_habilitado() if binario is None else binario
+    if isinstance(fig, dict) and validacao_habilitada():
+        with etapa('validar'):
+            validar(fig)
+    with usando_motor():
+        if not binario:
+            figura = dict(fig) if isinstance(fig, dict) else fig
+            with etapa('to_html'):
+                return pio.to_html(figura, include_plotlyjs=include_plotlyjs, validate=False,
+                                   post_script=post_script).encode('utf-8')
+        with etapa('codificar_binario'):
+            figura = codificar_figura(fig)
+        with etapa('to_html'):
+            html = pio.to_html(figura, include_plotlyjs=include_plotlyjs, validate=False,
+                               post_script=post_script)
+    return injetar_decodificador(html).encode('utf-8')
+
+
+def salvar_html(fig, nome, destino=DIR_DOCS, modo=None, usar_cache=None, binario=None, delta=None,
+                post_script=None, fragmentos=None):
+    """
+    Salva a figura em `destino/nome` e retorna o caminho do arquivo.
+
+    No modo compartilhado a página referencia o asset criado por
+    garantir_plotlyjs(); no modo embutido a biblioteca vai dentro do HTML.
+    Com `delta`, publica também NOME.figura.json e NOME.delta.json e não usa
+    o cache (o rodapé da página precisa ser o da versão publicada).
+    `post_script` é repassado ao HTML (ver renderizar_html()). Com
+    `fragmentos`, figuras de vários painéis e sem `post_script` viram a casca
+    e os painéis de comum.fragmentos, sem cache nem delta.
+    """
+    modo = modo or modo_plotlyjs()
+    usar_cache = cache_habilitado() if usar_cache is None else usar_cache
+    binario = binario_habilitado() if binario is None else binario
+    delta = delta_habilitado() if delta is None else delta
+    fragmentos = fragmentos_habilitados() if fragmentos is None else fragmentos
+    destino = Path(destino)
+    destino.mkdir(parents=True, exist_ok=True)
+
+    caminho = destino / nome
+    with etapa('salvar_html'):
+        if modo == MODO_COMPARTILHADO:
+            with etapa('plotlyjs'):
+                include_plotlyjs = garantir_plotlyjs(destino)
+        else:
+            include_plotlyjs = True
+
+        if fragmentos and post_script is None and varios_paineis(fig):
+            if isinstance(fig, dict) and validacao_habilitada():
+                with etapa('validar'):
+                    validar(fig)
+            with etapa('fragmentos'):
+                salvar_fragmentos(fig, caminho, include_plotlyjs, binario)
+            salvar_rastro(caminho)
+            return caminho
+        # HTML único: os painéis de uma gravação anterior em fragmentos ficariam órfãos
+        shutil.rmtree(pasta_paineis(caminho), ignore_errors=True)
+
+        if not usar_cache or delta:
+            with etapa('renderizar'):
+                html = renderizar_html(fig, include_plotlyjs, binario, post_script)
+        else:
+            from plotly import __version__ as versao_plotly
+
+            cache = CacheRenderizacao()
+            with etapa('hash_cache'):
+                chave = hash_figura(fig, include_plotlyjs, versao_plotly, binario, motor_json(),
+                                    post_script or '')
+                html = cache.obter(chave)
+            if html is None:
+                with etapa('renderizar'):
+                    html = renderizar_html(fig, include_plotlyjs, binario, post_script)
+                cache.guardar(chave, html)
+
+        if delta:
+            # A versão muda a cada rodapé "Atualizado em", por isso sem cache
+            with etapa('delta'):
+                versao = publicar(fig, caminho, binario)
+                html = injetar_atualizador(html.decode('utf-8'), caminho, versao).encode('utf-8')
+        with etapa('gravar'):
+            if usar_cache:
+                gravar_se_mudou(caminho, html)
+            else:
+                caminho.write_bytes(html)
+    salvar_rastro(caminho)
+    return caminho
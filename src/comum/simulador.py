@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Simulador de Métricas de Rede
+
+Gera amostras plausíveis de tráfego, status de interfaces e CPU a partir dos
+dados iniciais do dashboard MVP, com passeio aleatório (random walk). Serve
+como fonte de dados do servidor ao vivo e dos testes manuais, no lugar de
+equipamentos reais.
+
+Com `semente` fixa a sequência de amostras é sempre a mesma.
+"""
+
+import random
+from collections import deque
+from datetime import datetime
+
+
+def _limitar(valor, minimo, maximo):
+    return max(minimo, min(maximo, valor))
+
+
+class SimuladorMetricas:
+    """Fonte de métricas simuladas no formato usado por construir_figura()."""
+
+    def __init__(self, switches, interfaces_up, interfaces_down,
+                 dispositivos, cpu_percent, vlans=(), num_dispositivos=(),
+                 horas=(), trafego_mbps=(), historico=800, semente=None):
+        self.rng = random.Random(semente)
+        self.switches = list(switches)
+        self.interfaces_up = list(interfaces_up)
+        self.interfaces_down = list(interfaces_down)
+        self.dispositivos = list(dispositivos)
+        self.cpu_percent = list(cpu_percent)
+        self.vlans = list(vlans)
+        self.num_dispositivos = list(num_dispositivos)
+        self.horas = deque(horas, maxlen=historico)
+        self.trafego_mbps = deque(trafego_mbps, maxlen=historico)
+
+    @classmethod
+    def a_partir_do_modulo(cls, modulo, **opcoes):
+        """Cria o simulador com os dados de exemplo de um script (ex.: 04_dashboard_mvp)."""
+        nomes = ('switches', 'interfaces_up', 'interfaces_down', 'dispositivos',
+                 'cpu_percent', 'vlans', 'num_dispositivos', 'horas', 'trafego_mbps')
+        return cls(**{nome: getattr(modulo, nome) for nome in nomes}, **opcoes)
+
+    def amostrar(self, agora=None):
+        """Avança a simulação um passo e retorna a nova amostra."""
+        agora = agora or datetime.now()
+
+        ultimo = self.trafego_mbps[-1] if self.trafego_mbps else 150.0
+        trafego = round(_limitar(ultimo + self.rng.gauss(0, 8), 0, 1000), 1)
+        self.horas.append(agora.strftime('%H:%M:%S'))
+        self.trafego_mbps.append(trafego)
+
+        # De vez em quando uma interface cai ou volta (o total por switch é fixo)
+        if self.switches and self.rng.random() < 0.2:
+            i = self.rng.randrange(len(self.switches))
+            if self.rng.random() < 0.5 and self.interfaces_up[i] > 0:
+                self.interfaces_up[i] -= 1
+                self.interfaces_down[i] += 1
+            elif self.interfaces_down[i] > 0:
+                self.interfaces_down[i] -= 1
+                self.interfaces_up[i] += 1
+
+        self.cpu_percent = [round(_limitar(cpu + self.rng.gauss(0, 4), 0, 100), 1)
+                            for cpu in self.cpu_percent]
+
+        return {
+            'momento': agora,
+            'hora': self.horas[-1],
+            'trafego': trafego,
+            'switches': list(self.switches),
+            'interfaces_up': list(self.interfaces_up),
+            'interfaces_down': list(self.interfaces_down),
+            'cpu_percent': list(self.cpu_percent),
+        }
+
+    def estado(self):
+        """Dados atuais como argumentos nomeados de construir_figura()."""
+        return {
+            'horas': list(self.horas),
+            'trafego_mbps': list(self.trafego_mbps),
+            'switches': list(self.switches),
+            'interfaces_up': list(self.interfaces_up),
+            'interfaces_down': list(self.interfaces_down),
+            'vlans': list(self.vlans),
+            'num_dispositivos': list(self.num_dispositivos),
+            'dispositivos': list(self.dispositivos),
+            'cpu_percent': list(self.cpu_percent),
+        }
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Codificação SNMPv2c (BER) Mínima
+
+Implementa só o necessário para o poller de contadores de interface:
+mensagens SNMPv2c com GetRequest, GetNextRequest, GetBulkRequest e Response,
+e os tipos usados pelo IF-MIB (INTEGER, OCTET STRING, OID, Counter32,
+Gauge32, TimeTicks, Counter64...). Não depende de bibliotecas externas.
+
+OIDs são representados como tuplas de inteiros, ex.: (1, 3, 6, 1, 2, 1, 1, 3, 0),
+o que já dá a ordenação lexicográfica exigida pelo GETNEXT/GETBULK.
+"""
+
+from dataclasses import dataclass, field
+
+# Tipos universais
+INTEGER = 0x02
+OCTET_STRING = 0x04
+NULL = 0x05
+OBJECT_IDENTIFIER = 0x06
+SEQUENCE = 0x30
+
+# Tipos de aplicação (SNMPv2-SMI)
+IP_ADDRESS = 0x40
+COUNTER32 = 0x41
+GAUGE32 = 0x42
+TIMETICKS = 0x43
+OPAQUE = 0x44
+COUNTER64 = 0x46
+
+# Exceções de varbind (SNMPv2)
+NO_SUCH_OBJECT = 0x80
+NO_SUCH_INSTANCE = 0x81
+END_OF_MIB_VIEW = 0x82
+EXCECOES = (NO_SUCH_OBJECT, NO_SUCH_INSTANCE, END_OF_MIB_VIEW)
+
+# PDUs
+GET = 0xA0
+GET_NEXT = 0xA1
+RESPONSE = 0xA2
+GET_BULK = 0xA5
+
+VERSAO_V2C = 1
+
+_INTEIROS = (INTEGER, COUNTER32, GAUGE32, TIMETICKS, COUNTER64)
+
+
+class ErroSNMP(Exception):
+    """Mensagem SNMP malformada ou resposta com erro."""
+
+
+def oid(texto):
+    """Converte '1.3.6.1.2.1.1.3.0' em tupla de inteiros."""
+    return tuple(int(parte) for parte in texto.strip('.').split('.'))
+
+
+def oid_texto(valor):
+    return '.'.join(str(parte) for parte in valor)
+
+
+# OIDs do SNMPv2-MIB e do IF-MIB usados pelo poller e pelo agente falso
+SYS_UPTIME = oid('1.3.6.1.2.1.1.3.0')
+IF_DESCR = oid('1.3.6.1.2.1.2.2.1.2')
+IF_HC_IN_OCTETS = oid('1.3.6.1.2.1.31.1.1.1.6')
+IF_HC_OUT_OCTETS = oid('1.3.6.1.2.1.31.1.1.1.10')
+
+
+@dataclass
+class PDU:
+    """PDU SNMP. Em GetBulk, erro/indice_erro são non-repeaters/max-repetitions."""
+    tipo: int
+    request_id: int
+    varbinds: list = field(default_factory=list)  # [(oid, tag, valor), ...]
+    erro: int = 0
+    indice_erro: int = 0
+
+
+# --- BER: codificação ---
+
+def _tamanho(n):
+    if n < 0x80:
+        return bytes([n])
+    corpo = n.to_bytes((n.bit_length() + 7) // 8, 'big')
+    return bytes([0x80 | len(corpo)]) + corpo
+
+
+def _tlv(tag, conteudo):
+    return bytes([tag]) + _tamanho(len(conteudo)) + conteudo
+
+
+def _inteiro(valor, com_sinal=True):
+    if com_sinal:
+        tamanho = max(1, (valor + (valor < 0)).bit_length() // 8 + 1)
+        return valor.to_bytes(tamanho, 'big', signed=True)
+    # Sem sinal (contadores): byte 0x00 na frente se o bit mais alto estiver ligado
+    return valor.to_bytes(valor.bit_length() // 8 + 1, 'big')
+
+
+def _oid(valor):
+    if len(valor) < 2:
+        raise ErroSNMP(f'OID curto demais: {valor}')
+    partes = [40 * valor[0] + valor[1], *valor[2:]]
+    corpo = bytearray()
+    for parte in partes:
+        grupo = [parte & 0x7F]
+        parte >>= 7
+        while parte:
+            grupo.append(0x80 | (parte & 0x7F))
+            parte >>= 7
+        corpo.extend(reversed(grupo))
+    return bytes(corpo)
+
+
+def codificar_valor(tag, valor):
+    if tag == INTEGER:
+        return _tlv(tag, _inteiro(valor))
+    if tag in _INTEIROS:
+        return _tlv(tag, _inteiro(valor, com_sinal=False))
+    if tag in (OCTET_STRING, OPAQUE):
+        return _tlv(tag, valor.encode('utf-8') if isinstance(valor, str) else bytes(valor))
+    if tag == IP_ADDRESS:
+        return _tlv(tag, bytes(int(parte) for parte in valor.split('.')))
+    if tag == OBJECT_IDENTIFIER:
+        return _tlv(tag, _oid(valor))
+    if tag in (NULL, *EXCECOES):
+        return _tlv(tag, b'')
+    raise ErroSNMP(f'Tipo SNMP não suportado: 0x{tag:02x}')
+
+
+def codificar(comunidade, pdu):
+    """Mensagem SNMPv2c completa (bytes) para envio por UDP."""
+    varbinds = b''.join(
+        _tlv(SEQUENCE, codificar_valor(OBJECT_IDENTIFIER, o) + codificar_valor(tag, valor))
+        for o, tag, valor in pdu.varbinds)
+    corpo_pdu = (codificar_valor(INTEGER, pdu.request_id)
+                 + codificar_valor(INTEGER, pdu.erro)
+                 + codificar_valor(INTEGER, pdu.indice_erro)
+                 + _tlv(SEQUENCE, varbinds))
+    return _tlv(SEQUENCE, codificar_valor(INTEGER, VERSAO_V2C)
+                + codificar_valor(OCTET_STRING, comunidade)
+                + _tlv(pdu.tipo, corpo_pdu))
+
+
+# --- BER: decodificação ---
+
+def _ler_tlv(dados, pos):
+    if pos + 2 > len(dados):
+        raise ErroSNMP('Mensagem truncada')
+    tag = dados[pos]
+    tamanho = dados[pos + 1]
+    pos += 2
+    if tamanho & 0x80:
+        n = tamanho & 0x7F
+        tamanho = int.from_bytes(dados[pos:pos + n], 'big')
+        pos += n
+    fim = pos + tamanho
+    if fim > len(dados):
+        raise ErroSNMP('Mensagem truncada')
+    return tag, dados[pos:fim], fim
+
+
+def _ler_oid(conteudo):
+    partes = []
+    atual = 0
+    for byte in conteudo:
+        atual = (atual << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            partes.append(atual)
+            atual = 0
+    if not partes:
+        raise ErroSNMP('OID vazio')
+    primeiro = partes[0]
+    inicio = (min(primeiro // 40, 2), primeiro - 40 * min(primeiro // 40, 2))
+    return inicio + tuple(partes[1:])
+
+
+def decodificar_valor(tag, conteudo):
+    if tag == INTEGER:
+        return int.from_bytes(conteudo, 'big', signed=True)
+    if tag in _INTEIROS:
+        return int.from_bytes(conteudo, 'big')
+    if tag in (OCTET_STRING, OPAQUE):
+        return bytes(conteudo)
+    if tag == IP_ADDRESS:
+        return '.'.join(str(byte) for byte in conteudo)
+    if tag == OBJECT_IDENTIFIER:
+        return _ler_oid(conteudo)
+    if tag in (NULL, *EXCECOES):
+        return None
+    raise ErroSNMP(f'Tipo SNMP não suportado: 0x{tag:02x}')
+
+
+def _ler_sequencia(conteudo):
+    itens, pos = [], 0
+    while pos < len(conteudo):
+        tag, valor, pos = _ler_tlv(conteudo, pos)
+        itens.append((tag, valor))
+    return itens
+
+
+def decodificar(dados):
+    """Retorna (versao, comunidade, PDU) de uma mensagem SNMP recebida."""
+    dados = memoryview(dados).tobytes()
+    tag, mensagem, _ = _ler_tlv(dados, 0)
+    if tag != SEQUENCE:
+        raise ErroSNMP('Mensagem SNMP deve ser uma SEQUENCE')
+    try:
+        (_, versao), (_, comunidade), (tipo, corpo) = _ler_sequencia(mensagem)
+        (_, request_id), (_, erro), (_, indice), (_, lista) = _ler_sequencia(corpo)
+    except ValueError:
+        raise ErroSNMP('Estrutura SNMP inesperada') from None
+
+    varbinds = []
+    for _, varbind in _ler_sequencia(lista):
+        (tag_oid, bruto_oid), (tag_valor, bruto_valor) = _ler_sequencia(varbind)
+        varbinds.append((_ler_oid(bruto_oid), tag_valor, decodificar_valor(tag_valor, bruto_valor)))
+
+    pdu = PDU(tipo, decodificar_valor(INTEGER, request_id), varbinds,
+              decodificar_valor(INTEGER, erro), decodificar_valor(INTEGER, indice))
+    return decodificar_valor(INTEGER, versao), bytes(comunidade).decode('utf-8', 'replace'), pdu
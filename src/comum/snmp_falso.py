@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Agente SNMP Falso (simulador local)
+
+Agente SNMPv2c em UDP (asyncio) que responde GET, GETNEXT e GETBULK a partir
+de registros gravados, no formato .snmprec do snmpsim:
+
+    1.3.6.1.2.1.2.2.1.2.1|4|GigabitEthernet1/0/1
+    1.3.6.1.2.1.31.1.1.1.6.1|70|123456789
+
+O sysUpTime.0 é calculado em tempo real e os contadores podem ser avançados
+com avancar(), simulando tráfego entre dois ciclos de coleta.
+
+Exemplo:
+    async with AgenteSNMPFalso(registros_interfaces(48)) as agente:
+        alvo = AgenteSNMP('SW-CORE-01', '127.0.0.1', agente.porta)
+"""
+
+import asyncio
+import bisect
+import time
+
+from comum import snmp
+from comum.snmp import IF_DESCR, IF_HC_IN_OCTETS, IF_HC_OUT_OCTETS, SYS_UPTIME
+
+
+def ler_snmprec(texto):
+    """Lê registros no formato OID|TAG|VALOR (tag decimal; sufixo 'x' = valor em hex)."""
+    registros = []
+    for linha in texto.splitlines():
+        linha = linha.strip()
+        if not linha or linha.startswith('#'):
+            continue
+        texto_oid, texto_tag, valor = linha.split('|', 2)
+        hexadecimal = texto_tag.endswith('x')
+        tag = int(texto_tag.rstrip('x'))
+        if hexadecimal:
+            valor = bytes.fromhex(valor)
+        elif tag in (snmp.INTEGER, snmp.COUNTER32, snmp.GAUGE32, snmp.TIMETICKS, snmp.COUNTER64):
+            valor = int(valor)
+        elif tag == snmp.OBJECT_IDENTIFIER:
+            valor = snmp.oid(valor)
+        registros.append((snmp.oid(texto_oid), tag, valor))
+    return registros
+
+
+def registros_interfaces(n_interfaces, octetos_iniciais=0):
+    """Registros IF-MIB de um switch com `n_interfaces` interfaces."""
+    registros = []
+    for indice in range(1, n_interfaces + 1):
+        registros.append((IF_DESCR + (indice,), snmp.OCTET_STRING, f'GigabitEthernet1/0/{indice}'))
+        registros.append((IF_HC_IN_OCTETS + (indice,), snmp.COUNTER64, octetos_iniciais))
+        registros.append((IF_HC_OUT_OCTETS + (indice,), snmp.COUNTER64, octetos_iniciais))
+    return registros
+
+
+class _ProtocoloAgente(asyncio.DatagramProtocol):
+    def __init__(self, agente):
+        self.agente = agente
+        self.transporte = None
+
+    def connection_made(self, transporte):
+        self.transporte = transporte
+
+    def datagram_received(self, dados, endereco):
+        resposta = self.agente.responder(dados)
+        if resposta is not None:
+            self.transporte.sendto(resposta, endereco)
+
+
+class AgenteSNMPFalso:
+    """Agente SNMPv2c local servindo os registros recebidos."""
+
+    def __init__(self, registros, comunidade='public', host='127.0.0.1', porta=0):
+        self.comunidade = comunidade
+        self.host = host
+        self.porta = porta
+        self._valores = {o: (tag, valor) for o, tag, valor in registros}
+        self._valores.setdefault(SYS_UPTIME, (snmp.TIMETICKS, 0))
+        self._oids = sorted(self._valores)
+        self._inicio = time.monotonic()
+        self._transporte = None
+        self.requisicoes = 0
+
+    async def __aenter__(self):
+        return await self.iniciar()
+
+    async def __aexit__(self, *excecao):
+        self.parar()
+
+    async def iniciar(self):
+        loop = asyncio.get_running_loop()
+        self._transporte, _ = await loop.create_datagram_endpoint(
+            lambda: _ProtocoloAgente(self), local_addr=(self.host, self.porta))
+        self.porta = self._transporte.get_extra_info('sockname')[1]
+        return self
+
+    def parar(self):
+        if self._transporte:
+            self._transporte.close()
+
+    def avancar(self, oid, incremento):
+        """Soma `incremento` a um contador (com a volta de 32/64 bits)."""
+        tag, valor = self._valores[oid]
+        bits = 64 if tag == snmp.COUNTER64 else 32
+        self._valores[oid] = (tag, (valor + incremento) % (1 << bits))
+
+    # --- Respostas ---
+
+    def _obter(self, o):
+        if o == SYS_UPTIME:
+            return snmp.TIMETICKS, int((time.monotonic() - self._inicio) * 100)
+        return self._valores.get(o, (snmp.NO_SUCH_INSTANCE, None))
+
+    def _proximo(self, o):
+        posicao = bisect.bisect_right(self._oids, o)
+        if posicao >= len(self._oids):
+            return o, snmp.END_OF_MIB_VIEW, None
+        seguinte = self._oids[posicao]
+        return (seguinte, *self._obter(seguinte))
+
+    def responder(self, dados):
+        try:
+            _, comunidade, pdu = snmp.decodificar(dados)
+        except snmp.ErroSNMP:
+            return None
+        if comunidade != self.comunidade:
+            return None  # como um agente real: comunidade errada não tem resposta
+        self.requisicoes += 1
+
+        if pdu.tipo == snmp.GET:
+            varbinds = [(o, *self._obter(o)) for o, _, _ in pdu.varbinds]
+        elif pdu.tipo == snmp.GET_NEXT:
+            varbinds = [self._proximo(o) for o, _, _ in pdu.varbinds]
+        elif pdu.tipo == snmp.GET_BULK:
+            non_repeaters, max_repeticoes = pdu.erro, pdu.indice_erro
+            fixos, repetidos = pdu.varbinds[:non_repeaters], pdu.varbinds[non_repeaters:]
+            varbinds = [self._proximo(o) for o, _, _ in fixos]
+            atuais = [o for o, _, _ in repetidos]
+            for _ in range(max_repeticoes):
+                linha = [self._proximo(o) for o in atuais]
+                varbinds.extend(linha)
+                if all(tag == snmp.END_OF_MIB_VIEW for _, tag, _ in linha):
+                    break
+                atuais = [o for o, _, _ in linha]
+        else:
+            return None
+
+        return snmp.codificar(self.comunidade, snmp.PDU(snmp.RESPONSE, pdu.request_id, varbinds))
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor SSH Falso para Testes de Coleta
+
+Simula um equipamento de rede acessível por SSH (paramiko) em 127.0.0.1,
+respondendo a comandos `exec` com saídas pré-definidas no formato Cisco IOS.
+Permite testar o coletor sem nenhum equipamento real, inclusive com atraso
+nas respostas (timeouts) e conexões recusadas (retentativas).
+
+Exemplo:
+    respostas = respostas_cisco(interfaces_up=22, interfaces_down=2, cpu=45)
+    with ServidorSSHFalso(respostas) as servidor:
+        dispositivo = Dispositivo('SW-CORE-01', '127.0.0.1', servidor.porta,
+                                  usuario='admin', senha='admin')
+"""
+
+import socket
+import threading
+import time
+
+# Intervalo (s) em que o laço de aceitação confere se deve parar
+INTERVALO_ACEITAR_S = 0.2
+
+_CHAVE_HOST = None
+_TRAVA_CHAVE = threading.Lock()
+
+
+def _chave_host():
+    """Chave RSA do servidor (gerada uma vez por processo, é lenta de criar)."""
+    global _CHAVE_HOST
+    import paramiko
+
+    with _TRAVA_CHAVE:
+        if _CHAVE_HOST is None:
+            _CHAVE_HOST = paramiko.RSAKey.generate(2048)
+    return _CHAVE_HOST
+
+
+def respostas_cisco(interfaces_up, interfaces_down, cpu):
+    """Saídas de `show ip interface brief` e `show processes cpu` no estilo IOS."""
+    linhas = ['Interface              IP-Address      OK? Method Status                Protocol']
+    for i in range(interfaces_up):
+        linhas.append(f'GigabitEthernet1/0/{i + 1:<6} unassigned      YES unset  up                    up')
+    for i in range(interfaces_down):
+        linhas.append(f'GigabitEthernet2/0/{i + 1:<6} unassigned      YES unset  down                  down')
+    return {
+        'show ip interface brief': '\n'.join(linhas) + '\n',
+        'show processes cpu | include CPU utilization':
+            f'CPU utilization for five seconds: {cpu}%/0%; one minute: {cpu}%; five minutes: {cpu}%\n',
+    }
+
+
+class ServidorSSHFalso:
+    """
+    Servidor SSH local que responde comandos com saídas fixas.
+
+    - respostas: dicionário {comando: saída}
+    - atraso: segundos de espera antes de cada resposta
+    - falhas: quantidade de conexões iniciais derrubadas sem handshake
+    """
+
+    def __init__(self, respostas, usuario='admin', senha='admin',
+                 atraso=0.0, falhas=0, host='127.0.0.1', porta=0):
+        self.respostas = dict(respostas)
+        self.usuario = usuario
+        self.senha = senha
+        self.atraso = atraso
+        self.falhas = falhas
+        self.conexoes = 0  # handshakes SSH completos
+        self.comandos = 0
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, porta))
+        self.host, self.porta = self._socket.getsockname()
+        self._transportes = []
+        self._trava = threading.Lock()
+        self._rodando = False
+        self._thread = None
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *excecao):
+        self.parar()
+
+    def iniciar(self):
+        _chave_host()
+        self._socket.listen(128)
+        # accept() bloqueado não acorda com close() de outra thread: timeout curto
+        self._socket.settimeout(INTERVALO_ACEITAR_S)
+        self._rodando = True
+        self._thread = threading.Thread(target=self._aceitar, daemon=True)
+        self._thread.start()
+        return self
+
+    def parar(self):
+        """Encerra o laço de aceitação, fecha a porta e as sessões abertas."""
+        self._rodando = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self._socket.close()
+        except OSError:
+            pass
+        with self._trava:
+            for transporte in self._transportes:
+                transporte.close()
+            self._transportes.clear()
+
+    def _aceitar(self):
+        while self._rodando:
+            try:
+                conexao, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            with self._trava:
+                recusar = self.falhas > 0
+                if recusar:
+                    self.falhas -= 1
+            if recusar:
+                conexao.close()
+                continue
+            threading.Thread(target=self._sessao, args=(conexao,), daemon=True).start()
+
+    def _sessao(self, conexao):
+        import paramiko
+
+        transporte = paramiko.Transport(conexao)
+        transporte.add_server_key(_chave_host())
+        with self._trava:
+            self._transportes.append(transporte)
+        try:
+            transporte.start_server(server=_criar_interface(self))
+        except (paramiko.SSHException, EOFError, OSError):
+            transporte.close()
+            return
+        with self._trava:
+            self.conexoes += 1
+
+    def _executar(self, canal, comando):
+        with self._trava:
+            self.comandos += 1
+        if self.atraso:
+            time.sleep(self.atraso)
+        try:
+            if comando in self.respostas:
+                canal.sendall(self.respostas[comando].encode('utf-8'))
+                canal.send_exit_status(0)
+            else:
+                canal.sendall_stderr(f'% Invalid input detected: {comando}\n'.encode('utf-8'))
+                canal.send_exit_status(1)
+            # Só EOF: fechar o canal aqui poderia chegar ao cliente antes da
+            # confirmação do exec (enviada pela thread do transporte); quem
+            # fecha o canal é o cliente, depois de ler a saída
+            canal.shutdown_write()
+        except OSError:
+            pass
+
+
+def _criar_interface(servidor):
+    """Cria o paramiko.ServerInterface ligado ao servidor falso."""
+    import paramiko
+
+    class Interface(paramiko.ServerInterface):
+        def get_allowed_auths(self, username):
+            return 'password'
+
+        def check_auth_password(self, username, password):
+            if (username, password) == (servidor.usuario, servidor.senha):
+                return paramiko.AUTH_SUCCESSFUL
+            return paramiko.AUTH_FAILED
+
+        def check_channel_request(self, kind, chanid):
+            if kind == 'session':
+                return paramiko.OPEN_SUCCEEDED
+            return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+        def check_channel_exec_request(self, channel, command):
+            comando = command.decode('utf-8') if isinstance(command, bytes) else command
+            threading.Thread(target=servidor._executar, args=(channel, comando), daemon=True).start()
+            return True
+
+    return Interface()
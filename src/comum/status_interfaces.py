@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Status de Interfaces Agregado para Milhares de Switches
+
+Um par de barras UP/DOWN por switch funciona para cinco switches; com
+milhares, o gráfico vira um borrão e o HTML cresce com a rede. Aqui o painel
+principal mostra só agregados de tamanho fixo (ou que crescem com o número
+de sites, não de switches):
+
+- totais_por_grupo(): interfaces UP/DOWN somadas por site ou por papel
+  (CORE, DIST, ACCESS), vetorizado com pd.factorize + np.bincount
+- piores() (de comum.ranking): os N switches (ou grupos) com mais
+  interfaces DOWN, escolhidos com um heap de tamanho N
+
+O detalhe de cada grupo (os switches do site ou do papel) não vai na página:
+publicar_detalhes() grava uma figura JSON pequena por grupo em
+NOME.detalhes/, gerando uma de cada vez, e o script DRILLDOWN_JS só a baixa
+quando o grupo é clicado (customdata de cada barra = arquivo do grupo, de
+arquivos_grupos(), que desfaz colisões como 'SP 01' e 'SP-01').
+"""
+
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from comum.figura import FiguraDict
+from comum.json_rapido import dumps
+from comum.ranking import piores
+
+# Grupos (sites) no painel principal; acima disso ficam os piores
+MAX_GRUPOS = 50
+# Switches por figura de detalhe; grupos maiores mostram os piores
+LIMITE_DETALHE = 200
+
+VERDE, VERMELHO = '#00CC96', '#EF553B'
+
+# post_script do salvar_html(): {plot_id} é trocado pelo plotly
+DRILLDOWN_JS = """
+var grafico = document.getElementById('{plot_id}');
+var PASTA = %(pasta)s;
+var detalhe = document.createElement('div');
+grafico.parentNode.insertBefore(detalhe, grafico.nextSibling);
+grafico.on('plotly_click', function (evento) {
+    var arquivo = evento.points[0].customdata;
+    if (typeof arquivo !== 'string') return;
+    fetch(PASTA + '/' + encodeURIComponent(arquivo) + '.json').then(function (resposta) {
+        if (!resposta.ok) throw new Error(arquivo + ': ' + resposta.status);
+        return resposta.json();
+    }).then(function (figura) {
+        // O template não vai nos arquivos: é o mesmo da página principal
+        figura.layout.template = figura.layout.template || grafico.layout.template;
+        return Plotly.react(detalhe, figura.data, figura.layout);
+    }).then(function () {
+        detalhe.scrollIntoView({behavior: 'smooth'});
+    }).catch(function (erro) { console.warn('Detalhe indisponível:', erro); });
+});
+"""
+
+
+def arquivo_grupo(rotulo, grupo):
+    """Nome de arquivo (sem extensão) do detalhe de um grupo ('site-sp-01', 'papel-core')."""
+    return re.sub(r'[^0-9A-Za-z]+', '-', f'{rotulo}-{grupo}').strip('-').lower()
+
+
+def arquivos_grupos(rotulo, grupos):
+    """
+    {grupo: nome de arquivo} dos grupos distintos em `grupos`. Nomes que
+    colidem depois de normalizados ('SP 01' e 'SP-01') recebem o sufixo -2,
+    -3... na ordem alfabética dos grupos, a mesma na página e nos detalhes.
+    """
+    arquivos, usados = {}, set()
+    for grupo in sorted(set(np.asarray(grupos).tolist())):
+        base = arquivo = arquivo_grupo(rotulo, grupo)
+        sufixo = 1
+        while arquivo in usados:
+            sufixo += 1
+            arquivo = f'{base}-{sufixo}'
+        usados.add(arquivo)
+        arquivos[grupo] = arquivo
+    return arquivos
+
+
+def totais_por_grupo(grupos, up, down):
+    """
+    Soma UP e DOWN por grupo. Retorna (nomes em ordem alfabética, up, down,
+    quantidade de switches), arrays alinhados.
+    """
+    codigos, nomes = pd.factorize(np.asarray(grupos), sort=True)
+    n = len(nomes)
+    return (np.asarray(nomes),
+            np.bincount(codigos, weights=up, minlength=n).astype(np.int64),
+            np.bincount(codigos, weights=down, minlength=n).astype(np.int64),
+            np.bincount(codigos, minlength=n))
+
+
+def figura_detalhe(titulo, switches, up, down, limite=LIMITE_DETALHE):
+    """Barras UP/DOWN dos switches de um grupo (só os `limite` piores se passar disso)."""
+    switches, up, down = np.asarray(switches), np.asarray(up), np.asarray(down)
+    total = len(switches)
+    indices = piores(up, down, min(limite, total))
+    if total > limite:
+        titulo = f'{titulo} - {limite} piores de {total} switches'
+    nomes = switches[indices].tolist()
+
+    fig = FiguraDict()
+    fig.add_trace('bar', y=nomes, x=up[indices].tolist(), name='UP', orientation='h',
+                  marker_color=VERDE)
+    fig.add_trace('bar', y=nomes, x=down[indices].tolist(), name='DOWN', orientation='h',
+                  marker_color=VERMELHO)
+    fig.update_layout(
+        title_text=titulo,
+        barmode='stack',
+        height=max(350, 120 + 18 * len(nomes)),
+        xaxis_title='Interfaces',
+        yaxis=dict(autorange='reversed'),
+        plot_bgcolor='#F8F9FA',
+        paper_bgcolor='white',
+        font=dict(family='Arial', size=12),
+    )
+    return fig
+
+
+def pasta_detalhes(caminho_html):
+    """Pasta NOME.detalhes/ ao lado de `caminho_html`."""
+    caminho_html = Path(caminho_html)
+    return caminho_html.with_name(f'{caminho_html.stem}.detalhes')
+
+
+def publicar_detalhes(caminho_html, agrupamentos, switches, up, down):
+    """
+    Grava um NOME.detalhes/<grupo>.json por grupo de cada agrupamento
+    ({'Site': sites, 'Papel': papeis}, arrays alinhados com `switches`).
+    Só regrava arquivos que mudaram e apaga os de grupos que sumiram.
+    Retorna a quantidade de arquivos.
+    """
+    from comum.saida import gravar_se_mudou
+
+    pasta = pasta_detalhes(caminho_html)
+    pasta.mkdir(parents=True, exist_ok=True)
+    switches, up, down = np.asarray(switches), np.asarray(up), np.asarray(down)
+    gravados = set()
+    for rotulo, grupos in agrupamentos.items():
+        codigos, nomes = pd.factorize(np.asarray(grupos))
+        arquivos = arquivos_grupos(rotulo, nomes)
+        # Índices de cada grupo de uma vez (argsort estável), sem um filtro por grupo
+        ordem = np.argsort(codigos, kind='stable')
+        limites = np.searchsorted(codigos[ordem], np.arange(len(nomes) + 1))
+        for codigo, grupo in enumerate(nomes):
+            membros = ordem[limites[codigo]:limites[codigo + 1]]
+            fig = figura_detalhe(f'{rotulo} {grupo}', switches[membros], up[membros], down[membros])
+            arquivo = f'{arquivos[grupo]}.json'
+            layout = {chave: valor for chave, valor in fig.layout.items() if chave != 'template'}
+            gravar_se_mudou(pasta / arquivo, dumps({'data': fig.data, 'layout': layout}).encode('utf-8'))
+            gravados.add(arquivo)
+    for antigo in pasta.glob('*.json'):
+        if antigo.name not in gravados:
+            antigo.unlink()
+    return len(gravados)
+
+
+def script_drilldown(caminho_html):
+    """post_script que abre o detalhe do grupo clicado (ver DRILLDOWN_JS)."""
+    return DRILLDOWN_JS % {'pasta': json.dumps(pasta_detalhes(caminho_html).name)}
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Construção de Traces com Seleção Automática de WebGL
+
+go.Scatter desenha cada ponto como um elemento SVG e fica inutilizável no
+navegador a partir de algumas dezenas de milhares de pontos. go.Scattergl
+usa WebGL e continua fluido com milhões de pontos, aceitando o mesmo estilo
+(line, marker, mode, fill='tozeroy', fillcolor...).
+
+trace_linha() escolhe a classe automaticamente pelo tamanho da série
+(dict_linha() faz o mesmo para figuras em dicionário, ver comum.figura). O
+limite padrão é de 10.000 pontos e pode ser alterado pela variável de
+ambiente DASHBOARDS_LIMITE_WEBGL ou pelo argumento `limite`.
+"""
+
+import os
+
+LIMITE_WEBGL_PADRAO = 10_000
+
+
+def limite_webgl():
+    """Quantidade de pontos a partir da qual os traces usam WebGL."""
+    return int(os.environ.get('DASHBOARDS_LIMITE_WEBGL', LIMITE_WEBGL_PADRAO))
+
+
+def tipo_scatter(n_pontos, limite=None):
+    """'scattergl' se `n_pontos` passar do limite, senão 'scatter'."""
+    limite = limite_webgl() if limite is None else limite
+    return 'scattergl' if n_pontos > limite else 'scatter'
+
+
+def classe_scatter(n_pontos, limite=None):
+    """go.Scattergl se `n_pontos` passar do limite, senão go.Scatter."""
+    import plotly.graph_objects as go
+
+    return go.Scattergl if tipo_scatter(n_pontos, limite) == 'scattergl' else go.Scatter
+
+
+def trace_linha(x, y, limite=None, **propriedades):
+    """
+    Cria um trace de linha/marcadores com a classe adequada ao tamanho.
+
+    Aceita as mesmas propriedades de go.Scatter. Em WebGL, line.shape='spline'
+    (não suportado pelo Scattergl) vira 'linear'.
+    """
+    classe = classe_scatter(len(y), limite)
+    if classe.__name__ == 'Scattergl':
+        propriedades = _compativel_webgl(propriedades)
+    return classe(x=x, y=y, **propriedades)
+
+
+def dict_linha(x, y, limite=None, **propriedades):
+    """Como trace_linha(), mas devolve o trace em dicionário (sem validação)."""
+    from comum.figura import expandir
+
+    tipo = tipo_scatter(len(y), limite)
+    if tipo == 'scattergl':
+        propriedades = _compativel_webgl(propriedades)
+    return {'type': tipo, 'x': x, 'y': y, **expandir(propriedades)}
+
+
+def _compativel_webgl(propriedades):
+    propriedades = dict(propriedades)
+    linha = propriedades.get('line')
+    if isinstance(linha, dict) and linha.get('shape') == 'spline':
+        linha = {chave: valor for chave, valor in linha.items() if chave != 'smoothing'}
+        linha['shape'] = 'linear'
+        propriedades['line'] = linha
+    if propriedades.get('line_shape') == 'spline':
+        propriedades['line_shape'] = 'linear'
+    propriedades.pop('line_smoothing', None)
+    return propriedades
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Exportação de Imagens dos Dashboards
+
+Gera PNG/SVG/PDF de todos os gráficos (ou dos selecionados) em docs/, ao
+lado dos HTML, com um pool de renderizadores do kaleido reaproveitados.
+
+Uso:
+    python src/exportar_imagens.py [-f png svg pdf] [-j N] [scripts...]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from comum.imagens import main  # noqa: E402
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dashboards MVP por Site
+
+Gera um dashboard MVP por site em docs/sites/ a partir de um único
+esqueleto (comum.esqueleto): subplots, eixos, cores e anotações são montados
+e serializados uma vez; cada site só prepara e serializa os próprios
+dados, em paralelo (só o número do site atravessa o pool). Por enquanto os
+dados de cada site vêm de um gerador sintético reprodutível (mesmo site,
+mesmos valores).
+
+Uso:
+    python src/gerar_sites.py [--sites 300] [-j N] [--destino docs/sites]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from comum.build import carregar_modulo  # noqa: E402
+from comum.esqueleto import gerar_sites  # noqa: E402
+from comum.saida import DIR_DOCS  # noqa: E402
+
+SCRIPT_MVP = Path(__file__).resolve().parent / 'basico' / '04_dashboard_mvp.py'
+
+
+@lru_cache(maxsize=None)
+def _mvp():
+    return carregar_modulo(SCRIPT_MVP)
+
+
+def dados_site(indice, vlans, pontos=1_440):
+    """Dados sintéticos do site `indice` (uma amostra de tráfego por minuto)."""
+    rng = np.random.default_rng(indice)
+    n_switches = int(rng.integers(4, 25))
+    switches = [f'SW-{indice:03d}-{i:02d}' for i in range(n_switches)]
+    portas = rng.choice([24, 48], n_switches)
+    interfaces_down = rng.binomial(portas, 0.08)
+    dispositivos = [f'RTR-{indice:03d}-01', f'FW-{indice:03d}-01'] + switches[:3]
+    inicio = datetime.now().replace(second=0, microsecond=0)
+    return {
+        'horas': np.datetime64(inicio) - np.arange(pontos)[::-1] * np.timedelta64(1, 'm'),
+        'trafego_mbps': (150 + 60 * np.sin(np.linspace(0, 2 * np.pi, pontos))
+                         + rng.normal(0, 10, pontos)).clip(0).round(1),
+        'switches': switches,
+        'interfaces_up': (portas - interfaces_down).tolist(),
+        'interfaces_down': interfaces_down.tolist(),
+        'vlans': vlans,
+        'num_dispositivos': rng.integers(5, 200, len(vlans)).tolist(),
+        'dispositivos': dispositivos,
+        'cpu_percent': rng.integers(5, 95, len(dispositivos)).tolist(),
+    }
+
+
+def valores_site(indice):
+    """Valores dos campos do esqueleto para o site `indice` (roda nos workers)."""
+    mvp = _mvp()
+    return mvp.valores_site(f'Site {indice:03d}', **dados_site(indice, mvp.vlans))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gera um dashboard MVP por site.')
+    parser.add_argument('--sites', type=int, default=300)
+    parser.add_argument('-j', '--processos', type=int, default=None,
+                        help='número de processos (padrão: todos os núcleos; 1 = sem pool)')
+    parser.add_argument('--destino', type=Path, default=DIR_DOCS / 'sites')
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    sites = ((f'site-{i:03d}', i) for i in range(1, args.sites + 1))
+    arquivos = gerar_sites(_mvp().esqueleto_site, sites, args.destino, args.processos,
+                           preparar=valores_site)
+    print(f"✅ {len(arquivos)} dashboards em {args.destino} ({time.perf_counter() - inicio:.1f}s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())